@@ -0,0 +1,136 @@
+"""
+On-disk memoization for evaluation lookups.
+
+This module stores the results of Nominatim and Gemini boundary lookups in a
+small SQLite database so repeated evaluation runs over the same sample files
+skip the network entirely on a warm cache.
+"""
+
+import time
+import pickle
+import sqlite3
+import hashlib
+import threading
+from functools import lru_cache, wraps
+from typing import Any, Callable, Optional, Tuple
+
+try:
+    from xxhash import xxh3_64_hexdigest as _hexdigest
+except ImportError:
+    def _hexdigest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+DEFAULT_TTL_DAYS = 30
+
+# Bumped whenever the key format changes; old entries simply miss and age out
+KEY_VERSION = "v2"
+
+class GeoCache:
+    """
+    SQLite-backed memoization cache for boundary lookups.
+    
+    Entries are keyed by a 64-bit hash of (mode, name, entity type) and expire
+    after the configured time-to-live so stale boundaries are eventually
+    refreshed.
+    
+    Args:
+        db_path: Path to the SQLite database file.
+        ttl_days: Time-to-live in days for cached entries.
+    """
+    
+    def __init__(self, db_path: str, ttl_days: int = DEFAULT_TTL_DAYS):
+        """Initialize the cache and create the table if needed."""
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.lock = threading.Lock()
+        
+        # Lookups run on a thread pool, so share one connection behind a lock
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        
+        # A 64 MB page cache keeps a warm evaluation run's working set in memory
+        self.conn.execute('PRAGMA cache_size=-65536')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS geocache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                ts INTEGER NOT NULL
+            )
+        ''')
+        self.conn.commit()
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def make_key(mode: str, name: str, entity_type: str) -> str:
+        """Build the cache key for a lookup; keys are plain strings, so no serialization is needed."""
+        return _hexdigest(f"{KEY_VERSION}|{mode}|{name}|{entity_type}".encode("utf-8"))
+    
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: The cache key.
+        
+        Returns:
+            Tuple of (hit, value). Expired entries are reported as misses.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT value, ts FROM geocache WHERE key = ?', (key,)
+            ).fetchone()
+        
+        if not row or time.time() - row[1] > self.ttl_seconds:
+            return False, None
+        
+        return True, pickle.loads(row[0])
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache.
+        
+        Args:
+            key: The cache key.
+            value: The value to store.
+        """
+        with self.lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO geocache (key, value, ts) VALUES (?, ?, ?)',
+                (key, pickle.dumps(value), int(time.time()))
+            )
+            self.conn.commit()
+    
+    def cached(self, namespace: str) -> Callable[[Callable], Callable]:
+        """
+        Decorator memoizing a `func(name, location_type)` lookup.
+        
+        Only non-empty results are stored so failed lookups are retried.
+        
+        Args:
+            namespace: Namespace for the keys, e.g. the search mode.
+        
+        Returns:
+            Decorator that wraps the lookup function.
+        """
+        # Bind the per-lookup attributes once rather than resolving them on every call
+        make_key, get, set_ = self.make_key, self.get, self.set
+        
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(name: str, location_type: Optional[str] = None) -> Any:
+                key = make_key(namespace, name, location_type or "")
+                hit, value = get(key)
+                if hit:
+                    return value
+                
+                value = func(name, location_type=location_type)
+                if value:
+                    set_(key, value)
+                return value
+            return wrapper
+        return decorator
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,41 @@
+"""
+Shared boundary metrics for the evaluation scripts.
+
+Keeping the polygon classification and rate arithmetic in one place stops the
+evaluation and dashboard scripts from drifting apart on how boundaries are
+counted.
+"""
+
+from typing import Any, Dict, Optional
+
+# GeoJSON geometry types that count as polygon boundaries
+POLY_SET = frozenset({"Polygon", "MultiPolygon"})
+
+def is_polygon(result: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check whether a boundary result has a polygon geometry.
+    
+    Args:
+        result: A boundary result, as returned by a Nominatim search.
+    
+    Returns:
+        True if the result carries a Polygon or MultiPolygon GeoJSON geometry.
+    """
+    if not result:
+        return False
+    geojson = result.get("geojson")
+    return bool(geojson) and geojson.get("type") in POLY_SET
+
+def pct(part: float, total: float) -> float:
+    """
+    Compute `part` as a percentage of `total`.
+    
+    Args:
+        part: The numerator, e.g. the number of matched locations.
+        total: The denominator, e.g. the total number of locations.
+    
+    Returns:
+        The percentage, or 0.0 when `total` is zero so empty inputs don't
+        crash the report after all lookups have finished.
+    """
+    return 100.0 * part / total if total else 0.0
@@ -11,36 +11,98 @@ It generates statistics on match rates, boundary quality, and performance.
 
 import os
 import sys
+import mmap
 import time
 import json
+import logging
 import argparse
+import logging.handlers
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple
 
 # Add the src directory to the path so we can import place2polygon
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-import place2polygon
-from place2polygon.core.location_extractor import LocationExtractor
-from place2polygon.core.nominatim_client import NominatimClient
-from place2polygon.gemini.orchestrator import GeminiOrchestrator, default_orchestrator
-from place2polygon.core.boundary_selector import select_best_boundary
-from place2polygon.utils import default_output_manager
+# place2polygon is imported inside the functions that use it: `--help` loads
+# neither the NLP model nor the Gemini SDK, and Normal-only runs skip the SDK
+from _geocache import GeoCache
+from _metrics import is_polygon, pct
 
-def process_file(file_path: str, use_gemini: bool = False) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-    """Process a file and return the extracted locations with their boundaries."""
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# Per-location progress is buffered and written in batches instead of one
+# write per line, so a slow terminal or CI log capture doesn't stall lookups
+PROGRESS_BUFFER_SIZE = 100
+
+progress = logging.getLogger("place2polygon.evaluate")
+progress.setLevel(logging.INFO)
+progress.propagate = False
+_progress_stream = logging.StreamHandler(sys.stdout)
+_progress_stream.setFormatter(logging.Formatter("%(message)s"))
+_progress_buffer = logging.handlers.MemoryHandler(PROGRESS_BUFFER_SIZE, flushLevel=logging.ERROR, target=_progress_stream)
+progress.addHandler(_progress_buffer)
+
+# Inputs larger than this are read through mmap
+MMAP_THRESHOLD = 1 << 20
+
+def read_text(file_path: str) -> str:
+    """Read and decode a text file in one pass, using mmap for large files."""
+    path = Path(file_path)
+    if path.stat().st_size <= MMAP_THRESHOLD:
+        return path.read_text(encoding="utf-8")
+    
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode("utf-8")
+
+def load_gazetteer(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load a gazetteer of trusted boundaries keyed by lowercase place name.
+    
+    The gazetteer is built offline (e.g. from Natural Earth admin-0/1
+    polygons and the most populated OSM cities) and stored either as a
+    pickle or as a JSON object mapping names to Nominatim-style results.
+    
+    Args:
+        path: Path to a `.pkl` or `.json` gazetteer file.
+        
+    Returns:
+        Dictionary mapping canonical names to boundary results.
+    """
+    if path.endswith((".pkl", ".pickle")):
+        import pickle
+        
+        with open(path, "rb") as f:
+            gazetteer = pickle.load(f)
+    else:
+        gazetteer = json.loads(read_text(path))
+    
+    return {name.strip().lower(): result for name, result in gazetteer.items()}
+
+def process_file(file_path: str, locations: List[Dict[str, Any]], use_gemini: bool = False,
+                 workers: int = 8, cache: Optional[GeoCache] = None,
+                 gazetteer: Optional[Dict[str, Dict[str, Any]]] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Find boundaries for already extracted locations and return them with statistics."""
     print(f"\nProcessing {file_path} with {'Gemini' if use_gemini else 'Normal'} mode...")
     
     # Start timing
     start_time = time.time()
     
-    # Extract locations
-    with open(file_path, 'r', encoding='utf-8') as f:
-        text = f.read()
+    from place2polygon.core.nominatim_client import NominatimClient
+    from place2polygon.core.boundary_selector import select_best_boundary
     
-    extractor = LocationExtractor()
-    locations = extractor.extract_locations(text)
+    # Only load the Gemini SDK when Gemini mode is requested
+    default_orchestrator = None
+    if use_gemini:
+        from place2polygon.gemini.orchestrator import default_orchestrator
     
     # Find boundaries
     if use_gemini and default_orchestrator:
@@ -50,61 +112,109 @@ def process_file(file_path: str, use_gemini: bool = False) -> Tuple[List[Dict[st
         client = NominatimClient()
         print(f"Using Normal mode for {len(locations)} locations")
     
-    locations_with_boundaries = []
+    # Resolve the mode once rather than on every lookup
+    gemini_mode = bool(use_gemini and default_orchestrator and hasattr(client, "orchestrate_search"))
     
-    for location in locations:
-        name = location["name"]
-        entity_type = location.get("type", "").lower()
-        print(f"  Finding boundary for {name} ({entity_type})")
+    if gemini_mode:
+        gazetteer = gazetteer or {}
         
+        def search(name: str, location_type: Optional[str] = None) -> Any:
+            # Well-known places come straight from the gazetteer, skipping the LLM round trips
+            result = gazetteer.get(name.strip().lower())
+            if result is not None:
+                return result
+            return client.orchestrate_search(name, location_type=location_type)
+    else:
+        # Fetch every uncached search up front over the client's pooled connections
+        pending = sorted({
+            loc["name"] for loc in locations
+            if cache is None or not cache.get(GeoCache.make_key("normal", loc["name"], loc.get("type", "").lower()))[0]
+        })
+        batch = dict(zip(pending, client.iter_search([{"query": name} for name in pending], max_workers=workers)))
+        
+        def search(name: str, location_type: Optional[str] = None) -> Any:
+            results = batch.get(name)
+            if results is None:
+                results = client.search(name, location_type=location_type)
+            if not results:
+                return None
+            # Pick the best polygon among the returned candidates, falling back
+            # to the top hit when none of them carries a polygon
+            return select_best_boundary(results, name, location_type) or results[0]
+    
+    # Serve repeated lookups from the on-disk cache
+    if cache is not None:
+        search = cache.cached("gemini" if gemini_mode else "normal")(search)
+    
+    def _lookup(location: Dict[str, Any]) -> Tuple[Dict[str, Any], str, Any, Optional[Exception]]:
+        """Look up the boundary for a single location."""
+        entity_type = location.get("type", "").lower()
         try:
-            result = None
-            
-            # Use different search methods based on mode
-            if use_gemini and default_orchestrator and hasattr(client, "orchestrate_search"):
-                result = client.orchestrate_search(name, location_type=entity_type)
-            else:
-                results = client.search(name, location_type=entity_type)
-                # Get the first result if there are any
-                result = results[0] if results else None
+            return location, entity_type, search(location["name"], location_type=entity_type), None
+        except Exception as e:
+            return location, entity_type, None, e
+    
+    # Lookups are network-bound, so run them concurrently on a shared client
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [executor.submit(_lookup, location) for location in locations]
+        
+        for future in as_completed(futures):
+            location, entity_type, result, error = future.result()
+            progress.info("  Finding boundary for %s (%s)", location["name"], entity_type)
             
-            if result:
+            if error is not None:
+                progress.info("    ✗ Error: %s", error)
+                location["boundary"] = None
+            elif result:
                 # Store the result with the location
                 location["boundary"] = result
-                locations_with_boundaries.append(location)
                 
                 # Determine boundary quality
-                quality = "polygon" if "geojson" in result and result["geojson"]["type"] in ["Polygon", "MultiPolygon"] else "point"
-                print(f"    ✓ Found {quality} boundary")
+                quality = "polygon" if is_polygon(result) else "point"
+                progress.info("    ✓ Found %s boundary", quality)
             else:
-                print(f"    ✗ No boundary found")
+                progress.info("    ✗ No boundary found")
                 location["boundary"] = None
-                locations_with_boundaries.append(location)
-        except Exception as e:
-            print(f"    ✗ Error: {str(e)}")
-            location["boundary"] = None
-            locations_with_boundaries.append(location)
+    
+    _progress_buffer.flush()
+    
+    # Keep the original extraction order regardless of completion order
+    locations_with_boundaries = list(locations)
     
     # Calculate statistics
     end_time = time.time()
     
+    # Partition once so the counts below are plain lengths
+    matched = [loc for loc in locations_with_boundaries if loc.get("boundary")]
+    polygons = [loc for loc in matched if is_polygon(loc["boundary"])]
+    
     stats = {
         "file": file_path,
         "mode": "Gemini" if use_gemini else "Normal",
         "total_locations": len(locations),
-        "matched_locations": sum(1 for loc in locations_with_boundaries if loc.get("boundary")),
-        "polygon_boundaries": sum(1 for loc in locations_with_boundaries
-                              if loc.get("boundary") and "geojson" in loc["boundary"] 
-                              and loc["boundary"]["geojson"]["type"] in ["Polygon", "MultiPolygon"]),
-        "point_boundaries": sum(1 for loc in locations_with_boundaries
-                             if loc.get("boundary") and ("geojson" not in loc["boundary"] 
-                             or loc["boundary"]["geojson"]["type"] not in ["Polygon", "MultiPolygon"])),
-        "no_boundaries": sum(1 for loc in locations_with_boundaries if not loc.get("boundary")),
+        "matched_locations": len(matched),
+        "polygon_boundaries": len(polygons),
+        "point_boundaries": len(matched) - len(polygons),
+        "no_boundaries": len(locations_with_boundaries) - len(matched),
         "processing_time": end_time - start_time,
     }
     
     return locations_with_boundaries, stats
 
+def _build_report(stats_normal: Dict[str, Any], stats_gemini: Dict[str, Any],
+                  comparison: Dict[str, float]) -> Dict[str, Any]:
+    """Assemble the JSON report written by generate_report."""
+    from datetime import datetime
+    
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "file": stats_normal["file"],
+        "total_locations": stats_normal["total_locations"],
+        "normal": stats_normal,
+        "gemini": stats_gemini,
+        "comparison": comparison,
+    }
+
 def generate_report(stats_normal: Dict[str, Any], stats_gemini: Dict[str, Any], output_file: str = None):
     """Generate a report comparing normal and Gemini mode performance."""
     # Combine stats for report
@@ -113,8 +223,8 @@ def generate_report(stats_normal: Dict[str, Any], stats_gemini: Dict[str, Any],
         print(f"{'=' * 60}")
         print(f"File: {stats_normal['file']}")
         print(f"Total locations: {stats_normal['total_locations']}")
-        print(f"Match rate: {stats_normal['matched_locations']/stats_normal['total_locations']*100:.1f}%")
-        print(f"Polygon boundaries: {stats_normal['polygon_boundaries']} ({stats_normal['polygon_boundaries']/stats_normal['total_locations']*100:.1f}%)")
+        print(f"Match rate: {pct(stats_normal['matched_locations'], stats_normal['total_locations']):.1f}%")
+        print(f"Polygon boundaries: {stats_normal['polygon_boundaries']} ({pct(stats_normal['polygon_boundaries'], stats_normal['total_locations']):.1f}%)")
         print(f"Point boundaries: {stats_normal['point_boundaries']}")
         print(f"No boundaries: {stats_normal['no_boundaries']}")
         print(f"Processing time: {stats_normal['processing_time']:.2f} seconds")
@@ -130,14 +240,14 @@ def generate_report(stats_normal: Dict[str, Any], stats_gemini: Dict[str, Any],
     print(f"{'-' * 60}")
     
     # Match rate
-    normal_match_rate = stats_normal['matched_locations'] / stats_normal['total_locations'] * 100
-    gemini_match_rate = stats_gemini['matched_locations'] / stats_gemini['total_locations'] * 100
+    normal_match_rate = pct(stats_normal['matched_locations'], stats_normal['total_locations'])
+    gemini_match_rate = pct(stats_gemini['matched_locations'], stats_gemini['total_locations'])
     match_diff = gemini_match_rate - normal_match_rate
     print(f"{'Match rate':<20} {normal_match_rate:.1f}% {gemini_match_rate:.1f}% {match_diff:+.1f}%")
     
     # Polygon rate
-    normal_polygon_rate = stats_normal['polygon_boundaries'] / stats_normal['total_locations'] * 100
-    gemini_polygon_rate = stats_gemini['polygon_boundaries'] / stats_gemini['total_locations'] * 100
+    normal_polygon_rate = pct(stats_normal['polygon_boundaries'], stats_normal['total_locations'])
+    gemini_polygon_rate = pct(stats_gemini['polygon_boundaries'], stats_gemini['total_locations'])
     polygon_diff = gemini_polygon_rate - normal_polygon_rate
     print(f"{'Polygon rate':<20} {normal_polygon_rate:.1f}% {gemini_polygon_rate:.1f}% {polygon_diff:+.1f}%")
     
@@ -148,7 +258,7 @@ def generate_report(stats_normal: Dict[str, Any], stats_gemini: Dict[str, Any],
     
     # Time comparison
     time_diff = stats_gemini['processing_time'] - stats_normal['processing_time']
-    time_diff_percent = (time_diff / stats_normal['processing_time']) * 100
+    time_diff_percent = pct(time_diff, stats_normal['processing_time'])
     print(f"{'Processing time':<20} {stats_normal['processing_time']:.2f}s {stats_gemini['processing_time']:.2f}s {time_diff:+.2f}s ({time_diff_percent:+.1f}%)")
     
     # Summary judgment
@@ -170,22 +280,15 @@ def generate_report(stats_normal: Dict[str, Any], stats_gemini: Dict[str, Any],
     
     # Export report if requested
     if output_file:
-        report = {
-            "timestamp": datetime.now().isoformat(),
-            "file": stats_normal['file'],
-            "total_locations": stats_normal['total_locations'],
-            "normal": stats_normal,
-            "gemini": stats_gemini,
-            "comparison": {
-                "match_rate_diff": match_diff,
-                "polygon_rate_diff": polygon_diff,
-                "time_diff": time_diff,
-                "time_diff_percent": time_diff_percent
-            }
-        }
+        report = _build_report(stats_normal, stats_gemini, {
+            "match_rate_diff": match_diff,
+            "polygon_rate_diff": polygon_diff,
+            "time_diff": time_diff,
+            "time_diff_percent": time_diff_percent
+        })
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(_dumps(report))
         print(f"\nReport saved to {output_file}")
 
 def main():
@@ -193,21 +296,48 @@ def main():
     parser.add_argument("file", help="Path to the text file to process")
     parser.add_argument("--output", "-o", help="Path to save the report JSON")
     parser.add_argument("--normal-only", action="store_true", help="Run only normal mode (no Gemini)")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Number of concurrent boundary lookups")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the on-disk lookup cache")
+    parser.add_argument("--cache-path", help="Path to the lookup cache database")
+    parser.add_argument("--gazetteer", help="Path to a gazetteer (.pkl or .json) consulted before Gemini")
     args = parser.parse_args()
     
+    from place2polygon.utils import default_output_manager
+    
     # Check for Gemini API key
     has_gemini = bool(os.environ.get("GOOGLE_API_KEY"))
     if not has_gemini and not args.normal_only:
         print("No GOOGLE_API_KEY found in environment. Gemini mode will be skipped.")
         print("Set GOOGLE_API_KEY to enable Gemini comparison.")
     
-    # Process with normal mode
-    _, stats_normal = process_file(args.file, use_gemini=False)
+    # Set up the lookup cache shared by both modes
+    cache = None
+    if not args.no_cache:
+        cache_path = args.cache_path or str(default_output_manager.get_cache_dir() / "evaluation_cache.db")
+        cache = GeoCache(cache_path)
+    
+    gazetteer = load_gazetteer(args.gazetteer) if args.gazetteer else None
+    
+    # Extraction is mode-independent, so load the model and run it only once
+    from place2polygon.core.location_extractor import LocationExtractor
+    
+    text = read_text(args.file)
+    
+    extractor = LocationExtractor()
+    locations = extractor.extract_locations(text)
+    
+    # Each pass sets "boundary" on its locations, so give each its own copies
+    _, stats_normal = process_file(args.file, [dict(loc) for loc in locations], use_gemini=False,
+                                   workers=args.workers, cache=cache)
     
     # Process with Gemini if available
     stats_gemini = None
     if has_gemini and not args.normal_only:
-        _, stats_gemini = process_file(args.file, use_gemini=True)
+        _, stats_gemini = process_file(args.file, [dict(loc) for loc in locations], use_gemini=True,
+                                       workers=args.workers, cache=cache, gazetteer=gazetteer)
+    
+    if cache is not None:
+        cache.close()
     
     # Generate report path if not specified
     if not args.output:
@@ -8,7 +8,10 @@ visualizing the results of normal vs Gemini search modes with charts and tables.
 
 import os
 import sys
+import html
 import json
+import string
+import shutil
 import argparse
 from pathlib import Path
 from datetime import datetime
@@ -18,124 +21,72 @@ from typing import Dict, List, Any
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from place2polygon.utils import default_output_manager
+from _metrics import pct
 
-def generate_html_header(file_name: str, timestamp: str) -> str:
-    """Generate the HTML header section."""
-    try:
-        date_obj = datetime.fromisoformat(timestamp)
-        formatted_date = date_obj.strftime("%Y-%m-%d %H:%M:%S")
-    except:
-        formatted_date = timestamp
-        
-    return f"""<!DOCTYPE html>
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# Dashboard styles ship as a static asset next to this script
+STYLESHEET_PATH = Path(__file__).resolve().parent / "static" / "dashboard.css"
+
+# Static page header; only the file name, date and stylesheet vary between dashboards
+_HEADER_TEMPLATE = string.Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Place2Polygon Performance Dashboard</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-            color: #333;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            border-radius: 8px;
-            padding: 20px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        header {{
-            margin-bottom: 30px;
-            border-bottom: 1px solid #eee;
-            padding-bottom: 15px;
-        }}
-        h1 {{
-            color: #2c3e50;
-            margin: 0;
-            font-size: 28px;
-        }}
-        .metadata {{
-            color: #7f8c8d;
-            font-size: 14px;
-            margin-top: 8px;
-        }}
-        .charts-container {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .chart-box {{
-            flex: 1;
-            min-width: 300px;
-            background-color: white;
-            border-radius: 8px;
-            padding: 15px;
-            box-shadow: 0 1px 5px rgba(0,0,0,0.05);
-        }}
-        .chart-title {{
-            font-size: 16px;
-            font-weight: 600;
-            margin-bottom: 10px;
-            color: #34495e;
-        }}
-        .stats-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-        }}
-        .stats-table th, .stats-table td {{
-            padding: 12px 15px;
-            border-bottom: 1px solid #eee;
-            text-align: left;
-        }}
-        .stats-table th {{
-            background-color: #f8f9fa;
-            font-weight: 600;
-            color: #2c3e50;
-        }}
-        .stats-table tr:last-child td {{
-            border-bottom: none;
-        }}
-        .positive {{
-            color: #27ae60;
-        }}
-        .negative {{
-            color: #e74c3c;
-        }}
-        .summary {{
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            padding: 20px;
-            margin-top: 30px;
-        }}
-        .summary h3 {{
-            margin-top: 0;
-            color: #2c3e50;
-        }}
-        .summary ul {{
-            padding-left: 20px;
-        }}
-        .summary li {{
-            margin-bottom: 8px;
-        }}
-    </style>
+    $stylesheet
 </head>
 <body>
     <div class="container">
         <header>
             <h1>Place2Polygon Performance Dashboard</h1>
             <div class="metadata">
-                File: <strong>{file_name}</strong> | Generated: <strong>{formatted_date}</strong>
+                File: <strong>$file_name</strong> | Generated: <strong>$date</strong>
             </div>
         </header>
-"""
+""")
+
+def generate_stylesheet(output_file: str, inline_css: bool = False) -> str:
+    """
+    Generate the stylesheet reference for a dashboard.
+    
+    By default the stylesheet is copied next to the dashboard and linked, so
+    browsers cache it across dashboards. With `inline_css` it is embedded in a
+    `<style>` block instead, for dashboards that are shared as a single file.
+    
+    Args:
+        output_file: Path the dashboard will be written to.
+        inline_css: Whether to embed the stylesheet in the page.
+    
+    Returns:
+        The `<link>` or `<style>` element.
+    """
+    if inline_css:
+        return f"<style>\n{STYLESHEET_PATH.read_text(encoding='utf-8')}    </style>"
+    
+    target = Path(output_file).resolve().parent / STYLESHEET_PATH.name
+    if not target.exists() or target.stat().st_mtime < STYLESHEET_PATH.stat().st_mtime:
+        shutil.copyfile(STYLESHEET_PATH, target)
+    return f'<link rel="stylesheet" href="{STYLESHEET_PATH.name}">'
+
+def generate_html_header(file_name: str, timestamp: str, stylesheet: str) -> str:
+    """Generate the HTML header section."""
+    try:
+        date_obj = datetime.fromisoformat(timestamp)
+        formatted_date = date_obj.strftime("%Y-%m-%d %H:%M:%S")
+    except (TypeError, ValueError):
+        formatted_date = timestamp
+    
+    return _HEADER_TEMPLATE.substitute(
+        file_name=html.escape(file_name),
+        date=html.escape(str(formatted_date)),
+        stylesheet=stylesheet
+    )
 
 def generate_chart_containers() -> str:
     """Generate the chart container HTML."""
@@ -157,30 +108,64 @@ def generate_chart_containers() -> str:
         </div>
 """
 
-def generate_stats_table(normal: Dict[str, Any], gemini: Dict[str, Any], comparison: Dict[str, Any]) -> str:
-    """Generate the statistics table HTML."""
-    # Calculate metrics
-    normal_match_rate = f"{normal['matched_locations']/normal['total_locations']*100:.1f}%"
-    gemini_match_rate = f"{gemini['matched_locations']/gemini['total_locations']*100:.1f}%"
-    match_rate_diff_class = "positive" if comparison['match_rate_diff'] > 0 else "negative"
-    match_rate_diff = f"{comparison['match_rate_diff']:+.1f}%"
-    
-    normal_polygon_rate = f"{normal['polygon_boundaries']/normal['total_locations']*100:.1f}%"
-    gemini_polygon_rate = f"{gemini['polygon_boundaries']/gemini['total_locations']*100:.1f}%"
-    polygon_rate_diff_class = "positive" if comparison['polygon_rate_diff'] > 0 else "negative"
-    polygon_rate_diff = f"{comparison['polygon_rate_diff']:+.1f}%"
+def _stats_row(label: str, normal_value: str, gemini_value: str, diff: float, diff_text: str,
+               higher_is_better: bool) -> str:
+    """Render one row of the statistics table."""
+    improved = diff > 0 if higher_is_better else diff < 0
+    return f"""
+                <tr>
+                    <td>{label}</td>
+                    <td>{normal_value}</td>
+                    <td>{gemini_value}</td>
+                    <td class="{'positive' if improved else 'negative'}">{diff_text}</td>
+                </tr>"""
+
+def prepare_metrics(performance_data: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Compute the derived rates shared by the stats table and the summary.
     
-    polygon_diff_class = "positive" if gemini['polygon_boundaries'] > normal['polygon_boundaries'] else "negative"
-    polygon_diff = f"{gemini['polygon_boundaries'] - normal['polygon_boundaries']:+d}"
+    Args:
+        performance_data: The performance report produced by evaluate_performance.py.
     
-    point_diff_class = "positive" if gemini['point_boundaries'] < normal['point_boundaries'] else "negative"
-    point_diff = f"{gemini['point_boundaries'] - normal['point_boundaries']:+d}"
+    Returns:
+        Dictionary of match/polygon rates per mode and the comparison deltas.
+    """
+    normal = performance_data["normal"]
+    gemini = performance_data["gemini"]
+    comparison = performance_data["comparison"]
     
-    no_boundary_diff_class = "positive" if gemini['no_boundaries'] < normal['no_boundaries'] else "negative"
-    no_boundary_diff = f"{gemini['no_boundaries'] - normal['no_boundaries']:+d}"
+    return {
+        "normal_match_rate": pct(normal['matched_locations'], normal['total_locations']),
+        "gemini_match_rate": pct(gemini['matched_locations'], gemini['total_locations']),
+        "normal_polygon_rate": pct(normal['polygon_boundaries'], normal['total_locations']),
+        "gemini_polygon_rate": pct(gemini['polygon_boundaries'], gemini['total_locations']),
+        "match_rate_diff": comparison['match_rate_diff'],
+        "polygon_rate_diff": comparison['polygon_rate_diff'],
+        "time_diff": comparison['time_diff'],
+        "time_diff_percent": comparison['time_diff_percent'],
+    }
+
+def generate_stats_table(normal: Dict[str, Any], gemini: Dict[str, Any], metrics: Dict[str, float]) -> str:
+    """Generate the statistics table HTML."""
+    polygon_diff = gemini['polygon_boundaries'] - normal['polygon_boundaries']
+    point_diff = gemini['point_boundaries'] - normal['point_boundaries']
+    no_boundary_diff = gemini['no_boundaries'] - normal['no_boundaries']
     
-    time_diff_class = "positive" if comparison['time_diff'] < 0 else "negative"
-    time_diff = f"{comparison['time_diff']:+.2f}s ({comparison['time_diff_percent']:+.1f}%)"
+    # (label, normal, gemini, difference, formatted difference, higher is better)
+    rows = [
+        ("Match Rate", f"{metrics['normal_match_rate']:.1f}%", f"{metrics['gemini_match_rate']:.1f}%",
+         metrics['match_rate_diff'], f"{metrics['match_rate_diff']:+.1f}%", True),
+        ("Polygon Rate", f"{metrics['normal_polygon_rate']:.1f}%", f"{metrics['gemini_polygon_rate']:.1f}%",
+         metrics['polygon_rate_diff'], f"{metrics['polygon_rate_diff']:+.1f}%", True),
+        ("Polygon Boundaries", normal['polygon_boundaries'], gemini['polygon_boundaries'],
+         polygon_diff, f"{polygon_diff:+d}", True),
+        ("Point Boundaries", normal['point_boundaries'], gemini['point_boundaries'],
+         point_diff, f"{point_diff:+d}", False),
+        ("No Boundaries", normal['no_boundaries'], gemini['no_boundaries'],
+         no_boundary_diff, f"{no_boundary_diff:+d}", False),
+        ("Processing Time", f"{normal['processing_time']:.2f}s", f"{gemini['processing_time']:.2f}s",
+         metrics['time_diff'], f"{metrics['time_diff']:+.2f}s ({metrics['time_diff_percent']:+.1f}%)", False),
+    ]
     
     return f"""
         <h2>Performance Statistics</h2>
@@ -193,72 +178,33 @@ def generate_stats_table(normal: Dict[str, Any], gemini: Dict[str, Any], compari
                     <th>Difference</th>
                 </tr>
             </thead>
-            <tbody>
-                <tr>
-                    <td>Match Rate</td>
-                    <td>{normal_match_rate}</td>
-                    <td>{gemini_match_rate}</td>
-                    <td class="{match_rate_diff_class}">{match_rate_diff}</td>
-                </tr>
-                <tr>
-                    <td>Polygon Rate</td>
-                    <td>{normal_polygon_rate}</td>
-                    <td>{gemini_polygon_rate}</td>
-                    <td class="{polygon_rate_diff_class}">{polygon_rate_diff}</td>
-                </tr>
-                <tr>
-                    <td>Polygon Boundaries</td>
-                    <td>{normal['polygon_boundaries']}</td>
-                    <td>{gemini['polygon_boundaries']}</td>
-                    <td class="{polygon_diff_class}">{polygon_diff}</td>
-                </tr>
-                <tr>
-                    <td>Point Boundaries</td>
-                    <td>{normal['point_boundaries']}</td>
-                    <td>{gemini['point_boundaries']}</td>
-                    <td class="{point_diff_class}">{point_diff}</td>
-                </tr>
-                <tr>
-                    <td>No Boundaries</td>
-                    <td>{normal['no_boundaries']}</td>
-                    <td>{gemini['no_boundaries']}</td>
-                    <td class="{no_boundary_diff_class}">{no_boundary_diff}</td>
-                </tr>
-                <tr>
-                    <td>Processing Time</td>
-                    <td>{normal['processing_time']:.2f}s</td>
-                    <td>{gemini['processing_time']:.2f}s</td>
-                    <td class="{time_diff_class}">{time_diff}</td>
-                </tr>
+            <tbody>{"".join(_stats_row(*row) for row in rows)}
             </tbody>
         </table>
 """
 
-def generate_summary(performance_data: Dict[str, Any]) -> str:
+def generate_summary(performance_data: Dict[str, Any], metrics: Dict[str, float]) -> str:
     """Generate the summary section HTML."""
-    normal = performance_data["normal"]
-    gemini = performance_data["gemini"]
-    comparison = performance_data["comparison"]
     total_locations = performance_data["total_locations"]
     
     # Create summary bullet points
     match_rate_summary = ""
-    if comparison['match_rate_diff'] > 0:
-        match_rate_summary = f'<li class="positive">✓ Gemini found {abs(comparison["match_rate_diff"]):.1f}% more matches</li>'
+    if metrics['match_rate_diff'] > 0:
+        match_rate_summary = f'<li class="positive">✓ Gemini found {abs(metrics["match_rate_diff"]):.1f}% more matches</li>'
     else:
-        match_rate_summary = f'<li class="negative">✗ Gemini found {abs(comparison["match_rate_diff"]):.1f}% fewer matches</li>'
+        match_rate_summary = f'<li class="negative">✗ Gemini found {abs(metrics["match_rate_diff"]):.1f}% fewer matches</li>'
     
     polygon_rate_summary = ""
-    if comparison['polygon_rate_diff'] > 0:
-        polygon_rate_summary = f'<li class="positive">✓ Gemini found {abs(comparison["polygon_rate_diff"]):.1f}% more polygon boundaries</li>'
+    if metrics['polygon_rate_diff'] > 0:
+        polygon_rate_summary = f'<li class="positive">✓ Gemini found {abs(metrics["polygon_rate_diff"]):.1f}% more polygon boundaries</li>'
     else:
-        polygon_rate_summary = f'<li class="negative">✗ Gemini found {abs(comparison["polygon_rate_diff"]):.1f}% fewer polygon boundaries</li>'
+        polygon_rate_summary = f'<li class="negative">✗ Gemini found {abs(metrics["polygon_rate_diff"]):.1f}% fewer polygon boundaries</li>'
     
     time_summary = ""
-    if comparison['time_diff'] < 0:
-        time_summary = f'<li class="positive">✓ Gemini was {abs(comparison["time_diff"]):.2f}s faster</li>'
+    if metrics['time_diff'] < 0:
+        time_summary = f'<li class="positive">✓ Gemini was {abs(metrics["time_diff"]):.2f}s faster</li>'
     else:
-        time_summary = f'<li class="negative">✗ Gemini was {abs(comparison["time_diff"]):.2f}s slower</li>'
+        time_summary = f'<li class="negative">✗ Gemini was {abs(metrics["time_diff"]):.2f}s slower</li>'
     
     return f"""
         <div class="summary">
@@ -291,141 +237,138 @@ def generate_summary(performance_data: Dict[str, Any]) -> str:
     </div>
 """
 
-def generate_javascript(normal: Dict[str, Any], gemini: Dict[str, Any]) -> str:
-    """Generate the JavaScript for charts."""
-    # Prepare chart data
-    normal_polygon = str(normal['polygon_boundaries'])
-    gemini_polygon = str(gemini['polygon_boundaries'])
-    normal_point = str(normal['point_boundaries'])
-    gemini_point = str(gemini['point_boundaries'])
-    normal_no = str(normal['no_boundaries'])
-    gemini_no = str(gemini['no_boundaries'])
-    
-    normal_matched = str(normal['matched_locations'])
-    normal_not_matched = str(normal['total_locations'] - normal['matched_locations'])
-    gemini_matched = str(gemini['matched_locations'])
-    gemini_not_matched = str(gemini['total_locations'] - gemini['matched_locations'])
-    
-    normal_time = str(normal['processing_time'])
-    gemini_time = str(gemini['processing_time'])
-    
-    return f"""
-    <script>
+# Static chart script; reads its numbers from the p2p-data JSON island
+_CHART_SCRIPT = """    <script>
+        // Chart data is embedded as a JSON island by the generator
+        const data = JSON.parse(document.getElementById('p2p-data').textContent);
+        
         // Chart configurations
         const ctx1 = document.getElementById('boundaryTypesChart').getContext('2d');
-        const boundaryTypesChart = new Chart(ctx1, {{
+        const boundaryTypesChart = new Chart(ctx1, {
             type: 'bar',
-            data: {{
+            data: {
                 labels: ['Normal', 'Gemini'],
                 datasets: [
-                    {{
+                    {
                         label: 'Polygon Boundaries',
-                        data: [{normal_polygon}, {gemini_polygon}],
+                        data: data.polygon,
                         backgroundColor: 'rgba(54, 162, 235, 0.7)',
-                    }},
-                    {{
+                    },
+                    {
                         label: 'Point Boundaries',
-                        data: [{normal_point}, {gemini_point}],
+                        data: data.point,
                         backgroundColor: 'rgba(255, 206, 86, 0.7)',
-                    }},
-                    {{
+                    },
+                    {
                         label: 'No Boundaries',
-                        data: [{normal_no}, {gemini_no}],
+                        data: data.no_boundary,
                         backgroundColor: 'rgba(255, 99, 132, 0.7)',
-                    }}
+                    }
                 ]
-            }},
-            options: {{
+            },
+            options: {
                 responsive: true,
-                scales: {{
-                    x: {{
+                scales: {
+                    x: {
                         stacked: true,
-                    }},
-                    y: {{
+                    },
+                    y: {
                         stacked: true,
                         beginAtZero: true
-                    }}
-                }}
-            }}
-        }});
+                    }
+                }
+            }
+        });
         
         const ctx2 = document.getElementById('matchRateChart').getContext('2d');
-        const matchRateChart = new Chart(ctx2, {{
+        const matchRateChart = new Chart(ctx2, {
             type: 'doughnut',
-            data: {{
+            data: {
                 labels: ['Matched (Normal)', 'Not Matched (Normal)', 'Matched (Gemini)', 'Not Matched (Gemini)'],
-                datasets: [{{
-                    data: [
-                        {normal_matched}, 
-                        {normal_not_matched},
-                        {gemini_matched},
-                        {gemini_not_matched}
-                    ],
+                datasets: [{
+                    data: data.match,
                     backgroundColor: [
                         'rgba(54, 162, 235, 0.7)',
                         'rgba(255, 99, 132, 0.7)',
                         'rgba(75, 192, 192, 0.7)',
                         'rgba(255, 159, 64, 0.7)'
                     ]
-                }}]
-            }},
-            options: {{
+                }]
+            },
+            options: {
                 responsive: true
-            }}
-        }});
+            }
+        });
         
         const ctx3 = document.getElementById('timeChart').getContext('2d');
-        const timeChart = new Chart(ctx3, {{
+        const timeChart = new Chart(ctx3, {
             type: 'bar',
-            data: {{
+            data: {
                 labels: ['Processing Time (seconds)'],
                 datasets: [
-                    {{
+                    {
                         label: 'Normal',
-                        data: [{normal_time}],
+                        data: [data.time[0]],
                         backgroundColor: 'rgba(54, 162, 235, 0.7)',
-                    }},
-                    {{
+                    },
+                    {
                         label: 'Gemini',
-                        data: [{gemini_time}],
+                        data: [data.time[1]],
                         backgroundColor: 'rgba(75, 192, 192, 0.7)',
-                    }}
+                    }
                 ]
-            }},
-            options: {{
+            },
+            options: {
                 responsive: true,
-                scales: {{
-                    y: {{
+                scales: {
+                    y: {
                         beginAtZero: true
-                    }}
-                }}
-            }}
-        }});
+                    }
+                }
+            }
+        });
     </script>
 </body>
 </html>
 """
 
-def generate_html_report(performance_data: Dict[str, Any], output_file: str):
+def generate_javascript(normal: Dict[str, Any], gemini: Dict[str, Any]) -> str:
+    """Generate the chart data island and the JavaScript for charts."""
+    data = {
+        "polygon": [normal['polygon_boundaries'], gemini['polygon_boundaries']],
+        "point": [normal['point_boundaries'], gemini['point_boundaries']],
+        "no_boundary": [normal['no_boundaries'], gemini['no_boundaries']],
+        "match": [
+            normal['matched_locations'],
+            normal['total_locations'] - normal['matched_locations'],
+            gemini['matched_locations'],
+            gemini['total_locations'] - gemini['matched_locations']
+        ],
+        "time": [normal['processing_time'], gemini['processing_time']],
+    }
+    
+    # Escape "</" so the payload can never close the script tag early
+    payload = json.dumps(data).replace("</", "<\\/")
+    
+    return f"""
+    <script id="p2p-data" type="application/json">{payload}</script>
+{_CHART_SCRIPT}"""
+
+def generate_html_report(performance_data: Dict[str, Any], output_file: str, inline_css: bool = False):
     """Generate an HTML dashboard from performance data."""
     normal = performance_data["normal"]
     gemini = performance_data["gemini"]
-    comparison = performance_data["comparison"]
+    metrics = prepare_metrics(performance_data)
     timestamp = performance_data["timestamp"]
     file_name = os.path.basename(performance_data["file"])
     
-    # Build HTML content by concatenating the different sections
-    html_content = (
-        generate_html_header(file_name, timestamp) +
-        generate_chart_containers() +
-        generate_stats_table(normal, gemini, comparison) +
-        generate_summary(performance_data) +
-        generate_javascript(normal, gemini)
-    )
-    
-    # Write to file
+    # Write each section as it is generated rather than building one large string
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write(generate_html_header(file_name, timestamp, generate_stylesheet(output_file, inline_css)))
+        f.write(generate_chart_containers())
+        f.write(generate_stats_table(normal, gemini, metrics))
+        f.write(generate_summary(performance_data, metrics))
+        f.write(generate_javascript(normal, gemini))
     
     print(f"Dashboard generated at: {output_file}")
 
@@ -434,12 +377,14 @@ def main():
     parser.add_argument("input_file", help="Path to the performance JSON file")
     parser.add_argument("--output", "-o", help="Path to save the HTML dashboard", 
                       default=None)
+    parser.add_argument("--inline-css", action="store_true",
+                      help="Embed the stylesheet in the dashboard instead of linking it")
     args = parser.parse_args()
     
     # Load performance data
     try:
-        with open(args.input_file, 'r', encoding='utf-8') as f:
-            performance_data = json.load(f)
+        with open(args.input_file, 'rb') as f:
+            performance_data = _loads(f.read())
     except Exception as e:
         print(f"Error loading performance data: {str(e)}")
         sys.exit(1)
@@ -453,7 +398,7 @@ def main():
         ))
     
     # Generate report
-    generate_html_report(performance_data, args.output)
+    generate_html_report(performance_data, args.output, inline_css=args.inline_css)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
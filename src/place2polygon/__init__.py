@@ -6,17 +6,23 @@ This package provides functionality to extract location mentions from text,
 find their polygon boundaries, and visualize them on interactive maps.
 """
 
+from __future__ import annotations
+
+import asyncio
+import importlib
 import logging
-from typing import Dict, List, Optional, Any, Union, Tuple
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from itertools import islice, repeat
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Any, Union, Tuple, Callable, Awaitable
 
-from place2polygon.core import (
-    LocationExtractor, default_extractor,
-    NominatimClient, default_client,
-    BoundarySelector, default_selector,
-    MapVisualizer, default_visualizer
-)
-from place2polygon.cache import CacheManager, default_manager
-from place2polygon.gemini import GeminiOrchestrator, default_orchestrator
+from place2polygon.cache import CacheManager
+from place2polygon.utils.geojson import COORD_PRECISION, trim_geojson
+
+if TYPE_CHECKING:
+    from place2polygon.core import LocationExtractor, NominatimClient, BoundarySelector, MapVisualizer
+    from place2polygon.gemini import GeminiOrchestrator
 
 # Set up basic logging
 logging.basicConfig(
@@ -32,12 +38,12 @@ def extract_and_map_locations(
     text: str,
     output_path: Optional[str] = None,
     cache_ttl: Optional[int] = None,
-    extractor: LocationExtractor = default_extractor,
-    client: NominatimClient = default_client,
-    cache_manager: CacheManager = default_manager,
-    selector: BoundarySelector = default_selector,
-    visualizer: MapVisualizer = default_visualizer,
-    orchestrator: Optional[GeminiOrchestrator] = default_orchestrator,
+    extractor: Optional[LocationExtractor] = None,
+    client: Optional[NominatimClient] = None,
+    cache_manager: Optional[CacheManager] = None,
+    selector: Optional[BoundarySelector] = None,
+    visualizer: Optional[MapVisualizer] = None,
+    orchestrator: Optional[GeminiOrchestrator] = None,
     min_relevance_score: float = 30.0,
     map_title: Optional[str] = None,
     use_gemini: bool = True
@@ -49,38 +55,40 @@ def extract_and_map_locations(
         text: Text content to analyze.
         output_path: Path to save the output map. Default creates a temp file.
         cache_ttl: Cache time-to-live in days. Default uses system setting.
-        extractor: LocationExtractor instance to use.
-        client: NominatimClient instance to use.
-        cache_manager: CacheManager instance to use.
-        selector: BoundarySelector instance to use.
-        visualizer: MapVisualizer instance to use.
+        extractor: LocationExtractor instance to use. Defaults to the shared default_extractor.
+        client: NominatimClient instance to use. Defaults to the shared default_client.
+        cache_manager: CacheManager instance to use. Defaults to the shared default_manager.
+        selector: BoundarySelector instance to use. Defaults to the shared default_selector.
+        visualizer: MapVisualizer instance to use. Defaults to the shared default_visualizer.
         orchestrator: GeminiOrchestrator instance to use for intelligent searches.
+            Defaults to the shared default_orchestrator.
         min_relevance_score: Minimum relevance score for locations.
         map_title: Optional title for the map.
         use_gemini: Whether to use Gemini for orchestrating searches.
-        
+    
     Returns:
         Tuple of (extracted locations with boundaries, path to the generated map).
     """
-    logger.info("Extracting locations from text")
-    locations = extractor.extract_locations(text)
+    if extractor is None:
+        extractor = _default_extractor()
+    if visualizer is None:
+        visualizer = _default_visualizer()
+    if orchestrator is None and use_gemini:
+        orchestrator = _default_orchestrator()
     
-    # Filter by minimum relevance score
-    locations = [loc for loc in locations if loc.get('relevance_score', 0) >= min_relevance_score]
+    logger.info("Extracting locations from text")
+    locations = extractor.extract_and_enhance(text, min_relevance_score=min_relevance_score)
     
     if not locations:
         logger.warning("No relevant locations found in the text")
         return [], ""
     
-    logger.info(f"Found {len(locations)} relevant locations")
-    
-    # Enhance locations with context
-    locations = extractor.enhance_locations_with_context(locations, text)
+    logger.info("Found %d relevant locations", len(locations))
     
     # Determine which search method to use
     if use_gemini and orchestrator:
         logger.info("Using Gemini orchestration for polygon searches")
-        enriched_locations = find_polygons_with_gemini(
+        enriched = find_polygons_with_gemini(
             locations,
             orchestrator=orchestrator,
             cache_manager=cache_manager,
@@ -88,7 +96,7 @@ def extract_and_map_locations(
         )
     else:
         logger.info("Using basic polygon search method")
-        enriched_locations = find_polygon_boundaries(
+        enriched = iter_polygon_boundaries(
             locations,
             client=client,
             cache_manager=cache_manager,
@@ -96,9 +104,10 @@ def extract_and_map_locations(
             cache_ttl=cache_ttl
         )
     
-    # Create map
-    map_path = visualizer.create_map(
-        enriched_locations,
+    # Create the map, adding each location as soon as its boundary is resolved
+    enriched_locations = []
+    map_path = visualizer.create_map_from_iterator(
+        _collect(enriched, enriched_locations),
         title=map_title or "Place2Polygon Map",
         output_path=output_path
     )
@@ -107,7 +116,7 @@ def extract_and_map_locations(
 
 def extract_locations(
     text: str,
-    extractor: LocationExtractor = default_extractor,
+    extractor: Optional[LocationExtractor] = None,
     min_relevance_score: float = 30.0
 ) -> List[Dict[str, Any]]:
     """
@@ -115,28 +124,70 @@ def extract_locations(
     
     Args:
         text: Text content to analyze.
-        extractor: LocationExtractor instance to use.
+        extractor: LocationExtractor instance to use. Defaults to the shared default_extractor.
         min_relevance_score: Minimum relevance score for locations.
-        
+    
     Returns:
         List of extracted locations with metadata.
     """
-    locations = extractor.extract_locations(text)
+    if extractor is None:
+        extractor = _default_extractor()
+    
+    # Extract and add context in a single spaCy pass
+    return extractor.extract_and_enhance(text, min_relevance_score=min_relevance_score)
+
+# Maximum number of location lookups in flight at once
+DEFAULT_CONCURRENCY = 4
+
+# How long to remember which OSM object a location resolved to; boundaries
+# expire sooner, but can then be re-fetched in bulk by ID instead of searched
+OSM_REF_TTL_DAYS = 365
+
+def _run(coro: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    Falls back to a helper thread with its own event loop when called from
+    inside a running loop (e.g. a Jupyter notebook).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
     
-    # Filter by minimum relevance score
-    locations = [loc for loc in locations if loc.get('relevance_score', 0) >= min_relevance_score]
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+async def _gather_bounded(
+    find_one: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    locations: List[Dict[str, Any]],
+    concurrency: int
+) -> List[Dict[str, Any]]:
+    """
+    Run `find_one` for every location with at most `concurrency` in flight.
     
-    # Enhance with context
-    if locations:
-        locations = extractor.enhance_locations_with_context(locations, text)
+    Args:
+        find_one: Coroutine function resolving a single location.
+        locations: List of location dictionaries.
+        concurrency: Maximum number of concurrent lookups.
     
-    return locations
+    Returns:
+        Results in the same order as `locations`.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def bounded(location: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await find_one(location)
+    
+    return await asyncio.gather(*(bounded(location) for location in locations))
 
 def find_polygons_with_gemini(
     locations: List[Dict[str, Any]],
     orchestrator: GeminiOrchestrator,
-    cache_manager: CacheManager = default_manager,
-    cache_ttl: Optional[int] = None
+    cache_manager: Optional[CacheManager] = None,
+    cache_ttl: Optional[int] = None,
+    concurrency: int = DEFAULT_CONCURRENCY
 ) -> List[Dict[str, Any]]:
     """
     Find polygon boundaries for locations using Gemini to orchestrate searches.
@@ -144,212 +195,565 @@ def find_polygons_with_gemini(
     Args:
         locations: List of location dictionaries.
         orchestrator: GeminiOrchestrator instance.
-        cache_manager: CacheManager instance.
+        cache_manager: CacheManager instance. Defaults to the shared default_manager.
         cache_ttl: Cache time-to-live in days.
-        
+        concurrency: Maximum number of locations looked up concurrently.
+    
     Returns:
         List of locations with boundaries added.
     """
-    enriched_locations = []
+    if cache_manager is None:
+        cache_manager = _default_cache_manager()
     
+    # Look up each distinct (name, type) once, ignoring case and whitespace differences
+    unique: Dict[Tuple[str, Any], Dict[str, Any]] = {}
     for location in locations:
-        location_name = location.get('name', '')
-        location_type = location.get('type', None)
-        
-        # Skip if already has a boundary
-        if location.get('boundary'):
-            enriched_locations.append(location)
-            continue
-        
-        # Try to get from cache first
-        cache_key = f"boundary_{location_name}_{location_type or 'unknown'}"
-        cached_data = cache_manager.get(cache_key)
-        
-        if cached_data:
-            logger.info(f"Found cached boundary for {location_name}")
-            location['boundary'] = cached_data
-            location['boundary_source'] = 'cache'
-            enriched_locations.append(location)
-            continue
-        
-        # Not in cache, use Gemini to find
-        logger.info(f"Finding polygon boundary for {location_name} ({location_type or 'unknown type'}) using Gemini")
+        unique.setdefault(_location_key(location), location)
+    
+    # Every search gets the first few other places mentioned as context; one
+    # extra name is kept so five remain once the place itself is left out
+    nearby_names = [location.get('name') for location in islice(unique.values(), 6)]
+    
+    async def find_one(location: Dict[str, Any]) -> Dict[str, Any]:
+        nearby_locations = [name for name in nearby_names if name != location.get('name')][:5]
+        return await _find_polygon_with_gemini(location, nearby_locations, orchestrator, cache_manager, cache_ttl)
+    
+    resolved = dict(zip(unique, _run(_gather_bounded(find_one, list(unique.values()), concurrency))))
+    
+    # Merge the fields each lookup resolved into every mention of the place
+    return [{**location, **resolved[_location_key(location)]} for location in locations]
+
+async def _find_polygon_with_gemini(
+    location: Dict[str, Any],
+    nearby_locations: List[str],
+    orchestrator: GeminiOrchestrator,
+    cache_manager: CacheManager,
+    cache_ttl: Optional[int]
+) -> Dict[str, Any]:
+    """
+    Find the polygon boundary for a single location using Gemini.
+    
+    Returns:
+        Boundary data to merge into the location, or an empty dict if the
+        location already has a boundary or none was found.
+    """
+    location_name = location.get('name', '')
+    location_type = location.get('type', None)
+    
+    # Skip if already has a boundary
+    if location.get('boundary'):
+        return {}
+    
+    cache_key = cache_manager.gemini_boundary_key(location_name, location_type or 'unknown')
+    
+    # Create context for location
+    location_context = {
+        'nearby_locations': nearby_locations,
+        'relevance_score': location.get('relevance_score', 0)
+    }
+    
+    # Filled in only when this call performs the Gemini search itself
+    gemini_result: Dict[str, Any] = {}
+    
+    def search_with_gemini() -> Optional[Dict[str, Any]]:
+        logger.info("Finding polygon boundary for %s (%s) using Gemini", location_name, location_type or 'unknown type')
+        result = orchestrator.orchestrate_search(
+            location_name=location_name,
+            location_type=location_type,
+            location_context=location_context
+        )
+        if result and result.get('geojson'):
+            gemini_result.update(result)
+            return trim_geojson(result['geojson'], COORD_PRECISION)
+        return None
+    
+    try:
+        # Check the cache and otherwise use Gemini to orchestrate the search;
+        # duplicate mentions of the same place share a single search
+        boundary = await asyncio.to_thread(
+            cache_manager.get_or_compute,
+            cache_key,
+            search_with_gemini,
+            ttl=cache_ttl
+        )
         
-        try:
-            # Create context for location
-            location_context = {
-                'nearby_locations': [loc.get('name') for loc in locations if loc != location][:5],
-                'relevance_score': location.get('relevance_score', 0)
-            }
-            
-            # Use Gemini to orchestrate search
-            result = orchestrator.orchestrate_search(
-                location_name=location_name,
-                location_type=location_type,
-                location_context=location_context
-            )
-            
-            # Check if we found a valid boundary
-            if result and result.get('geojson'):
-                location['boundary'] = result.get('geojson')
-                location['boundary_source'] = 'gemini'
-                location['boundary_metadata'] = {
-                    'osm_id': result.get('osm_id'),
-                    'osm_type': result.get('osm_type'),
-                    'importance': result.get('importance'),
-                    'display_name': result.get('display_name')
+        # Check if we found a valid boundary
+        if boundary and gemini_result:
+            return {
+                'boundary': boundary,
+                'boundary_source': 'gemini',
+                'boundary_metadata': {
+                    'osm_id': gemini_result.get('osm_id'),
+                    'osm_type': gemini_result.get('osm_type'),
+                    'importance': gemini_result.get('importance'),
+                    'display_name': gemini_result.get('display_name')
                 }
-                
-                # Cache the result
-                cache_manager.set(cache_key, result.get('geojson'), ttl=cache_ttl)
-                
-            else:
-                # Fall back to basic search if Gemini fails
-                logger.warning(f"Gemini search failed for {location_name}, trying basic search")
-                basic_result = find_polygon_boundaries(
-                    [location],
-                    client=orchestrator.nominatim_client,
-                    cache_manager=cache_manager,
-                    cache_ttl=cache_ttl
-                )
-                
-                if basic_result and basic_result[0].get('boundary'):
-                    location = basic_result[0]
-                else:
-                    logger.warning(f"No boundary found for {location_name}")
+            }
         
-        except Exception as e:
-            logger.error(f"Error finding boundary with Gemini: {str(e)}")
-            # Fall back to basic search on exception
-            logger.warning(f"Falling back to basic search for {location_name}")
-            basic_result = find_polygon_boundaries(
-                [location],
-                client=orchestrator.nominatim_client,
-                cache_manager=cache_manager,
-                cache_ttl=cache_ttl
-            )
-            
-            if basic_result and basic_result[0].get('boundary'):
-                location = basic_result[0]
-            else:
-                logger.warning(f"No boundary found for {location_name}")
+        if boundary:
+            logger.info("Found cached boundary for %s", location_name)
+            return {'boundary': boundary, 'boundary_source': 'cache'}
         
-        enriched_locations.append(location)
+        # Fall back to basic search if Gemini fails
+        logger.warning("Gemini search failed for %s, trying basic search", location_name)
     
-    return enriched_locations
+    except Exception as e:
+        logger.error("Error finding boundary with Gemini: %s", e)
+        # Fall back to basic search on exception
+        logger.warning("Falling back to basic search for %s", location_name)
+    
+    basic_result = await _find_polygon_boundary(
+        location,
+        orchestrator.nominatim_client,
+        cache_manager,
+        _default_selector(),
+        cache_ttl
+    )
+    if basic_result.get('boundary'):
+        return basic_result
+    
+    logger.warning("No boundary found for %s", location_name)
+    return {}
 
 def find_polygon_boundaries(
     locations: List[Dict[str, Any]],
-    client: NominatimClient = default_client,
-    cache_manager: CacheManager = default_manager,
-    selector: BoundarySelector = default_selector,
-    cache_ttl: Optional[int] = None
+    client: Optional[NominatimClient] = None,
+    cache_manager: Optional[CacheManager] = None,
+    selector: Optional[BoundarySelector] = None,
+    cache_ttl: Optional[int] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    selection_executor: Optional[Executor] = None,
+    max_stale_days: Optional[float] = None,
+    refresh_executor: Optional[Executor] = None
 ) -> List[Dict[str, Any]]:
     """
     Find polygon boundaries for locations using basic search.
     
+    See `iter_polygon_boundaries` for a streaming variant.
+    
     Args:
         locations: List of location dictionaries.
-        client: NominatimClient instance to use.
-        cache_manager: CacheManager instance to use.
-        selector: BoundarySelector instance to use.
+        client: NominatimClient instance to use. Defaults to the shared default_client.
+        cache_manager: CacheManager instance to use. Defaults to the shared default_manager.
+        selector: BoundarySelector instance to use. Defaults to the shared default_selector.
         cache_ttl: Cache time-to-live in days. Default uses system setting.
-        
+        concurrency: Maximum number of searches in flight at once.
+        selection_executor: Optional executor used to rank search results.
+        max_stale_days: If set, boundaries that expired at most this many days
+            ago are used right away and refreshed in the background.
+        refresh_executor: Optional executor for the background refreshes. Defaults
+            to a shared pool whose queued refreshes are dropped at exit.
+    
     Returns:
         Locations with boundary data.
     """
-    enriched_locations = []
+    return list(iter_polygon_boundaries(
+        locations,
+        client=client,
+        cache_manager=cache_manager,
+        selector=selector,
+        cache_ttl=cache_ttl,
+        concurrency=concurrency,
+        selection_executor=selection_executor,
+        max_stale_days=max_stale_days,
+        refresh_executor=refresh_executor
+    ))
+
+def iter_polygon_boundaries(
+    locations: List[Dict[str, Any]],
+    client: Optional[NominatimClient] = None,
+    cache_manager: Optional[CacheManager] = None,
+    selector: Optional[BoundarySelector] = None,
+    cache_ttl: Optional[int] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    selection_executor: Optional[Executor] = None,
+    max_stale_days: Optional[float] = None,
+    refresh_executor: Optional[Executor] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Find polygon boundaries for locations, yielding each one as soon as it is resolved.
+    
+    Cached locations are resolved first; the remaining names are searched
+    concurrently and each location is yielded, in input order, once its
+    search has returned and a boundary has been selected.
+    
+    Selection runs in-process by default. For very large batches a
+    ProcessPoolExecutor can be passed as `selection_executor` to rank the
+    search results across cores; the selector and results must be picklable,
+    and all searches are collected before ranking starts.
     
+    Args:
+        locations: List of location dictionaries.
+        client: NominatimClient instance to use. Defaults to the shared default_client.
+        cache_manager: CacheManager instance to use. Defaults to the shared default_manager.
+        selector: BoundarySelector instance to use. Defaults to the shared default_selector.
+        cache_ttl: Cache time-to-live in days. Default uses system setting.
+        concurrency: Maximum number of searches in flight at once.
+        selection_executor: Optional executor used to rank search results.
+        max_stale_days: If set, boundaries that expired at most this many days
+            ago are used right away and refreshed in the background.
+        refresh_executor: Optional executor for the background refreshes. Defaults
+            to a shared pool whose queued refreshes are dropped at exit.
+    
+    Yields:
+        Locations with boundary data.
+    """
+    if client is None:
+        client = _default_client()
+    if cache_manager is None:
+        cache_manager = _default_cache_manager()
+    if selector is None:
+        selector = _default_selector()
+    
+    # Look up each distinct (name, type) once, ignoring case and whitespace
+    # differences; the first mention's spelling is used for the search
+    representatives: Dict[Tuple[str, Any], Tuple[str, Any]] = {}
     for location in locations:
-        location_name = location['name']
-        location_type = location['type']
-        
-        logger.info(f"Finding polygon boundary for {location_name} ({location_type})")
-        
-        # Try to get from cache
-        cache_key = f"boundary_{location_name}_{location_type}"
-        cached_result = cache_manager.get_cached_result(cache_key)
-        
+        representatives.setdefault(_location_key(location), (location['name'], location['type']))
+    unique_keys = list(representatives.values())
+    
+    # First pass: serve what we can from the cache and collect the misses
+    cache_keys = {key: cache_manager.boundary_key(*key) for key in unique_keys}
+    hits = cache_manager.get_many(list(cache_keys.values()))
+    boundaries = {}
+    for key in unique_keys:
+        cached_result = hits.get(cache_keys[key])
         if cached_result:
-            logger.info(f"Found cached boundary for {location_name}")
-            # Merge the cached boundary data with the location data
-            location_with_boundary = {**location, **cached_result}
-            enriched_locations.append(location_with_boundary)
+            logger.info("Found cached boundary for %s", key[0])
+            boundaries[key] = cached_result
+        elif max_stale_days is not None:
+            # Serve a recently expired boundary now and refresh it in the background
+            cached_result, is_stale = cache_manager.get_stale(cache_keys[key], max_stale_days)
+            if cached_result:
+                logger.info("Using stale cached boundary for %s", key[0])
+                boundaries[key] = cached_result
+                if is_stale:
+                    _refresh_boundary_async(key[0], key[1], client, selector,
+                                            cache_manager, cache_keys[key], cache_ttl,
+                                            refresh_executor)
+    pending = [key for key in unique_keys if key not in boundaries]
+    
+    # Locations resolved on an earlier run are re-fetched in bulk by OSM ID
+    if pending:
+        pending = _lookup_known_boundaries(
+            pending, client, selector, cache_manager, cache_keys, cache_ttl, boundaries
+        )
+    misses = list(dict.fromkeys(name for name, _ in pending))
+    
+    # Search for the uncached names concurrently, consuming the results in order
+    if misses:
+        logger.info("Searching for %d uncached locations", len(misses))
+    searches = zip(misses, client.iter_search(
+        [_search_query(name) for name in misses],
+        max_workers=concurrency
+    ))
+    batched = {}
+    
+    def pending_results() -> Iterator[List[Dict[str, Any]]]:
+        for name, _ in pending:
+            while name not in batched:
+                miss, search_results = next(searches)
+                batched[miss] = search_results
+            yield batched[name]
+    
+    # Second pass: rank the candidates for each distinct location, then pick and cache a boundary
+    map_fn = selection_executor.map if selection_executor is not None else map
+    rankings = zip(pending, map_fn(
+        _rank_boundaries,
+        repeat(selector),
+        pending_results(),
+        [location_type for _, location_type in pending]
+    ))
+    
+    # Merge the boundary data into every mention as it becomes available
+    for location in locations:
+        key = representatives[_location_key(location)]
+        while key not in boundaries:
+            (name, location_type), selected_boundaries = next(rankings)
+            boundaries[(name, location_type)] = _select_boundary(
+                name, location_type, batched[name], selected_boundaries,
+                cache_manager, cache_keys[(name, location_type)], cache_ttl
+            )
+        yield {**location, **boundaries[key]}
+
+# Stale boundaries being refreshed in the background, by cache key
+_refreshing: set = set()
+_refreshing_lock = threading.Lock()
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+
+def _refresh_boundary_async(
+    location_name: str,
+    location_type: Optional[str],
+    client: NominatimClient,
+    selector: BoundarySelector,
+    cache_manager: CacheManager,
+    cache_key: str,
+    cache_ttl: Optional[int],
+    executor: Optional[Executor] = None
+) -> None:
+    """Search for a location again in the background and cache the new boundary."""
+    global _refresh_executor
+    
+    with _refreshing_lock:
+        # Only one refresh per boundary at a time
+        if cache_key in _refreshing:
+            return
+        _refreshing.add(cache_key)
+        if executor is None:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='boundary-refresh')
+                # Drop queued refreshes so they don't hold up interpreter exit. atexit
+                # handlers run only after every pending future has completed, so hook
+                # in where concurrent.futures itself does.
+                threading._register_atexit(partial(_refresh_executor.shutdown, wait=False, cancel_futures=True))
+            executor = _refresh_executor
+    
+    def refresh() -> None:
+        try:
+            search_results = client.search(**_search_query(location_name))
+            _select_boundary(
+                location_name, location_type, search_results,
+                _rank_boundaries(selector, search_results, location_type),
+                cache_manager, cache_key, cache_ttl
+            )
+        except Exception as e:
+            logger.warning("Failed to refresh boundary for %s: %s", location_name, e)
+    
+    def done(_: Optional[Future]) -> None:
+        # Also runs when the refresh is cancelled before it starts
+        with _refreshing_lock:
+            _refreshing.discard(cache_key)
+    
+    try:
+        executor.submit(refresh).add_done_callback(done)
+    except RuntimeError as e:
+        # The executor has been shut down
+        logger.warning("Could not schedule a refresh for %s: %s", location_name, e)
+        done(None)
+
+def _lookup_known_boundaries(
+    pending: List[Tuple[str, Any]],
+    client: NominatimClient,
+    selector: BoundarySelector,
+    cache_manager: CacheManager,
+    cache_keys: Dict[Tuple[str, Any], str],
+    cache_ttl: Optional[int],
+    boundaries: Dict[Tuple[str, Any], Dict[str, Any]]
+) -> List[Tuple[str, Any]]:
+    """
+    Resolve locations whose OSM object is known from an earlier run with batched /lookup requests.
+    
+    Args:
+        pending: (name, type) keys without a cached boundary.
+        client: NominatimClient instance to use.
+        selector: BoundarySelector instance to use.
+        cache_manager: CacheManager instance to use.
+        cache_keys: Boundary cache key for each (name, type).
+        cache_ttl: Cache time-to-live in days.
+        boundaries: Resolved boundary data by (name, type), updated in place.
+    
+    Returns:
+        The keys that still need a search.
+    """
+    ref_keys = {key: cache_manager.osm_ref_key(*key) for key in pending}
+    refs = cache_manager.get_many(list(ref_keys.values()))
+    known = {key: refs[ref_keys[key]] for key in pending if ref_keys[key] in refs}
+    if not known:
+        return pending
+    
+    logger.info("Looking up %d previously resolved locations by OSM ID", len(known))
+    try:
+        results = client.batch_lookup(list(dict.fromkeys(known.values())), extratags=1)
+    except Exception as e:
+        logger.warning("OSM ID lookup failed, falling back to search: %s", e)
+        return pending
+    
+    for (name, location_type), ref in known.items():
+        result = results.get(ref)
+        if not result:
             continue
+        selected_boundaries = _rank_boundaries(selector, [result], location_type)
+        if selected_boundaries:
+            boundaries[(name, location_type)] = _select_boundary(
+                name, location_type, [result], selected_boundaries,
+                cache_manager, cache_keys[(name, location_type)], cache_ttl
+            )
+    
+    return [key for key in pending if key not in boundaries]
+
+def _default_extractor() -> LocationExtractor:
+    """Get the shared LocationExtractor, which loads the spaCy model on first use."""
+    from place2polygon.core import default_extractor
+    return default_extractor
+
+def _default_cache_manager() -> CacheManager:
+    """Get the shared CacheManager, which is created on first use."""
+    from place2polygon.cache import default_manager
+    return default_manager
+
+def _default_client() -> NominatimClient:
+    """Get the shared NominatimClient."""
+    from place2polygon.core.nominatim_client import default_client
+    return default_client
+
+def _default_selector() -> BoundarySelector:
+    """Get the shared BoundarySelector."""
+    from place2polygon.core.boundary_selector import default_selector
+    return default_selector
+
+def _default_visualizer() -> MapVisualizer:
+    """Get the shared MapVisualizer, which loads folium on first use."""
+    from place2polygon.core.map_visualizer import default_visualizer
+    return default_visualizer
+
+def _default_orchestrator() -> Optional[GeminiOrchestrator]:
+    """Get the shared GeminiOrchestrator, which loads the Gemini SDK on first use."""
+    from place2polygon.gemini.orchestrator import default_orchestrator
+    return default_orchestrator
+
+def _location_key(location: Dict[str, Any]) -> Tuple[str, Any]:
+    """Build the key under which mentions of the same place are looked up once."""
+    return CacheManager.normalize_name(location.get('name', '')), location.get('type')
+
+def _collect(items: Iterable[Dict[str, Any]], sink: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield items unchanged while appending each one to `sink`."""
+    for item in items:
+        sink.append(item)
+        yield item
+
+def _search_query(location_name: str) -> Dict[str, Any]:
+    """Build the Nominatim search parameters used for basic boundary searches."""
+    return {
+        'query': location_name,
+        'polygon_geojson': True,
+        'addressdetails': True,
+        'extratags': True,
+        'limit': 5
+    }
+
+async def _find_polygon_boundary(
+    location: Dict[str, Any],
+    client: NominatimClient,
+    cache_manager: CacheManager,
+    selector: BoundarySelector,
+    cache_ttl: Optional[int]
+) -> Dict[str, Any]:
+    """Find the boundary data for a single location using basic search."""
+    location_name = location['name']
+    location_type = location['type']
+    
+    logger.info("Finding polygon boundary for %s (%s)", location_name, location_type)
+    
+    # Try to get from cache
+    cache_key = cache_manager.boundary_key(location_name, location_type)
+    cached_result = cache_manager.get(cache_key)
+    
+    if cached_result:
+        logger.info("Found cached boundary for %s", location_name)
+        return cached_result
+    
+    # Search for the location with Nominatim; the blocking request runs in a worker thread
+    search_results = await asyncio.to_thread(lambda: client.search(**_search_query(location_name)))
+    selected_boundaries = _rank_boundaries(selector, search_results, location_type)
+    
+    return _select_boundary(
+        location_name, location_type, search_results, selected_boundaries, cache_manager, cache_key, cache_ttl
+    )
+
+def _rank_boundaries(
+    selector: BoundarySelector,
+    search_results: List[Dict[str, Any]],
+    location_type: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Rank search results with the selector (module-level so it can run in a process pool)."""
+    if not search_results:
+        return []
+    return selector.select_boundaries(search_results, location_type=location_type)
+
+def _select_boundary(
+    location_name: str,
+    location_type: Optional[str],
+    search_results: List[Dict[str, Any]],
+    selected_boundaries: List[Dict[str, Any]],
+    cache_manager: CacheManager,
+    cache_key: str,
+    cache_ttl: Optional[int]
+) -> Dict[str, Any]:
+    """
+    Select a boundary for a location from its ranked search results and cache it.
+    
+    Args:
+        location_name: Name of the location.
+        location_type: Type of the location.
+        search_results: Nominatim search results for the location.
+        selected_boundaries: Search results ranked by the boundary selector.
+        cache_manager: CacheManager instance to use.
+        cache_key: Cache key for the location's boundary.
+        cache_ttl: Cache time-to-live in days.
+    
+    Returns:
+        Boundary data to merge into the location, point coordinates if no
+        polygon boundary was found, or an empty dict if nothing was found.
+    """
+    if not search_results:
+        logger.warning("No results found for %s", location_name)
+        # Keep the location without a boundary
+        return {}
+    
+    if selected_boundaries:
+        # Get the best match
+        best_match = selected_boundaries[0]
         
-        # Search for the location with Nominatim
-        search_results = client.search(
-            query=location_name,
-            polygon_geojson=True,
-            addressdetails=True,
-            extratags=True,
-            limit=5
-        )
+        # Extract coordinates for marker fallback
+        if 'lat' in best_match and 'lon' in best_match:
+            lat = float(best_match['lat'])
+            lon = float(best_match['lon'])
+        else:
+            lat, lon = None, None
         
-        if not search_results:
-            logger.warning(f"No results found for {location_name}")
-            # Keep the location without a boundary
-            enriched_locations.append(location)
-            continue
+        # Extract boundary data; ranking is done, so the geometry can lose
+        # precision it doesn't need before it is cached
+        boundary_data = {
+            'boundary': trim_geojson(best_match.get('geojson'), COORD_PRECISION),
+            'display_name': best_match.get('display_name'),
+            'osm_id': best_match.get('osm_id'),
+            'osm_type': best_match.get('osm_type'),
+            'latitude': lat,
+            'longitude': lon,
+            'address': best_match.get('address', {}),
+        }
         
-        # Select the most appropriate boundary
-        selected_boundaries = selector.select_boundaries(
-            search_results,
-            location_type=location_type
-        )
+        # Cache the boundary data, and the OSM object it came from so it can be re-fetched by ID
+        items = [(cache_key, boundary_data, cache_ttl)]
+        from place2polygon.core.nominatim_client import osm_ref
+        ref = osm_ref(best_match.get('osm_type'), best_match.get('osm_id'))
+        if ref:
+            items.append((cache_manager.osm_ref_key(location_name, location_type), ref, OSM_REF_TTL_DAYS))
+        cache_manager.set_many(items)
         
-        if selected_boundaries:
-            # Get the best match
-            best_match = selected_boundaries[0]
-            
-            # Extract coordinates for marker fallback
-            if 'lat' in best_match and 'lon' in best_match:
-                lat = float(best_match['lat'])
-                lon = float(best_match['lon'])
-            else:
-                lat, lon = None, None
-            
-            # Extract boundary data
-            boundary_data = {
-                'boundary': best_match.get('geojson'),
-                'display_name': best_match.get('display_name'),
-                'osm_id': best_match.get('osm_id'),
-                'osm_type': best_match.get('osm_type'),
-                'latitude': lat,
-                'longitude': lon,
-                'address': best_match.get('address', {}),
-            }
-            
-            # Cache the boundary data
-            cache_manager.cache_result(boundary_data, cache_ttl, cache_key)
-            
-            # Merge the location data with the boundary data
-            location_with_boundary = {**location, **boundary_data}
-            enriched_locations.append(location_with_boundary)
-        else:
-            # No valid boundary found
-            logger.warning(f"No valid boundary found for {location_name}")
-            
-            # If the search result has coordinates, use them for a point marker
-            if search_results and 'lat' in search_results[0] and 'lon' in search_results[0]:
-                result = search_results[0]
-                lat = float(result['lat'])
-                lon = float(result['lon'])
-                
-                # Add coordinates to the location
-                location_with_point = {**location, 'latitude': lat, 'longitude': lon}
-                enriched_locations.append(location_with_point)
-            else:
-                # Keep the location without a boundary or coordinates
-                enriched_locations.append(location)
-    
-    return enriched_locations
+        return boundary_data
+    
+    # No valid boundary found
+    logger.warning("No valid boundary found for %s", location_name)
+    
+    # If the search result has coordinates, use them for a point marker
+    if 'lat' in search_results[0] and 'lon' in search_results[0]:
+        result = search_results[0]
+        lat = float(result['lat'])
+        lon = float(result['lon'])
+        
+        # Add coordinates to the location
+        return {'latitude': lat, 'longitude': lon}
+    
+    # Keep the location without a boundary or coordinates
+    return {}
 
 def create_map(
     locations_with_boundaries: List[Dict[str, Any]],
     output_path: Optional[str] = None,
-    visualizer: MapVisualizer = default_visualizer,
-    title: Optional[str] = None
+    visualizer: Optional[MapVisualizer] = None,
+    title: Optional[str] = None,
+    coord_precision: Optional[int] = None
 ) -> str:
     """
     Create an interactive map with polygon boundaries.
@@ -357,16 +761,22 @@ def create_map(
     Args:
         locations_with_boundaries: Locations with boundary data.
         output_path: Path to save the map.
-        visualizer: MapVisualizer instance to use.
+        visualizer: MapVisualizer instance to use. Defaults to the shared default_visualizer.
         title: Optional title for the map.
-        
+        coord_precision: Optional number of decimal places to round boundary
+            coordinates to. Default keeps full precision.
+    
     Returns:
         Path to the generated map.
     """
+    if visualizer is None:
+        visualizer = _default_visualizer()
+    
     map_path = visualizer.create_map(
         locations_with_boundaries,
         title=title or "Place2Polygon Map",
-        output_path=output_path
+        output_path=output_path,
+        coord_precision=coord_precision
     )
     
     return map_path
@@ -374,7 +784,8 @@ def create_map(
 def export_to_geojson(
     locations_with_boundaries: List[Dict[str, Any]],
     output_path: str,
-    visualizer: MapVisualizer = default_visualizer
+    visualizer: Optional[MapVisualizer] = None,
+    coord_precision: Optional[int] = None
 ) -> str:
     """
     Export location boundaries to a GeoJSON file.
@@ -382,9 +793,35 @@ def export_to_geojson(
     Args:
         locations_with_boundaries: Locations with boundary data.
         output_path: Path to save the GeoJSON file.
-        visualizer: MapVisualizer instance to use.
-        
+        visualizer: MapVisualizer instance to use. Defaults to the shared default_visualizer.
+        coord_precision: Optional number of decimal places to round boundary
+            coordinates to. Default keeps full precision.
+    
     Returns:
         Path to the saved GeoJSON file.
     """
-    return visualizer.export_to_geojson(locations_with_boundaries, output_path)
+    if visualizer is None:
+        visualizer = _default_visualizer()
+    
+    return visualizer.export_to_geojson(locations_with_boundaries, output_path, coord_precision=coord_precision)
+
+# Classes and shared instances re-exported from the subpackages. They are
+# imported on first access so that importing the package (e.g. for the CLI)
+# does not load spaCy, folium or the Gemini SDK.
+_LAZY_ATTRIBUTES = {
+    'LocationExtractor': 'place2polygon.core',
+    'default_extractor': 'place2polygon.core',
+    'NominatimClient': 'place2polygon.core',
+    'default_client': 'place2polygon.core',
+    'BoundarySelector': 'place2polygon.core',
+    'default_selector': 'place2polygon.core',
+    'MapVisualizer': 'place2polygon.core',
+    'default_visualizer': 'place2polygon.core',
+    'GeminiOrchestrator': 'place2polygon.gemini',
+    'default_orchestrator': 'place2polygon.gemini',
+}
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
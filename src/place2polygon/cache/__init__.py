@@ -2,8 +2,11 @@
 Cache modules for the Place2Polygon package.
 """
 
-from place2polygon.cache.sqlite_cache import SQLiteCache, default_cache
-from place2polygon.cache.cache_manager import CacheManager, default_manager
+from typing import Any
+
+from place2polygon.cache import cache_manager, sqlite_cache
+from place2polygon.cache.sqlite_cache import SQLiteCache
+from place2polygon.cache.cache_manager import CacheManager
 
 __all__ = [
     'SQLiteCache',
@@ -11,3 +14,11 @@ __all__ = [
     'CacheManager',
     'default_manager',
 ]
+
+def __getattr__(name: str) -> Any:
+    # The default instances are created lazily by their modules
+    if name == 'default_cache':
+        return sqlite_cache.default_cache
+    if name == 'default_manager':
+        return cache_manager.default_manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
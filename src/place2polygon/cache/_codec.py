@@ -0,0 +1,65 @@
+"""
+Storage settings shared by the SQLite caches.
+
+Both caches open their connections with the same pragmas. Cached values
+are serialized as compact JSON, using orjson when it is installed. They
+are mostly large GeoJSON payloads, so those above a size threshold are
+stored zstd-compressed when zstandard is installed.
+"""
+
+import json
+from typing import Any, Union
+
+# orjson is much faster on the large GeoJSON payloads cached here; fall back to compact json
+try:
+    import orjson
+    
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    loads = orjson.loads
+except ImportError:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    loads = json.loads
+
+# Connection tuning for a read-heavy cache. WAL keeps readers unblocked while
+# a write commits, and synchronous=NORMAL drops the fsync on every commit; a
+# lost tail after a power failure only means a few lookups are fetched again.
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA mmap_size=268435456',  # 256 MB of memory-mapped reads
+    'PRAGMA cache_size=-65536',  # 64 MB page cache
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA wal_autocheckpoint=1000',
+    'PRAGMA journal_size_limit=67108864',  # Truncate the WAL back to 64 MB after checkpoints
+)
+
+# Optional dependency; without it values are stored uncompressed
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+COMPRESS_MIN_BYTES = 1024  # Smaller values aren't worth compressing
+ZSTD_LEVEL = 3
+
+def pack(data: bytes) -> bytes:
+    """Compress a serialized value if it is large enough to benefit."""
+    if zstandard is not None and len(data) >= COMPRESS_MIN_BYTES:
+        return zstandard.compress(data, ZSTD_LEVEL)
+    return data
+
+def unpack(data: Union[str, bytes]) -> Union[str, bytes]:
+    """Decompress a stored value if it was compressed."""
+    if isinstance(data, bytes) and data.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise ValueError("zstandard is required to read compressed cache entries")
+        try:
+            return zstandard.decompress(data)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Corrupt compressed cache entry: {e}") from e
+    return data
@@ -7,17 +7,52 @@ This module provides a cache manager class that uses SQLite to store API respons
 import os
 import sqlite3
 import logging
-import json
 import time
-from typing import Dict, Any, Optional, List
+import hashlib
+import threading
+import contextvars
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Callable, Iterable, Iterator, Tuple
 from pathlib import Path
 
+from place2polygon.cache._codec import SQLITE_PRAGMAS, dumps, loads, pack, unpack
 from place2polygon.utils import default_output_manager
 
 logger = logging.getLogger(__name__)
 
+# Fast non-cryptographic hash for fixed-length boundary keys; fall back to blake2b
+try:
+    from xxhash import xxh3_64_hexdigest as _hexdigest
+except ImportError:
+    def _hexdigest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
 DEFAULT_DB_PATH = 'place2polygon_cache.db'
 DEFAULT_TTL_DAYS = 30  # 30 days default TTL
+HOT_CACHE_SIZE = 1024  # Entries kept in memory in front of SQLite
+PURGE_INTERVAL = 1000  # Writes between sweeps of expired entries
+GET_MANY_CHUNK = 500  # Keys per IN (...) query in get_many
+STATS_FLUSH_INTERVAL = 100  # Hits and misses counted in memory before being written back
+BOUNDARY_KEY_PREFIX = 'boundary_'
+GEMINI_BOUNDARY_KEY_PREFIX = 'gemini_boundary_'
+OSM_REF_KEY_PREFIX = 'osmref_'
+
+STATEMENT_CACHE_SIZE = 256  # Compiled statements kept per connection
+
+# Statements on the hot paths, kept as constants so each is compiled once
+# and then served from the connection's statement cache
+SQL_GET = 'SELECT value, expires FROM cache WHERE key = ?'
+SQL_UPSERT = '''
+    INSERT INTO cache (key, value, created, expires) VALUES (?, ?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value, created = excluded.created, expires = excluded.expires
+'''
+SQL_ADD_STAT = 'UPDATE stats SET value = value + ? WHERE name = ?'
+
+# Set while inside CacheManager.skip_cache(); local to the current thread or asyncio task
+_skip_cache: contextvars.ContextVar[bool] = contextvars.ContextVar('skip_cache', default=False)
 
 class CacheManager:
     """
@@ -26,13 +61,17 @@ class CacheManager:
     Uses SQLite to store responses and provides methods for managing the cache.
     """
     
-    def __init__(self, db_path: Optional[str] = None, ttl_days: int = DEFAULT_TTL_DAYS):
+    def __init__(self, db_path: Optional[str] = None, ttl_days: int = DEFAULT_TTL_DAYS,
+                 hot_cache_size: int = HOT_CACHE_SIZE, cleanup_interval: Optional[float] = None):
         """
         Initialize the cache manager.
         
         Args:
             db_path: Path to the SQLite database file. If None, uses place2polygon_output/cache directory.
             ttl_days: Default time-to-live in days for cached items.
+            hot_cache_size: Number of recently used items kept in memory. 0 disables the in-memory tier.
+            cleanup_interval: Seconds between background sweeps of expired items. If None, expired
+                items are only swept every PURGE_INTERVAL writes.
         """
         # Use the output manager to get the cache directory
         if db_path is None:
@@ -42,10 +81,38 @@ class CacheManager:
         self.db_path = db_path
         self.ttl_days = ttl_days
         self.conn = None
+        self._write_cursor = None
+        
+        # Lookups currently being computed, so concurrent callers for the
+        # same key wait for one result instead of repeating the work
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # In-memory LRU tier of (expires, value) so recurring lookups skip SQLite
+        self.hot_cache_size = hot_cache_size
+        self._hot: "OrderedDict[str, tuple]" = OrderedDict()
+        self._hot_lock = threading.Lock()
+        
+        # Hit/miss counts are kept in memory and written back in batches, so
+        # reads never write to the database themselves
+        self._pending_stats = {'hits': 0, 'misses': 0}
+        self._stats_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        
+        # Expired entries are skipped on read and swept every PURGE_INTERVAL writes
+        self._writes_since_purge = 0
+        
+        # Optional time-based sweeps use a one-shot Timer that re-arms itself,
+        # so no thread is held between runs
+        self.cleanup_interval = cleanup_interval
+        self._cleanup_timer: Optional[threading.Timer] = None
         
         # Initialize the database
         self._init_db()
         
+        if self.cleanup_interval:
+            self._schedule_cleanup()
+        
         logger.info(f"Cache initialized at {self.db_path}")
     
     def _init_db(self) -> None:
@@ -56,19 +123,36 @@ class CacheManager:
             os.makedirs(db_dir)
         
         # Connect to the database
-        self.conn = sqlite3.connect(self.db_path)
+        # Autocommit mode: reads never open a transaction, writes go through _write()
+        self.conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
         cursor = self.conn.cursor()
         
+        # Writes are serialized by _write_lock, so they can share one cursor
+        self._write_cursor = self.conn.cursor()
+        
+        # WAL needs a file; in-memory databases keep SQLite's defaults
+        if self.db_path != ':memory:':
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        
         # Create the cache table if it doesn't exist
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS cache (
                 key TEXT PRIMARY KEY,
-                value TEXT NOT NULL,
+                value BLOB NOT NULL,
                 created REAL NOT NULL,
                 expires REAL NOT NULL
             )
         ''')
         
+        # Index expiry times so sweeps of expired entries don't scan the table
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache(expires)')
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS stats (
                 name TEXT PRIMARY KEY,
@@ -77,11 +161,7 @@ class CacheManager:
         ''')
         
         # Initialize stats if they don't exist
-        stats = ['hits', 'misses', 'size']
-        for stat in stats:
-            cursor.execute('INSERT OR IGNORE INTO stats (name, value) VALUES (?, 0)', (stat,))
-        
-        self.conn.commit()
+        cursor.execute("INSERT OR IGNORE INTO stats (name, value) VALUES ('hits', 0), ('misses', 0)")
     
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """
@@ -89,92 +169,354 @@ class CacheManager:
         
         Args:
             key: The cache key.
-            
+        
         Returns:
-            The cached item, or None if not found or expired.
+            The cached item, or None if not found, expired, or inside `skip_cache()`.
         """
+        if _skip_cache.get():
+            return None
+        
+        # Serve recently used items from memory
+        with self._hot_lock:
+            entry = self._hot.get(key)
+            if entry is not None:
+                if entry[0] >= time.time():
+                    self._hot.move_to_end(key)
+                else:
+                    del self._hot[key]
+                    entry = None
+        
+        if entry is not None:
+            self._count('hits')
+            return entry[1]
+        
         if not self.conn:
             self._init_db()
         
-        cursor = self.conn.cursor()
-        
         # Get item from cache
-        cursor.execute('SELECT value, expires FROM cache WHERE key = ?', (key,))
-        result = cursor.fetchone()
+        result = self.conn.execute(SQL_GET, (key,)).fetchone()
         
         if result:
             value, expires = result
             
-            # Check if expired
+            # Check if expired; the row itself is left for the next sweep
             if expires < time.time():
-                # Remove expired item
-                cursor.execute('DELETE FROM cache WHERE key = ?', (key,))
-                self.conn.commit()
-                
                 # Update stats
-                self._increment_stat('misses')
-                self._decrement_stat('size')
+                self._count('misses')
                 
                 return None
             
             # Update stats
-            self._increment_stat('hits')
+            self._count('hits')
             
             # Return the cached item
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
+                item = loads(unpack(value))
+            except ValueError:
                 logger.warning(f"Failed to decode cached item: {key}")
                 return None
+            
+            self._remember(key, item, expires)
+            return item
         else:
             # Update stats
-            self._increment_stat('misses')
+            self._count('misses')
             
             return None
     
+    def get_stale(self, key: str, max_stale_days: Optional[float] = None) -> Tuple[Optional[Any], bool]:
+        """
+        Get an item from the cache even if it has expired.
+        
+        Expired items stay in the database until the next sweep, so a caller
+        that can tolerate slightly old data can use one immediately and
+        refresh it in the background. Meant as a fallback after a miss, so
+        hit/miss statistics are not updated.
+        
+        Args:
+            key: The cache key.
+            max_stale_days: How long past expiry an item may still be returned.
+                If None, any expired item that hasn't been swept is returned.
+        
+        Returns:
+            Tuple of (item, is_stale). The item is None if not found, too stale,
+            or inside `skip_cache()`.
+        """
+        if _skip_cache.get():
+            return None, False
+        
+        if not self.conn:
+            self._init_db()
+        
+        result = self.conn.execute(SQL_GET, (key,)).fetchone()
+        if not result:
+            return None, False
+        
+        value, expires = result
+        now = time.time()
+        if max_stale_days is not None and expires + max_stale_days * 24 * 60 * 60 < now:
+            return None, False
+        
+        try:
+            item = loads(unpack(value))
+        except ValueError:
+            logger.warning(f"Failed to decode cached item: {key}")
+            return None, False
+        
+        return item, expires < now
+    
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """
+        Normalize a location name for cache keys and deduplication.
+        
+        Args:
+            name: The location name.
+        
+        Returns:
+            The name case-folded, with runs of whitespace collapsed to single spaces.
+        """
+        return ' '.join(name.split()).casefold()
+    
+    @staticmethod
+    def boundary_key(name: str, kind: Optional[str]) -> str:
+        """
+        Build the cache key for a location's boundary.
+        
+        Args:
+            name: The location name. Case and whitespace differences are ignored.
+            kind: The location type.
+        
+        Returns:
+            A fixed-length key of the form "boundary_<hash>".
+        """
+        return BOUNDARY_KEY_PREFIX + _hexdigest(f"{CacheManager.normalize_name(name)}\0{kind}".encode('utf-8'))
+    
+    @staticmethod
+    def gemini_boundary_key(name: str, kind: Optional[str]) -> str:
+        """
+        Build the cache key for a boundary found by Gemini orchestration.
+        
+        Gemini results are cached as bare GeoJSON geometries, while basic
+        searches cache boundary data dictionaries, so the two use separate keys.
+        
+        Args:
+            name: The location name. Case and whitespace differences are ignored.
+            kind: The location type.
+        
+        Returns:
+            A fixed-length key of the form "gemini_boundary_<hash>".
+        """
+        return GEMINI_BOUNDARY_KEY_PREFIX + _hexdigest(f"{CacheManager.normalize_name(name)}\0{kind}".encode('utf-8'))
+    
+    @staticmethod
+    def osm_ref_key(name: str, kind: Optional[str]) -> str:
+        """
+        Build the cache key for the OSM object a location's boundary came from.
+        
+        Args:
+            name: The location name. Case and whitespace differences are ignored.
+            kind: The location type.
+        
+        Returns:
+            A fixed-length key of the form "osmref_<hash>".
+        """
+        return OSM_REF_KEY_PREFIX + _hexdigest(f"{CacheManager.normalize_name(name)}\0{kind}".encode('utf-8'))
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several items from the cache with a single query.
+        
+        Args:
+            keys: The cache keys.
+        
+        Returns:
+            Dictionary mapping each key found (and not expired) to its cached item.
+        """
+        if _skip_cache.get() or not keys:
+            return {}
+        
+        found = {}
+        now = time.time()
+        
+        # Serve recently used items from memory
+        with self._hot_lock:
+            for key in keys:
+                entry = self._hot.get(key)
+                if entry is not None and entry[0] >= now:
+                    self._hot.move_to_end(key)
+                    found[key] = entry[1]
+        
+        if found:
+            self._count('hits', len(found))
+        
+        remaining = [key for key in dict.fromkeys(keys) if key not in found]
+        if remaining:
+            if not self.conn:
+                self._init_db()
+            
+            cursor = self.conn.cursor()
+            hits = 0
+            
+            # Stay well under SQLite's limit on bound parameters
+            for i in range(0, len(remaining), GET_MANY_CHUNK):
+                chunk = remaining[i:i + GET_MANY_CHUNK]
+                cursor.execute(
+                    f'SELECT key, value, expires FROM cache WHERE key IN ({",".join("?" * len(chunk))})',
+                    chunk
+                )
+                for key, value, expires in cursor.fetchall():
+                    if expires < now:
+                        continue
+                    try:
+                        item = loads(unpack(value))
+                    except ValueError:
+                        logger.warning(f"Failed to decode cached item: {key}")
+                        continue
+                    found[key] = item
+                    hits += 1
+                    self._remember(key, item, expires)
+            
+            # Update stats
+            if hits:
+                self._count('hits', hits)
+            if len(remaining) > hits:
+                self._count('misses', len(remaining) - hits)
+        
+        return found
+    
     def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
         """
         Set an item in the cache.
         
+        A thin wrapper around `set_many([(key, value, ttl)])`.
+        
         Args:
             key: The cache key.
             value: The value to cache.
             ttl: Time-to-live in days. If None, uses the default TTL.
         """
+        self.set_many([(key, value, ttl)])
+    
+    def set_many(self, items: Iterable[Tuple[str, Any, Optional[int]]]) -> int:
+        """
+        Set several items in the cache in a single transaction.
+        
+        Args:
+            items: (key, value, ttl) tuples. A ttl of None uses the default TTL.
+        
+        Returns:
+            Number of items stored. Values that can't be encoded are skipped.
+        """
         if not self.conn:
             self._init_db()
         
-        cursor = self.conn.cursor()
+        created = time.time()
+        rows = []
+        stored = []
+        for key, value, ttl in items:
+            # Use default TTL if not specified
+            if ttl is None:
+                ttl = self.ttl_days
+            
+            # Calculate expiration time
+            expires = created + (ttl * 24 * 60 * 60)  # Convert days to seconds
+            
+            # Serialize value to JSON
+            try:
+                json_value = pack(dumps(value))
+            except (TypeError, ValueError):
+                logger.warning(f"Failed to encode value for cache key: {key}")
+                continue
+            
+            rows.append((key, json_value, created, expires))
+            stored.append((key, value, expires))
         
-        # Use default TTL if not specified
-        if ttl is None:
-            ttl = self.ttl_days
+        if not rows:
+            return 0
         
-        # Calculate expiration time
-        created = time.time()
-        expires = created + (ttl * 24 * 60 * 60)  # Convert days to seconds
+        # Insert or update the items in one transaction
+        with self._write() as cursor:
+            cursor.executemany(SQL_UPSERT, rows)
+        self._writes_since_purge += len(rows)
         
-        # Serialize value to JSON
-        try:
-            json_value = json.dumps(value)
-        except (TypeError, ValueError):
-            logger.warning(f"Failed to encode value for cache key: {key}")
-            return
+        for key, value, expires in stored:
+            self._remember(key, value, expires)
         
-        # Check if item already exists
-        cursor.execute('SELECT 1 FROM cache WHERE key = ?', (key,))
-        exists = cursor.fetchone() is not None
+        if self._writes_since_purge >= PURGE_INTERVAL:
+            self.maybe_vacuum()
         
-        # Update or insert item
-        if exists:
-            cursor.execute('UPDATE cache SET value = ?, created = ?, expires = ? WHERE key = ?',
-                          (json_value, created, expires, key))
-        else:
-            cursor.execute('INSERT INTO cache (key, value, created, expires) VALUES (?, ?, ?, ?)',
-                          (key, json_value, created, expires))
-            self._increment_stat('size')
+        return len(rows)
+    
+    def get_or_compute(
+        self,
+        key: str,
+        compute_fn: Callable[[], Any],
+        ttl: Optional[int] = None
+    ) -> Any:
+        """
+        Get an item from the cache, computing and caching it on a miss.
+        
+        Concurrent calls for the same key are coalesced: the first caller
+        runs `compute_fn` while the others wait for its result.
         
-        self.conn.commit()
+        Args:
+            key: The cache key.
+            compute_fn: Function producing the value on a cache miss.
+            ttl: Time-to-live in days. If None, uses the default TTL.
+        
+        Returns:
+            The cached or computed value. Empty values are returned but not cached.
+        """
+        # Cached values are read without taking the lock
+        value = self.get(key)
+        if value is not None:
+            return value
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            # Another caller may have stored the value since the lookup above;
+            # re-check without counting a second miss
+            value, _ = self.get_stale(key, max_stale_days=0)
+            if value is None:
+                value = compute_fn()
+                if value:
+                    self.set(key, value, ttl=ttl)
+        except BaseException as e:
+            with self._inflight_lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        
+        with self._inflight_lock:
+            del self._inflight[key]
+        future.set_result(value)
+        
+        return value
+    
+    @contextmanager
+    def skip_cache(self) -> Iterator[None]:
+        """
+        Bypass cached values for lookups made inside the block.
+        
+        Reads miss so values are recomputed, while fresh results are still
+        written back. The flag is a context variable, so it only applies to
+        the current thread or asyncio task.
+        """
+        token = _skip_cache.set(True)
+        try:
+            yield
+        finally:
+            _skip_cache.reset(token)
     
     def delete(self, key: str) -> bool:
         """
@@ -182,40 +524,35 @@ class CacheManager:
         
         Args:
             key: The cache key.
-            
+        
         Returns:
             True if the item was deleted, False otherwise.
         """
-        if not self.conn:
-            self._init_db()
-        
-        cursor = self.conn.cursor()
+        with self._hot_lock:
+            self._hot.pop(key, None)
         
         # Delete item
-        cursor.execute('DELETE FROM cache WHERE key = ?', (key,))
-        deleted = cursor.rowcount > 0
-        
-        if deleted:
-            self._decrement_stat('size')
-        
-        self.conn.commit()
+        with self._write() as cursor:
+            # fetchall() steps the statement to completion so it finishes inside the transaction
+            deleted = bool(cursor.execute(
+                'DELETE FROM cache WHERE key = ? RETURNING 1', (key,)
+            ).fetchall())
         
         return deleted
     
     def clear(self) -> None:
         """Clear all items from the cache."""
-        if not self.conn:
-            self._init_db()
-        
-        cursor = self.conn.cursor()
-        
-        # Clear cache
-        cursor.execute('DELETE FROM cache')
-        
-        # Reset stats
-        cursor.execute('UPDATE stats SET value = 0')
-        
-        self.conn.commit()
+        with self._hot_lock:
+            self._hot.clear()
+        with self._stats_lock:
+            self._pending_stats = {'hits': 0, 'misses': 0}
+        
+        with self._write() as cursor:
+            # Clear cache
+            cursor.execute('DELETE FROM cache')
+            
+            # Reset stats
+            cursor.execute('UPDATE stats SET value = 0')
     
     def clean_expired(self) -> int:
         """
@@ -224,21 +561,35 @@ class CacheManager:
         Returns:
             Number of items removed.
         """
-        if not self.conn:
-            self._init_db()
-        
-        cursor = self.conn.cursor()
+        # Delete expired items in one statement, walking idx_cache_expires
+        with self._write() as cursor:
+            cursor.execute('DELETE FROM cache WHERE expires < ? RETURNING key', (time.time(),))
+            deleted_keys = [row[0] for row in cursor.fetchall()]
+        
+        # Drop the same items from the in-memory tier
+        if deleted_keys:
+            with self._hot_lock:
+                for key in deleted_keys:
+                    self._hot.pop(key, None)
+        
+        return len(deleted_keys)
+    
+    def maybe_vacuum(self) -> int:
+        """
+        Sweep expired items and let SQLite refresh its query planner statistics.
         
-        # Delete expired items
-        cursor.execute('DELETE FROM cache WHERE expires < ?', (time.time(),))
-        deleted_count = cursor.rowcount
+        Called automatically every PURGE_INTERVAL writes; reads skip expired
+        items but leave them in place until a sweep.
         
-        if deleted_count > 0:
-            # Update size stat
-            cursor.execute('UPDATE stats SET value = value - ? WHERE name = ?',
-                          (deleted_count, 'size'))
+        Returns:
+            Number of items removed.
+        """
+        self._writes_since_purge = 0
+        deleted_count = self.clean_expired()
+        self.conn.execute('PRAGMA optimize')
         
-        self.conn.commit()
+        if deleted_count:
+            logger.info(f"Removed {deleted_count} expired cache items")
         
         return deleted_count
     
@@ -252,43 +603,100 @@ class CacheManager:
         if not self.conn:
             self._init_db()
         
+        # Write back counts still held in memory
+        self._flush_stats()
+        
         cursor = self.conn.cursor()
         
         # Get all stats
         cursor.execute('SELECT name, value FROM stats')
         stats = {row[0]: row[1] for row in cursor.fetchall()}
+        hits = stats.get('hits', 0)
+        
+        # Count entries on demand rather than keeping a counter in step with every write
+        cursor.execute('SELECT COUNT(*) FROM cache')
+        size = cursor.fetchone()[0]
         
         # Calculate hit rate
-        total_requests = stats.get('hits', 0) + stats.get('misses', 0)
-        hit_rate = stats.get('hits', 0) / max(total_requests, 1)
+        total_requests = hits + stats.get('misses', 0)
+        hit_rate = hits / max(total_requests, 1)
         
         return {
-            'hits': stats.get('hits', 0),
+            'hits': hits,
             'misses': stats.get('misses', 0),
             'hit_rate': hit_rate,
-            'size': stats.get('size', 0),
+            'size': size,
             'db_path': self.db_path
         }
     
-    def _increment_stat(self, name: str, amount: int = 1) -> None:
-        """Increment a stat by the given amount."""
-        cursor = self.conn.cursor()
-        cursor.execute('UPDATE stats SET value = value + ? WHERE name = ?',
-                      (amount, name))
+    def _remember(self, key: str, value: Any, expires: float) -> None:
+        """Keep an item in the in-memory tier, evicting the least recently used."""
+        if self.hot_cache_size <= 0:
+            return
+        
+        with self._hot_lock:
+            self._hot[key] = (expires, value)
+            self._hot.move_to_end(key)
+            while len(self._hot) > self.hot_cache_size:
+                self._hot.popitem(last=False)
     
-    def _decrement_stat(self, name: str, amount: int = 1) -> None:
-        """Decrement a stat by the given amount."""
-        cursor = self.conn.cursor()
-        cursor.execute('UPDATE stats SET value = value - ? WHERE name = ?',
-                      (amount, name))
+    def _count(self, name: str, amount: int = 1) -> None:
+        """Count a hit or miss in memory, writing counts back every STATS_FLUSH_INTERVAL lookups."""
+        with self._stats_lock:
+            self._pending_stats[name] += amount
+            due = sum(self._pending_stats.values()) >= STATS_FLUSH_INTERVAL
+        
+        if due:
+            self._flush_stats()
     
-    def get_keys(self, pattern: Optional[str] = None) -> List[str]:
+    def _flush_stats(self) -> None:
+        """Write the hit and miss counts held in memory back to the stats table."""
+        with self._stats_lock:
+            pending = self._pending_stats
+            self._pending_stats = {'hits': 0, 'misses': 0}
+        
+        if not any(pending.values()):
+            return
+        
+        with self._write() as cursor:
+            cursor.executemany(SQL_ADD_STAT, [
+                (amount, name) for name, amount in pending.items() if amount
+            ])
+    
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run the block's statements in one write transaction.
+        
+        The transaction starts with BEGIN IMMEDIATE so it takes the write lock
+        up front, and commits on success or rolls back on error. Only one
+        thread writes through the shared connection at a time.
+        """
+        with self._write_lock:
+            if not self.conn:
+                self._init_db()
+            
+            cursor = self._write_cursor
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                yield cursor
+            except BaseException:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+    
+    def get_keys(self, pattern: Optional[str] = None, prefix: Optional[str] = None) -> List[str]:
         """
         Get all cache keys matching the pattern.
         
+        A LIKE pattern has to be checked against every key, while a prefix is
+        answered with a range seek on the primary key index, so prefer `prefix`
+        for lookups such as `prefix=BOUNDARY_KEY_PREFIX`.
+        
         Args:
             pattern: SQL LIKE pattern to match keys.
-            
+            prefix: Case-sensitive key prefix to match.
+        
         Returns:
             List of matching cache keys.
         """
@@ -298,22 +706,65 @@ class CacheManager:
         cursor = self.conn.cursor()
         
         # Query keys
-        if pattern:
+        if prefix:
+            # Keys sort by code point, so every key with the prefix lies in [prefix, upper)
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            cursor.execute('SELECT key FROM cache WHERE key >= ? AND key < ?', (prefix, upper))
+        elif pattern:
             cursor.execute('SELECT key FROM cache WHERE key LIKE ?', (pattern,))
         else:
             cursor.execute('SELECT key FROM cache')
         
         return [row[0] for row in cursor.fetchall()]
     
+    def _schedule_cleanup(self) -> None:
+        """Arm the timer for the next background sweep of expired items."""
+        self._cleanup_timer = threading.Timer(self.cleanup_interval, self._run_cleanup)
+        self._cleanup_timer.daemon = True
+        self._cleanup_timer.start()
+    
+    def _run_cleanup(self) -> None:
+        """Sweep expired items, then re-arm the timer while the cache is open."""
+        if not self.conn:
+            return
+        
+        try:
+            deleted_count = self.clean_expired()
+            if deleted_count:
+                logger.info(f"Removed {deleted_count} expired cache items")
+        except sqlite3.Error as e:
+            logger.warning(f"Background cache cleanup failed: {e}")
+        
+        if self.conn:
+            self._schedule_cleanup()
+    
     def close(self) -> None:
         """Close the database connection."""
+        if self._cleanup_timer is not None:
+            self._cleanup_timer.cancel()
+            self._cleanup_timer = None
+        
         if self.conn:
+            # Persist counts still held in memory
+            self._flush_stats()
             self.conn.close()
             self.conn = None
+            self._write_cursor = None
     
     def __del__(self) -> None:
         """Clean up on object destruction."""
         self.close()
 
-# Create default cache manager instance
-default_manager = CacheManager()
+# The default instance is created on first access (PEP 562) so importing the
+# package doesn't create directories or open a database
+_default_manager: Optional[CacheManager] = None
+_default_lock = threading.Lock()
+
+def __getattr__(name: str) -> Any:
+    if name == 'default_manager':
+        global _default_manager
+        with _default_lock:
+            if _default_manager is None:
+                _default_manager = CacheManager()
+        return _default_manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,16 +5,44 @@ This module provides a persistent cache using SQLite for storing
 Nominatim query results, including polygon geometries.
 """
 
-import json
+import io
 import os
+import queue
 import sqlite3
 import time
-from typing import Dict, List, Optional, Any, Union, Tuple
+import threading
+from typing import BinaryIO, Dict, Iterable, List, Optional, Any, Union, Tuple
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
+from place2polygon.cache._codec import SQLITE_PRAGMAS, ZSTD_MAGIC, dumps, loads, pack, unpack, zstandard
+
 logger = logging.getLogger(__name__)
 
+ACCESS_FLUSH_INTERVAL = 100  # Cache hits recorded in memory before access counts are written
+STATS_FLUSH_SECONDS = 5.0  # How long the stats worker gathers updates before writing them
+HOT_CACHE_SIZE = 1024  # Results kept in memory in front of SQLite
+STATEMENT_CACHE_SIZE = 256  # Compiled statements kept per connection
+
+# Statements on the hot paths, kept as constants so each is compiled once
+# and then served from the connection's statement cache
+SQL_GET = """
+    SELECT result, expires_at FROM nominatim_cache
+    WHERE query_key = ? AND expires_at > ?
+"""
+SQL_SET = """
+    INSERT OR REPLACE INTO nominatim_cache
+    (query_key, result, created_at, expires_at, access_count, last_accessed_at)
+    VALUES (?, ?, ?, ?, 0, NULL)
+"""
+SQL_RECORD_ACCESS = """
+    UPDATE nominatim_cache
+    SET access_count = access_count + ?,
+        last_accessed_at = ?
+    WHERE query_key = ?
+"""
+
 class SQLiteCache:
     """
     SQLite-based cache for Nominatim query results.
@@ -22,25 +50,82 @@ class SQLiteCache:
     Args:
         db_path: Path to the SQLite database file.
         default_ttl: Default time-to-live in days.
+        hot_cache_size: Number of recently used results kept in memory. 0 disables the in-memory tier.
     """
     
-    def __init__(self, db_path: str = "polygon_cache.db", default_ttl: int = 30):
+    def __init__(self, db_path: str = "polygon_cache.db", default_ttl: int = 30,
+                 hot_cache_size: int = HOT_CACHE_SIZE):
         """Initialize the SQLite cache."""
         self.db_path = db_path
         self.default_ttl = default_ttl
+        
+        # In-memory LRU tier of (expires_at, result) so repeated lookups skip SQLite
+        self.hot_cache_size = hot_cache_size
+        self._hot: "OrderedDict[str, tuple]" = OrderedDict()
+        self._hot_lock = threading.Lock()
+        
+        # One long-lived connection per thread instead of a connect/close per operation
+        self._local = threading.local()
+        
+        # Access counts for hits are batched in memory so a read doesn't write
+        self._pending_access: Dict[str, Tuple[int, int]] = {}
+        self._access_lock = threading.Lock()
+        
+        # Hit/miss counters live in memory and are written back by a background
+        # worker, started on demand, that coalesces queued updates
+        self._hits = 0
+        self._misses = 0
+        self._stats_lock = threading.Lock()
+        self._stats_q: "queue.Queue[str]" = queue.Queue()
+        self._stats_thread: Optional[threading.Thread] = None
+        
         self._initialize_db()
     
+    def _conn(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection to the cache database, opening it on first use.
+        
+        Connections run in autocommit mode so no transaction is left open
+        between operations.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=STATEMENT_CACHE_SIZE
+            )
+            
+            # WAL needs a file; in-memory databases keep SQLite's defaults
+            if self.db_path != ':memory:':
+                for pragma in SQLITE_PRAGMAS:
+                    conn.execute(pragma)
+            
+            self._local.conn = conn
+        return conn
+    
+    def close(self) -> None:
+        """Close the calling thread's connection, if it has one."""
+        self._flush_access()
+        self._flush_stats()
+        
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
     def _initialize_db(self) -> None:
         """Initialize the database tables if they don't exist."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn()
             cursor = conn.cursor()
             
             # Create cache table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS nominatim_cache (
                     query_key TEXT PRIMARY KEY,
-                    result TEXT NOT NULL,
+                    result BLOB NOT NULL,
                     created_at INTEGER NOT NULL,
                     expires_at INTEGER NOT NULL,
                     access_count INTEGER DEFAULT 0,
@@ -62,8 +147,6 @@ class SQLiteCache:
                 CREATE INDEX IF NOT EXISTS idx_expires_at ON nominatim_cache(expires_at)
             """)
             
-            conn.commit()
-            conn.close()
             logger.info(f"Initialized cache database at {self.db_path}")
         except sqlite3.Error as e:
             logger.error(f"Error initializing cache database: {str(e)}")
@@ -75,95 +158,207 @@ class SQLiteCache:
         
         Args:
             query_key: The cache key to look up.
-            
+        
         Returns:
             The cached result, or None if not found or expired.
         """
+        # Serve recently used results from memory
+        with self._hot_lock:
+            entry = self._hot.get(query_key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    self._hot.move_to_end(query_key)
+                else:
+                    del self._hot[query_key]
+                    entry = None
+        
+        if entry is not None:
+            self._record_access(query_key)
+            return entry[1]
+        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             # Get the cached result
-            cursor.execute("""
-                SELECT result, expires_at FROM nominatim_cache
-                WHERE query_key = ? AND expires_at > ?
-            """, (query_key, int(time.time())))
-            
-            row = cursor.fetchone()
+            row = self._conn().execute(SQL_GET, (query_key, int(time.time()))).fetchone()
             
             if row:
                 result_json, expires_at = row
                 
                 # Update access statistics
-                cursor.execute("""
-                    UPDATE nominatim_cache
-                    SET access_count = access_count + 1,
-                        last_accessed_at = ?
-                    WHERE query_key = ?
-                """, (int(time.time()), query_key))
-                
-                conn.commit()
-                conn.close()
+                self._record_access(query_key)
                 
                 # Parse and return the result
                 try:
-                    return json.loads(result_json)
-                except json.JSONDecodeError:
+                    result = loads(unpack(result_json))
+                except ValueError:
                     logger.error(f"Invalid JSON in cache for key: {query_key}")
                     return None
+                
+                self._remember(query_key, result, expires_at)
+                return result
             else:
-                conn.close()
                 return None
-                
+        
         except sqlite3.Error as e:
             logger.error(f"Error retrieving from cache: {str(e)}")
             return None
     
+    def get_blob_reader(self, query_key: str) -> Optional[BinaryIO]:
+        """
+        Open a file-like reader over a cached result's serialized JSON.
+        
+        The stored value is streamed (and decompressed) in chunks rather than
+        loaded whole, so a caller that only needs part of a large polygon, or
+        that feeds an incremental JSON parser, keeps memory use flat. Close the
+        reader when done; it is invalidated if the entry is overwritten.
+        
+        Args:
+            query_key: The cache key to look up.
+        
+        Returns:
+            A binary reader over the JSON bytes, or None if not found or expired.
+        """
+        try:
+            conn = self._conn()
+            row = conn.execute("""
+                SELECT rowid FROM nominatim_cache
+                WHERE query_key = ? AND expires_at > ?
+            """, (query_key, int(time.time()))).fetchone()
+            if row is None:
+                return None
+            
+            self._record_access(query_key)
+            
+            # Incremental BLOB I/O needs Python 3.11; older versions read the value in one go
+            if not hasattr(conn, 'blobopen'):
+                data = conn.execute(
+                    "SELECT result FROM nominatim_cache WHERE rowid = ?", (row[0],)
+                ).fetchone()[0]
+                data = unpack(data)
+                return io.BytesIO(data.encode('utf-8') if isinstance(data, str) else data)
+            
+            blob = conn.blobopen('nominatim_cache', 'result', row[0], readonly=True)
+            compressed = blob.read(len(ZSTD_MAGIC)) == ZSTD_MAGIC
+            blob.seek(0)
+            
+            if compressed:
+                if zstandard is None:
+                    blob.close()
+                    raise ValueError("zstandard is required to read compressed cache entries")
+                return zstandard.ZstdDecompressor().stream_reader(blob)
+            return blob
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error opening cached result: {str(e)}")
+            return None
+    
+    def _remember(self, query_key: str, result: Any, expires_at: int) -> None:
+        """Keep a result in the in-memory tier, evicting the least recently used."""
+        if self.hot_cache_size <= 0:
+            return
+        
+        with self._hot_lock:
+            self._hot[query_key] = (expires_at, result)
+            self._hot.move_to_end(query_key)
+            while len(self._hot) > self.hot_cache_size:
+                self._hot.popitem(last=False)
+    
+    def _forget(self, query_keys: Iterable[str]) -> None:
+        """Drop results from the in-memory tier."""
+        with self._hot_lock:
+            for query_key in query_keys:
+                self._hot.pop(query_key, None)
+    
+    def _record_access(self, query_key: str) -> None:
+        """Count a hit in memory, writing counts back every ACCESS_FLUSH_INTERVAL hits."""
+        with self._access_lock:
+            count, _ = self._pending_access.get(query_key, (0, 0))
+            self._pending_access[query_key] = (count + 1, int(time.time()))
+            due = len(self._pending_access) >= ACCESS_FLUSH_INTERVAL
+        
+        if due:
+            self._flush_access()
+    
+    def _flush_access(self) -> None:
+        """Write the access counts held in memory back to the cache table."""
+        with self._access_lock:
+            pending = self._pending_access
+            self._pending_access = {}
+        
+        if not pending:
+            return
+        
+        try:
+            conn = self._conn()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(SQL_RECORD_ACCESS, [
+                    (count, accessed_at, key) for key, (count, accessed_at) in pending.items()
+                ])
+        except sqlite3.Error as e:
+            logger.error(f"Error updating access counts: {str(e)}")
+    
     def set(self, query_key: str, result: Any, ttl: Optional[int] = None) -> bool:
         """
         Store a result in the cache.
         
+        A thin wrapper around `set_many([(query_key, result, ttl)])`.
+        
         Args:
             query_key: The cache key to store under.
             result: The result to cache.
             ttl: Time-to-live in days, or None to use the default.
-            
+        
         Returns:
             True if successful, False otherwise.
         """
-        try:
+        return self.set_many([(query_key, result, ttl)]) == 1
+    
+    def set_many(self, items: Iterable[Tuple[str, Any, Optional[int]]]) -> int:
+        """
+        Store several results in the cache in a single transaction.
+        
+        Args:
+            items: (query_key, result, ttl) tuples. A ttl of None uses the default.
+        
+        Returns:
+            Number of results stored. Results that can't be serialized are skipped.
+        """
+        now = int(time.time())
+        rows = []
+        stored = []
+        for query_key, result, ttl in items:
             ttl_days = ttl if ttl is not None else self.default_ttl
-            now = int(time.time())
             expires_at = now + (ttl_days * 86400)  # Convert days to seconds
             
             # Serialize the result to JSON
             try:
-                result_json = json.dumps(result)
+                rows.append((query_key, pack(dumps(result)), now, expires_at))
+                stored.append((query_key, result, expires_at))
             except (TypeError, ValueError) as e:
                 logger.error(f"Error serializing result to JSON: {str(e)}")
-                return False
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        
+        if not rows:
+            return 0
+        
+        try:
+            conn = self._conn()
             
-            # Store the result
-            cursor.execute("""
-                INSERT OR REPLACE INTO nominatim_cache
-                (query_key, result, created_at, expires_at, access_count, last_accessed_at)
-                VALUES (?, ?, ?, ?, 0, NULL)
-            """, (query_key, result_json, now, expires_at))
+            # Store the results with one commit
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(SQL_SET, rows)
             
-            conn.commit()
-            conn.close()
+            for query_key, result, expires_at in stored:
+                self._remember(query_key, result, expires_at)
             
             # Update statistics asynchronously
             self._update_stats_async()
             
-            return True
-            
+            return len(rows)
+        
         except sqlite3.Error as e:
             logger.error(f"Error storing in cache: {str(e)}")
-            return False
+            return 0
     
     def invalidate(self, query_key: str) -> bool:
         """
@@ -171,25 +366,22 @@ class SQLiteCache:
         
         Args:
             query_key: The cache key to invalidate.
-            
+        
         Returns:
             True if successful, False otherwise.
         """
+        self._forget([query_key])
+        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("DELETE FROM nominatim_cache WHERE query_key = ?", (query_key,))
-            deleted = cursor.rowcount > 0
-            
-            conn.commit()
-            conn.close()
+            deleted = bool(self._conn().execute(
+                "DELETE FROM nominatim_cache WHERE query_key = ? RETURNING 1", (query_key,)
+            ).fetchall())
             
             if deleted:
                 logger.debug(f"Invalidated cache entry: {query_key}")
             
             return deleted
-            
+        
         except sqlite3.Error as e:
             logger.error(f"Error invalidating cache: {str(e)}")
             return False
@@ -202,21 +394,23 @@ class SQLiteCache:
             Number of entries cleared.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn()
             cursor = conn.cursor()
             
-            cursor.execute("DELETE FROM nominatim_cache WHERE expires_at <= ?", (int(time.time()),))
-            cleared = cursor.rowcount
-            
-            conn.commit()
-            conn.close()
+            cursor.execute(
+                "DELETE FROM nominatim_cache WHERE expires_at <= ? RETURNING query_key",
+                (int(time.time()),)
+            )
+            cleared_keys = [row[0] for row in cursor.fetchall()]
+            cleared = len(cleared_keys)
+            self._forget(cleared_keys)
             
             if cleared > 0:
                 logger.info(f"Cleared {cleared} expired cache entries")
                 self._update_stats_async()
             
             return cleared
-            
+        
         except sqlite3.Error as e:
             logger.error(f"Error clearing expired cache: {str(e)}")
             return 0
@@ -229,19 +423,19 @@ class SQLiteCache:
             True if successful, False otherwise.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn()
             cursor = conn.cursor()
             
             cursor.execute("DELETE FROM nominatim_cache")
             
-            conn.commit()
-            conn.close()
+            with self._hot_lock:
+                self._hot.clear()
             
             logger.info("Cleared all cache entries")
             self._update_stats_async()
             
             return True
-            
+        
         except sqlite3.Error as e:
             logger.error(f"Error clearing cache: {str(e)}")
             return False
@@ -253,40 +447,35 @@ class SQLiteCache:
         Returns:
             Dictionary of cache statistics.
         """
+        # Write back access counts and hit/miss counters still held in memory
+        self._flush_access()
+        self._flush_stats()
+        
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn()
             cursor = conn.cursor()
             
-            # Get statistics
-            stats = {}
-            
-            # Total entries
-            cursor.execute("SELECT COUNT(*) FROM nominatim_cache")
-            stats['total_entries'] = cursor.fetchone()[0]
-            
-            # Total size
-            cursor.execute("SELECT SUM(LENGTH(result)) FROM nominatim_cache")
-            size_bytes = cursor.fetchone()[0] or 0
-            stats['total_size_bytes'] = size_bytes
-            stats['total_size_mb'] = round(size_bytes / (1024 * 1024), 2)
-            
-            # Expired entries
-            cursor.execute("SELECT COUNT(*) FROM nominatim_cache WHERE expires_at <= ?", (int(time.time()),))
-            stats['expired_entries'] = cursor.fetchone()[0]
-            
-            # Hit rate (from stored stats)
-            cursor.execute("SELECT stat_value FROM cache_stats WHERE stat_key = 'hit_rate'")
-            row = cursor.fetchone()
-            stats['hit_rate'] = float(row[0]) if row else 0.0
-            
-            # Hit count and miss count
-            cursor.execute("SELECT stat_value FROM cache_stats WHERE stat_key = 'hit_count'")
-            row = cursor.fetchone()
-            stats['hit_count'] = int(row[0]) if row else 0
-            
-            cursor.execute("SELECT stat_value FROM cache_stats WHERE stat_key = 'miss_count'")
-            row = cursor.fetchone()
-            stats['miss_count'] = int(row[0]) if row else 0
+            # Counts, sizes and stored counters in one round trip
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM nominatim_cache),
+                    (SELECT COALESCE(SUM(LENGTH(result)), 0) FROM nominatim_cache),
+                    (SELECT COUNT(*) FROM nominatim_cache WHERE expires_at <= ?),
+                    (SELECT stat_value FROM cache_stats WHERE stat_key = 'hit_rate'),
+                    (SELECT stat_value FROM cache_stats WHERE stat_key = 'hit_count'),
+                    (SELECT stat_value FROM cache_stats WHERE stat_key = 'miss_count')
+            """, (int(time.time()),))
+            total_entries, size_bytes, expired_entries, hit_rate, hit_count, miss_count = cursor.fetchone()
+            
+            stats = {
+                'total_entries': total_entries,
+                'total_size_bytes': size_bytes,
+                'total_size_mb': round(size_bytes / (1024 * 1024), 2),
+                'expired_entries': expired_entries,
+                'hit_rate': float(hit_rate) if hit_rate is not None else 0.0,
+                'hit_count': int(hit_count) if hit_count is not None else 0,
+                'miss_count': int(miss_count) if miss_count is not None else 0,
+            }
             
             # Most accessed entries
             cursor.execute("""
@@ -305,100 +494,118 @@ class SQLiteCache:
                 for row in cursor.fetchall()
             ]
             
-            conn.close()
-            
             return stats
-            
+        
         except sqlite3.Error as e:
             logger.error(f"Error getting cache stats: {str(e)}")
             return {'error': str(e)}
     
     def _update_stats_async(self) -> None:
         """Update cache statistics in the background."""
-        # In a real implementation, this would be done asynchronously.
-        # For simplicity, we'll do it synchronously.
+        self._stats_q.put('update')
+        
+        with self._stats_lock:
+            if self._stats_thread is None:
+                self._stats_thread = threading.Thread(
+                    target=self._stats_worker,
+                    name='sqlite-cache-stats',
+                    daemon=True
+                )
+                self._stats_thread.start()
+    
+    def _stats_worker(self) -> None:
+        """Write queued stats updates, batching those that arrive close together."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
+            while True:
+                self._stats_q.get()
+                
+                # Let further updates arrive, then write them all at once
+                time.sleep(STATS_FLUSH_SECONDS)
+                while True:
+                    try:
+                        self._stats_q.get_nowait()
+                    except queue.Empty:
+                        break
+                
+                self._flush_stats()
+                
+                # Exit when idle; _update_stats_async starts a new worker as needed
+                with self._stats_lock:
+                    if self._stats_q.empty():
+                        self._stats_thread = None
+                        return
+        finally:
+            # The worker's write connection is its own
+            self.close()
+    
+    def _flush_stats(self) -> None:
+        """Add the in-memory hit/miss counters to the stored totals and update the hit rate."""
+        with self._stats_lock:
+            hits, misses = self._hits, self._misses
+            self._hits = self._misses = 0
+        
+        if not hits and not misses:
+            return
+        
+        try:
+            conn = self._conn()
             now = int(time.time())
             
-            # Get current hit count and miss count
-            cursor.execute("SELECT stat_value FROM cache_stats WHERE stat_key = 'hit_count'")
-            row = cursor.fetchone()
-            hit_count = int(row[0]) if row else 0
-            
-            cursor.execute("SELECT stat_value FROM cache_stats WHERE stat_key = 'miss_count'")
-            row = cursor.fetchone()
-            miss_count = int(row[0]) if row else 0
-            
-            # Calculate hit rate
-            total_requests = hit_count + miss_count
-            hit_rate = hit_count / total_requests if total_requests > 0 else 0.0
-            
-            # Update statistics
-            cursor.execute("""
-                INSERT OR REPLACE INTO cache_stats (stat_key, stat_value, updated_at)
-                VALUES ('hit_rate', ?, ?)
-            """, (str(hit_rate), now))
-            
-            conn.commit()
-            conn.close()
-            
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                stored = dict(conn.execute("""
+                    SELECT stat_key, stat_value FROM cache_stats
+                    WHERE stat_key IN ('hit_count', 'miss_count')
+                """).fetchall())
+                
+                hit_count = int(stored.get('hit_count', 0)) + hits
+                miss_count = int(stored.get('miss_count', 0)) + misses
+                
+                # Calculate hit rate
+                total_requests = hit_count + miss_count
+                hit_rate = hit_count / total_requests if total_requests > 0 else 0.0
+                
+                conn.executemany("""
+                    INSERT OR REPLACE INTO cache_stats (stat_key, stat_value, updated_at)
+                    VALUES (?, ?, ?)
+                """, [
+                    ('hit_count', str(hit_count), now),
+                    ('miss_count', str(miss_count), now),
+                    ('hit_rate', str(hit_rate), now),
+                ])
+        
         except sqlite3.Error as e:
             logger.error(f"Error updating cache stats: {str(e)}")
     
     def record_hit(self) -> None:
         """Record a cache hit."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get current hit count
-            cursor.execute("SELECT stat_value FROM cache_stats WHERE stat_key = 'hit_count'")
-            row = cursor.fetchone()
-            hit_count = int(row[0]) if row else 0
-            
-            # Increment hit count
-            hit_count += 1
-            
-            # Update hit count
-            cursor.execute("""
-                INSERT OR REPLACE INTO cache_stats (stat_key, stat_value, updated_at)
-                VALUES ('hit_count', ?, ?)
-            """, (str(hit_count), int(time.time())))
-            
-            conn.commit()
-            conn.close()
-            
-        except sqlite3.Error as e:
-            logger.error(f"Error recording cache hit: {str(e)}")
+        with self._stats_lock:
+            self._hits += 1
+            first = self._hits + self._misses == 1
+        
+        # One queued update covers every hit/miss until the next flush
+        if first:
+            self._update_stats_async()
     
     def record_miss(self) -> None:
         """Record a cache miss."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get current miss count
-            cursor.execute("SELECT stat_value FROM cache_stats WHERE stat_key = 'miss_count'")
-            row = cursor.fetchone()
-            miss_count = int(row[0]) if row else 0
-            
-            # Increment miss count
-            miss_count += 1
-            
-            # Update miss count
-            cursor.execute("""
-                INSERT OR REPLACE INTO cache_stats (stat_key, stat_value, updated_at)
-                VALUES ('miss_count', ?, ?)
-            """, (str(miss_count), int(time.time())))
-            
-            conn.commit()
-            conn.close()
-            
-        except sqlite3.Error as e:
-            logger.error(f"Error recording cache miss: {str(e)}")
+        with self._stats_lock:
+            self._misses += 1
+            first = self._hits + self._misses == 1
+        
+        if first:
+            self._update_stats_async()
+
+# The default instance is created on first access (PEP 562) so importing the
+# package doesn't open a database
+_default_cache: Optional[SQLiteCache] = None
+_default_lock = threading.Lock()
 
-# Create a default instance
-default_cache = SQLiteCache()
+def __getattr__(name: str) -> Any:
+    if name == 'default_cache':
+        global _default_cache
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = SQLiteCache()
+        return _default_cache
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
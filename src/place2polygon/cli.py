@@ -7,27 +7,15 @@ finding their polygon boundaries, and visualizing them on a map.
 
 import os
 import sys
-import json
+import functools
 import logging
 import argparse
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Any, Callable, Optional, Tuple
 
-from place2polygon import (
-    __version__,
-    extract_locations,
-    find_polygon_boundaries,
-    find_polygons_with_gemini
-)
-from place2polygon.core import (
-    LocationExtractor,
-    NominatimClient,
-    BoundarySelector,
-    MapVisualizer
-)
-from place2polygon.gemini import GeminiOrchestrator, setup_google_credentials
 from place2polygon.utils import default_output_manager
-from place2polygon.cache import CacheManager
+from place2polygon.utils.geojson import COORD_PRECISION
+from place2polygon.utils.json_io import write_json
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +32,48 @@ def setup_logging(verbose: bool = False) -> None:
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+def read_text(path: str) -> str:
+    """
+    Read a UTF-8 text file with one read and one decode.
+    
+    Args:
+        path: Path to the file.
+    
+    Returns:
+        The file contents. Invalid UTF-8 bytes are replaced rather than raising.
+    """
+    return Path(path).read_bytes().decode('utf-8', errors='replace')
+
+@functools.lru_cache(maxsize=1)
+def _has_gemini() -> bool:
+    """Check once per process whether a Google API key is configured."""
+    return bool(os.environ.get("GOOGLE_API_KEY"))
+
+def track_progress(items: Iterable[Dict[str, Any]], total: int, description: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield items unchanged while showing a single progress bar on stderr.
+    
+    The bar is only drawn when stderr is a terminal; rich batches its
+    refreshes instead of writing a line per item.
+    
+    Args:
+        items: Location dictionaries to pass through.
+        total: Expected number of items.
+        description: Label shown next to the bar.
+    
+    Yields:
+        The items from `items`.
+    """
+    from rich.console import Console
+    from rich.progress import Progress
+    
+    console = Console(stderr=True)
+    with Progress(console=console, transient=True, disable=not console.is_terminal) as progress:
+        task = progress.add_task(description, total=total)
+        for item in items:
+            progress.update(task, advance=1, description=f"{description}: {item.get('name', '')}")
+            yield item
+
 def extract_command(args: argparse.Namespace) -> None:
     """
     Execute the extract command.
@@ -51,17 +81,17 @@ def extract_command(args: argparse.Namespace) -> None:
     Args:
         args: Command-line arguments.
     """
+    from place2polygon.core import default_extractor as extractor
+    
     # Set up logging
     setup_logging(args.verbose)
     
     # Read input file
     logger.info(f"Reading text from {args.input_file}")
-    with open(args.input_file, 'r', encoding='utf-8') as f:
-        text = f.read()
+    text = read_text(args.input_file)
     
     # Extract locations
     logger.info("Extracting locations from text")
-    extractor = LocationExtractor()
     locations = extractor.extract_locations(text)
     
     # Filter by minimum relevance score
@@ -82,8 +112,7 @@ def extract_command(args: argparse.Namespace) -> None:
     
     # Write output
     logger.info(f"Writing locations to {output_path}")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(locations, f, indent=2)
+    write_json(output_path, locations)
     
     logger.info(f"Extracted {len(locations)} locations")
 
@@ -94,22 +123,20 @@ def map_command(args: argparse.Namespace) -> None:
     Args:
         args: Command-line arguments.
     """
+    from place2polygon import DEFAULT_CONCURRENCY, find_polygons_with_gemini, iter_polygon_boundaries
+    from place2polygon.cache import default_manager
+    from place2polygon.core import default_client, default_extractor as extractor, default_selector, default_visualizer
+    
     # Set up logging
     setup_logging(args.verbose)
     
     # Read input file
     logger.info(f"Reading text from {args.input_file}")
-    with open(args.input_file, 'r', encoding='utf-8') as f:
-        text = f.read()
+    text = read_text(args.input_file)
     
-    # Extract locations
+    # Extract locations with contextual information in a single spaCy pass
     logger.info("Extracting locations from text")
-    extractor = LocationExtractor()
-    locations = extractor.extract_locations(text)
-    
-    # Filter by minimum relevance score
-    locations = [loc for loc in locations
-                if loc.get('relevance_score', 0) >= args.min_relevance]
+    locations = extractor.extract_and_enhance(text, min_relevance_score=args.min_relevance)
     
     if not locations:
         logger.warning("No relevant locations found in the text")
@@ -117,15 +144,20 @@ def map_command(args: argparse.Namespace) -> None:
     
     logger.info(f"Found {len(locations)} relevant locations")
     
-    # Add contextual information
-    locations = extractor.enhance_locations_with_context(locations, text)
+    # Find boundaries with the shared instances, so lookups reuse the
+    # default client's pooled connections and the shared cache connection
+    client = default_client
+    selector = default_selector
+    cache_manager = default_manager
+    concurrency = args.concurrency or DEFAULT_CONCURRENCY
     
-    # Find boundaries
-    client = NominatimClient()
-    selector = BoundarySelector()
-    cache_manager = CacheManager()
+    use_gemini = args.gemini and _has_gemini()
+    if args.gemini and not use_gemini:
+        logger.warning("GOOGLE_API_KEY is not set, using basic search instead of Gemini")
     
-    if args.gemini:
+    if use_gemini:
+        from place2polygon.gemini import GeminiOrchestrator
+        
         # Use Gemini API for searching
         logger.info("Using Gemini API for intelligent searches")
         try:
@@ -134,31 +166,37 @@ def map_command(args: argparse.Namespace) -> None:
                 locations, 
                 orchestrator=orchestrator,
                 cache_manager=cache_manager,
-                cache_ttl=args.cache_ttl
+                cache_ttl=args.cache_ttl,
+                concurrency=concurrency
             )
         except Exception as e:
             logger.error(f"Error using Gemini API: {str(e)}")
             logger.info("Falling back to basic search")
-            locations_with_boundaries = find_polygon_boundaries(
+            locations_with_boundaries = iter_polygon_boundaries(
                 locations,
                 client=client,
                 cache_manager=cache_manager,
                 selector=selector,
-                cache_ttl=args.cache_ttl
+                cache_ttl=args.cache_ttl,
+                concurrency=concurrency,
+                max_stale_days=args.max_stale_days
             )
     else:
-        # Use basic search
+        # Use basic search; lookups run concurrently and each location is
+        # added to the map as soon as its boundary is resolved
         logger.info("Using basic search for boundaries")
-        locations_with_boundaries = find_polygon_boundaries(
+        locations_with_boundaries = iter_polygon_boundaries(
             locations,
             client=client,
             cache_manager=cache_manager,
             selector=selector, 
-            cache_ttl=args.cache_ttl
+            cache_ttl=args.cache_ttl,
+            concurrency=concurrency,
+            max_stale_days=args.max_stale_days
         )
     
     # Create map
-    visualizer = MapVisualizer()
+    visualizer = default_visualizer
     
     # Generate output path
     if args.output:
@@ -167,10 +205,11 @@ def map_command(args: argparse.Namespace) -> None:
         output_path = str(default_output_manager.get_map_path())
     
     logger.info(f"Creating map at {output_path}")
-    visualizer.create_map(
-        locations_with_boundaries,
+    visualizer.create_map_from_iterator(
+        track_progress(locations_with_boundaries, len(locations), "Resolving boundaries"),
         title=args.title or "Place2Polygon Map",
-        output_path=output_path
+        output_path=output_path,
+        coord_precision=args.coord_precision if args.coord_precision >= 0 else None
     )
     
     logger.info(f"Map created at {output_path}")
@@ -185,12 +224,15 @@ def setup_gemini_command(args: argparse.Namespace) -> None:
     # Set up logging
     setup_logging(args.verbose)
     
+    from place2polygon.gemini import setup_google_credentials
+    
     # Set up Google credentials
     api_key = args.api_key
     if not api_key:
         api_key = input("Enter your Google API Key: ")
     
     setup_google_credentials(api_key, save=True)
+    _has_gemini.cache_clear()
     logger.info("Google credentials set up successfully")
 
 def version_command(args: argparse.Namespace) -> None:
@@ -200,6 +242,8 @@ def version_command(args: argparse.Namespace) -> None:
     Args:
         args: Command-line arguments.
     """
+    from place2polygon import __version__
+    
     print(f"Place2Polygon v{__version__}")
 
 def list_outputs_command(args: argparse.Namespace) -> None:
@@ -224,8 +268,7 @@ def list_outputs_command(args: argparse.Namespace) -> None:
     
     # Display outputs
     print(f"Found {len(output_files)} output files:")
-    for file_path in output_files:
-        print(f"  {file_path}")
+    print("\n".join(f"  {file_path}" for file_path in output_files))
 
 def cleanup_command(args: argparse.Namespace) -> None:
     """
@@ -245,8 +288,26 @@ def cleanup_command(args: argparse.Namespace) -> None:
     
     print(f"Deleted {deleted_count} old files.")
 
-def main() -> None:
-    """Main entry point for the CLI."""
+# Subcommand name -> handler
+COMMANDS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    "extract": extract_command,
+    "map": map_command,
+    "setup_gemini": setup_gemini_command,
+    "version": version_command,
+    "list": list_outputs_command,
+    "cleanup": cleanup_command,
+}
+
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+    
+    The parser is built once per process and reused by later calls.
+    
+    Returns:
+        The argument parser with all subcommands.
+    """
     parser = argparse.ArgumentParser(
         description="Extract locations from text and find their polygon boundaries."
     )
@@ -308,6 +369,24 @@ def main() -> None:
         type=int,
         help="Cache time-to-live in days."
     )
+    map_parser.add_argument(
+        "--max-stale-days",
+        type=float,
+        help="Use cached boundaries up to this many days past expiry, refreshing them in the background."
+    )
+    map_parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        help="Maximum number of boundary lookups in flight at once. Requests are "
+             "still rate limited per endpoint. Default: 4"
+    )
+    map_parser.add_argument(
+        "--coord-precision",
+        type=int,
+        default=COORD_PRECISION,
+        help="Decimal places kept in map coordinates (5 is about 1 m); -1 keeps "
+             "the precision of the resolved boundaries. Default: 5"
+    )
     map_parser.add_argument(
         "--gemini", "-g",
         action="store_true",
@@ -385,22 +464,19 @@ def main() -> None:
         help="Enable verbose logging."
     )
     
+    return parser
+
+def main() -> None:
+    """Main entry point for the CLI."""
+    parser = build_parser()
+    
     # Parse arguments
     args = parser.parse_args()
     
     # Execute command
-    if args.command == "extract":
-        extract_command(args)
-    elif args.command == "map":
-        map_command(args)
-    elif args.command == "setup_gemini":
-        setup_gemini_command(args)
-    elif args.command == "version":
-        version_command(args)
-    elif args.command == "list":
-        list_outputs_command(args)
-    elif args.command == "cleanup":
-        cleanup_command(args)
+    handler = COMMANDS.get(args.command)
+    if handler:
+        handler(args)
     else:
         parser.print_help()
 
@@ -2,10 +2,8 @@
 Core modules for the Place2Polygon package.
 """
 
-from place2polygon.core.location_extractor import LocationExtractor, default_extractor
-from place2polygon.core.nominatim_client import NominatimClient, default_client
-from place2polygon.core.boundary_selector import BoundarySelector, default_selector
-from place2polygon.core.map_visualizer import MapVisualizer, default_visualizer
+import importlib
+from typing import Any
 
 __all__ = [
     'LocationExtractor',
@@ -17,3 +15,22 @@ __all__ = [
     'MapVisualizer',
     'default_visualizer',
 ]
+
+# Submodule defining each public name; they are imported on first access so
+# that spaCy and folium are only loaded by code that uses them
+_SUBMODULES = {
+    'LocationExtractor': 'location_extractor',
+    'default_extractor': 'location_extractor',
+    'NominatimClient': 'nominatim_client',
+    'default_client': 'nominatim_client',
+    'BoundarySelector': 'boundary_selector',
+    'default_selector': 'boundary_selector',
+    'MapVisualizer': 'map_visualizer',
+    'default_visualizer': 'map_visualizer',
+}
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{_SUBMODULES[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
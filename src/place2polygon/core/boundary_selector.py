@@ -7,6 +7,8 @@ when multiple administrative boundaries are found for nested locations.
 """
 
 from typing import Dict, List, Optional, Any, Union, Tuple
+import functools
+import heapq
 import logging
 import json
 
@@ -23,6 +25,37 @@ US_ADMIN_LEVELS = {
     10: "neighborhood/district"
 }
 
+# Geometry types that count as a displayable boundary
+POLYGON_TYPES = frozenset({'Polygon', 'MultiPolygon'})
+
+# Map location types (lowercase) to the admin levels they correspond to
+TYPE_TO_ADMIN_LEVELS = {
+    'country': (2,),
+    'state': (4,),
+    'province': (4,),
+    'county': (6,),
+    'parish': (6,),
+    'borough': (6,),
+    'city': (8,),
+    'town': (8,),
+    'village': (8,),
+    'municipality': (8,),
+    'neighborhood': (10,),
+    'district': (10,),
+    'quarter': (10,)
+}
+
+# Levels tried for location types not in TYPE_TO_ADMIN_LEVELS
+DEFAULT_TARGET_ADMIN_LEVELS = (4, 6, 8, 10)
+
+@functools.lru_cache(maxsize=64)
+def _target_admin_levels(location_type: str) -> Tuple[int, ...]:
+    """Get the admin levels matching a location type (case-insensitive)."""
+    return TYPE_TO_ADMIN_LEVELS.get(location_type.lower(), DEFAULT_TARGET_ADMIN_LEVELS)
+
+# Address keys that carry an OSM admin level, probed directly instead of scanning every key
+_ADMIN_KEYS = tuple((f'admin_level_{level}', level) for level in range(1, 12))
+
 class BoundarySelector:
     """
     Select the most appropriate boundary for display from multiple options.
@@ -68,17 +101,18 @@ class BoundarySelector:
         
         # Filter by location type if specified
         if location_type:
-            target_levels = self._get_target_admin_levels(location_type)
+            target_levels = _target_admin_levels(location_type)
             if target_levels:
                 filtered = [(r, level) for r, level in with_levels if level in target_levels]
                 if filtered:
                     with_levels = filtered
         
-        # Sort by admin level (ascending = larger areas first, descending = smaller areas first)
-        with_levels.sort(key=lambda x: x[1], reverse=self.prefer_smaller)
+        # Take the top results by admin level (ascending = larger areas first,
+        # descending = smaller areas first) without sorting the whole list
+        sign = -1 if self.prefer_smaller else 1
+        top = heapq.nsmallest(self.max_results, with_levels, key=lambda x: sign * x[1])
         
-        # Return the top results
-        return [r for r, _ in with_levels[:self.max_results]]
+        return [r for r, _ in top]
     
     def _has_valid_polygon(self, result: Dict[str, Any]) -> bool:
         """
@@ -90,17 +124,12 @@ class BoundarySelector:
         Returns:
             True if the result has a valid polygon, False otherwise.
         """
-        # Check for GeoJSON polygon
-        if 'geojson' in result:
-            geojson = result['geojson']
-            if not validate_geojson(geojson):
-                return False
-            
-            # Check if it's a polygon type
-            polygon_types = ['Polygon', 'MultiPolygon']
-            return geojson.get('type') in polygon_types
+        # Check the geometry type first; points and lines never need full validation
+        geojson = result.get('geojson')
+        if not isinstance(geojson, dict) or geojson.get('type') not in POLYGON_TYPES:
+            return False
         
-        return False
+        return validate_geojson(geojson)
     
     def _get_admin_level(self, result: Dict[str, Any]) -> int:
         """
@@ -113,14 +142,11 @@ class BoundarySelector:
             The administrative level (2-10) or a default value.
         """
         # Try to get from address
-        if 'address' in result:
-            for key in result['address']:
-                if key.startswith('admin_level_'):
-                    level_str = key.replace('admin_level_', '')
-                    try:
-                        return int(level_str)
-                    except ValueError:
-                        pass
+        address = result.get('address')
+        if address:
+            for key, level in _ADMIN_KEYS:
+                if key in address:
+                    return level
         
         # Try to get from extratags
         if 'extratags' in result and 'admin_level' in result['extratags']:
@@ -156,30 +182,8 @@ class BoundarySelector:
         Returns:
             List of administrative levels that match the location type.
         """
-        # Map location types to admin levels
-        type_to_level = {
-            'country': [2],
-            'state': [4],
-            'province': [4],
-            'county': [6],
-            'parish': [6],
-            'borough': [6],
-            'city': [8],
-            'town': [8],
-            'village': [8],
-            'municipality': [8],
-            'neighborhood': [10],
-            'district': [10],
-            'quarter': [10]
-        }
-        
-        # Get the level for the specified type (case-insensitive)
-        for key, levels in type_to_level.items():
-            if location_type.lower() == key.lower():
-                return levels
-        
-        # For unknown types, return a wide range
-        return [4, 6, 8, 10]
+        # Unknown types get a wide range of levels
+        return list(_target_admin_levels(location_type))
     
     def get_nested_hierarchy(self, results: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -223,6 +227,7 @@ class BoundarySelector:
         for result in results:
             if 'geojson' in result:
                 geojson = result['geojson']
+                level = self._get_admin_level(result)
                 
                 # Create a feature from the geometry
                 feature = {
@@ -230,8 +235,8 @@ class BoundarySelector:
                     "properties": {
                         "name": result.get('display_name', ''),
                         "osm_id": result.get('osm_id', ''),
-                        "admin_level": self._get_admin_level(result),
-                        "type": US_ADMIN_LEVELS.get(self._get_admin_level(result), "unknown")
+                        "admin_level": level,
+                        "type": US_ADMIN_LEVELS.get(level, "unknown")
                     },
                     "geometry": geojson
                 }
@@ -5,12 +5,16 @@ This module uses spaCy's Named Entity Recognition (NER) to extract location ment
 text and provides functionality to analyze their relevance and context.
 """
 
+import functools
+import os
 import re
 import string
+import threading
 from typing import Dict, List, Optional, Any, Tuple, Set
 from collections import Counter
 import logging
 
+import numpy as np
 import spacy
 from spacy.tokens import Doc, Span, Token
 
@@ -50,6 +54,81 @@ LOCATION_TYPE_INDICATORS = {
     'water': ['lake', 'river', 'ocean', 'sea', 'bay', 'gulf']
 }
 
+# Every indicator, mapped to its type and that type's position in
+# LOCATION_TYPE_INDICATORS (earlier types win when several match)
+_INDICATOR_TYPES = {
+    indicator: (rank, loc_type)
+    for rank, (loc_type, indicators) in enumerate(LOCATION_TYPE_INDICATORS.items())
+    for indicator in indicators
+}
+
+# Finds all indicators, including overlapping ones, in a single scan
+_INDICATOR_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(indicator) for indicator in sorted(_INDICATOR_TYPES, key=len, reverse=True)) + '))'
+)
+
+# Pipeline components whose output the extractor never reads; only entities
+# and sentence boundaries are used
+UNUSED_PIPES = ('tagger', 'parser', 'attribute_ruler', 'lemmatizer')
+SENTENCE_PIPES = ('parser', 'senter', 'sentencizer')
+
+@functools.lru_cache(maxsize=1)
+def _load_nlp(model_name: str) -> spacy.language.Language:
+    """
+    Load a spaCy model once per process and share it between extractors.
+    
+    Components listed in UNUSED_PIPES are disabled. If that removes the
+    dependency parser, a rule-based sentencizer takes over sentence splitting.
+    
+    Args:
+        model_name: The spaCy model name to load.
+    
+    Returns:
+        The loaded spaCy model.
+    """
+    nlp = spacy.load(model_name)
+    
+    unused = [name for name in UNUSED_PIPES if name in nlp.pipe_names]
+    if unused:
+        nlp.select_pipes(disable=unused)
+    if not any(name in nlp.pipe_names for name in SENTENCE_PIPES):
+        nlp.add_pipe('sentencizer', before='ner' if 'ner' in nlp.pipe_names else None)
+    
+    return nlp
+
+MAX_CONTEXT_SENTENCES = 3  # Context sentences kept per location
+
+# Long texts are processed in paragraph-aligned chunks batched through nlp.pipe
+CHUNK_CHARS = 100_000
+PIPE_BATCH_SIZE = 32
+
+def _chunk_text(text: str, target: int = CHUNK_CHARS) -> List[Tuple[int, str]]:
+    """
+    Split text into chunks of about `target` characters at paragraph breaks.
+    
+    A chunk never crosses a blank line, so a paragraph longer than `target`
+    becomes a chunk of its own.
+    
+    Args:
+        text: The text to split.
+        target: Preferred maximum chunk length in characters.
+    
+    Returns:
+        List of (character offset, chunk text) pairs.
+    """
+    chunks = []
+    start = 0
+    while len(text) - start > target:
+        split = text.rfind('\n\n', start, start + target)
+        if split <= start:
+            split = text.find('\n\n', start + target)
+            if split == -1:
+                break
+        chunks.append((start, text[start:split]))
+        start = split + 2
+    chunks.append((start, text[start:]))
+    return chunks
+
 class LocationExtractor:
     """
     Extract location mentions from text using spaCy NER.
@@ -65,6 +144,11 @@ class LocationExtractor:
         self.min_relevance_score = min_relevance_score
         self.nlp = self._load_model()
         
+        # The (text, parsed docs) pair from the last extract_locations call, so a
+        # following enhance_locations_with_context on the same text parses it only
+        # once; it is released as soon as enhance_locations_with_context runs
+        self._last_parse: Optional[Tuple[str, List[Tuple[int, Doc]]]] = None
+    
     def _load_model(self) -> spacy.language.Language:
         """
         Load and configure the spaCy model.
@@ -73,7 +157,7 @@ class LocationExtractor:
             The loaded spaCy model.
         """
         try:
-            nlp = spacy.load(self.model_name)
+            nlp = _load_nlp(self.model_name)
             logger.info(f"Loaded spaCy model: {self.model_name}")
             return nlp
         except OSError:
@@ -81,13 +165,15 @@ class LocationExtractor:
             logger.info("Please install the model with: python -m spacy download en_core_web_sm")
             raise
     
-    def extract_locations(self, text: str) -> List[Dict[str, Any]]:
+    def extract_locations(self, text: str, min_relevance_score: Optional[float] = None) -> List[Dict[str, Any]]:
         """
         Extract locations from text with metadata.
         
         Args:
             text: The text to extract locations from.
-            
+            min_relevance_score: Minimum relevance score for returned locations.
+                If None, uses the extractor's configured minimum.
+        
         Returns:
             A list of dictionaries containing location data and metadata.
         """
@@ -96,10 +182,107 @@ class LocationExtractor:
             return []
         
         # Process the text with spaCy
-        doc = self.nlp(text)
+        parsed = self._parse(text)
+        self._last_parse = (text, parsed)
+        return self._extract_from_docs(parsed, len(text), min_relevance_score)
+    
+    def extract_locations_batch(
+        self,
+        texts: List[str],
+        min_relevance_score: Optional[float] = None,
+        batch_size: int = PIPE_BATCH_SIZE,
+        n_process: int = 1
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Extract locations from many texts, streaming them through `nlp.pipe` in batches.
+        
+        Args:
+            texts: The texts to extract locations from.
+            min_relevance_score: Minimum relevance score for returned locations.
+                If None, uses the extractor's configured minimum.
+            batch_size: Number of texts spaCy processes per batch.
+            n_process: Number of processes spaCy uses; -1 uses all CPU cores.
+        
+        Returns:
+            One list of location dictionaries per text, in input order.
+        """
+        texts = [text if isinstance(text, str) else '' for text in texts]
+        
+        # Long texts are chunked by _parse; everything else shares one pipe
+        docs = iter(self.nlp.pipe(
+            (text for text in texts if len(text) <= CHUNK_CHARS),
+            batch_size=batch_size,
+            n_process=n_process
+        ))
+        
+        results = []
+        for text in texts:
+            parsed = [(0, next(docs))] if len(text) <= CHUNK_CHARS else self._parse(text)
+            results.append(self._extract_from_docs(parsed, len(text), min_relevance_score) if text else [])
+        return results
+    
+    def extract_and_enhance(self, text: str, min_relevance_score: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Extract locations and add context information from a single spaCy pass.
+        
+        Equivalent to `extract_locations` followed by `enhance_locations_with_context`,
+        but the text is only parsed once.
+        
+        Args:
+            text: The text to extract locations from.
+            min_relevance_score: Minimum relevance score for returned locations.
+                If None, uses the extractor's configured minimum.
+        
+        Returns:
+            A list of enhanced location dictionaries.
+        """
+        if not text or not isinstance(text, str):
+            logger.warning("No text provided for location extraction")
+            return []
+        
+        parsed = self._parse(text)
+        locations = self._extract_from_docs(parsed, len(text), min_relevance_score)
+        return self._add_context(locations, [doc for _, doc in parsed])
+    
+    def _parse(self, text: str) -> List[Tuple[int, Doc]]:
+        """
+        Process text with spaCy, batching paragraph-aligned chunks through `nlp.pipe` when it is long.
+        
+        Args:
+            text: The text to process.
+        
+        Returns:
+            List of (character offset, document) pairs covering the text.
+        """
+        if len(text) <= CHUNK_CHARS:
+            return [(0, self.nlp(text))]
+        
+        chunks = _chunk_text(text)
+        docs = self.nlp.pipe((chunk for _, chunk in chunks), batch_size=PIPE_BATCH_SIZE)
+        return [(offset, doc) for (offset, _), doc in zip(chunks, docs)]
+    
+    def _extract_from_docs(
+        self,
+        parsed: List[Tuple[int, Doc]],
+        text_length: int,
+        min_relevance_score: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract locations from already processed text.
         
+        Args:
+            parsed: (character offset, document) pairs from `_parse`.
+            text_length: Length of the full text in characters.
+            min_relevance_score: Minimum relevance score for returned locations.
+        
+        Returns:
+            A list of dictionaries containing location data and metadata.
+        """
         # Extract location entities (GPE = Geopolitical Entity, LOC = Location)
-        location_ents = [ent for ent in doc.ents if ent.label_ in ('GPE', 'LOC')]
+        location_ents = [
+            (offset, doc, ent) for offset, doc in parsed
+            for ent in doc.ents if ent.label_ in ('GPE', 'LOC')
+        ]
         
         if not location_ents:
             logger.info("No location entities found in the text")
@@ -107,7 +290,7 @@ class LocationExtractor:
         
         # Get unique locations (ignoring duplicates for now)
         unique_locations = {}
-        for ent in location_ents:
+        for offset, doc, ent in location_ents:
             location_name = self._normalize_location_name(ent.text)
             if location_name not in unique_locations and validate_location_name(location_name):
                 location_type = self._determine_location_type(ent, doc)
@@ -115,8 +298,8 @@ class LocationExtractor:
                     'name': location_name,
                     'original_name': ent.text,
                     'type': location_type,
-                    'char_start': ent.start_char,
-                    'char_end': ent.end_char,
+                    'char_start': offset + ent.start_char,
+                    'char_end': offset + ent.end_char,
                     'sentence': ent.sent.text.strip(),
                     'occurrences': 1,
                     'mentions': [ent.text],
@@ -130,15 +313,17 @@ class LocationExtractor:
         
         # Convert to list and calculate relevance scores
         locations = list(unique_locations.values())
-        self._calculate_relevance_scores(locations, doc)
-        
-        # Filter by minimum relevance score
-        locations = [loc for loc in locations if loc['relevance_score'] >= self.min_relevance_score]
+        self._calculate_relevance_scores(locations, parsed[0][1], doc_length=text_length)
         
-        # Sort by relevance score (descending)
-        locations.sort(key=lambda x: x['relevance_score'], reverse=True)
+        # Filter by minimum relevance score and sort by relevance score (descending)
+        if min_relevance_score is None:
+            min_relevance_score = self.min_relevance_score
         
-        return locations
+        return sorted(
+            (loc for loc in locations if loc['relevance_score'] >= min_relevance_score),
+            key=lambda x: x['relevance_score'],
+            reverse=True
+        )
     
     def _normalize_location_name(self, name: str) -> str:
         """
@@ -146,7 +331,7 @@ class LocationExtractor:
         
         Args:
             name: The location name to normalize.
-            
+        
         Returns:
             The normalized location name.
         """
@@ -155,15 +340,17 @@ class LocationExtractor:
         name = name.strip(string.punctuation)
         
         # Check if it's a US state abbreviation
-        if name.upper() in US_STATES:
-            return US_STATES[name.upper()]
+        state_name = US_STATES.get(name.upper())
+        if state_name:
+            return state_name
         
         # Expand state abbreviations in combined names (e.g., "Portland, OR")
         parts = name.split(',')
         if len(parts) == 2:
             city, state = parts[0].strip(), parts[1].strip()
-            if state.upper() in US_STATES:
-                return f"{city}, {US_STATES[state.upper()]}"
+            state_name = US_STATES.get(state.upper())
+            if state_name:
+                return f"{city}, {state_name}"
         
         return name
     
@@ -174,12 +361,13 @@ class LocationExtractor:
         Args:
             entity: The spaCy entity span.
             doc: The spaCy document.
-            
+        
         Returns:
             The location type (city, county, state, etc.).
         """
         # Check if it's a US state
-        if entity.text in US_STATES.values() or entity.text.upper() in US_STATES:
+        # Both are dict lookups; US_STATE_ABBREVS is keyed by full state name
+        if entity.text in US_STATE_ABBREVS or entity.text.upper() in US_STATES:
             return 'state'
         
         # Look for type indicators in the surrounding context
@@ -187,11 +375,17 @@ class LocationExtractor:
         context_end = min(len(doc), entity.end + 5)
         context = doc[context_start:context_end].text.lower()
         
-        for loc_type, indicators in LOCATION_TYPE_INDICATORS.items():
-            for indicator in indicators:
-                # Check for patterns like "X County" or "County of X"
-                if f"{entity.text} {indicator}".lower() in context or f"{indicator} of {entity.text}".lower() in context:
-                    return loc_type
+        # Scan the context once for indicators forming "X County" or "County of X"
+        name = entity.text.lower()
+        before, after = f"{name} ", f" of {name}"
+        best = None
+        for match in _INDICATOR_PATTERN.finditer(context):
+            indicator = match.group(1)
+            start = match.start()
+            if context.endswith(before, 0, start) or context.startswith(after, start + len(indicator)):
+                best = min(best or _INDICATOR_TYPES[indicator], _INDICATOR_TYPES[indicator])
+        if best:
+            return best[1]
         
         # Default types based on entity label
         if entity.label_ == 'GPE':
@@ -202,51 +396,57 @@ class LocationExtractor:
         
         return 'unknown'
     
-    def _calculate_relevance_scores(self, locations: List[Dict[str, Any]], doc: Doc) -> None:
+    def _calculate_relevance_scores(
+        self,
+        locations: List[Dict[str, Any]],
+        doc: Doc,
+        doc_length: Optional[int] = None
+    ) -> None:
         """
         Calculate relevance scores for locations based on various factors.
         
         Args:
             locations: List of location dictionaries.
             doc: The spaCy document.
-            
+            doc_length: Length of the full text, if `doc` covers only part of it.
+        
         Modifies the location dictionaries in place, adding a 'relevance_score' key.
         """
-        # Get total number of locations
-        total_locations = len(locations)
-        max_occurrences = max([loc['occurrences'] for loc in locations]) if locations else 1
+        if not locations:
+            return
+        
+        count = len(locations)
+        occurrences = np.fromiter((loc['occurrences'] for loc in locations), dtype=np.float64, count=count)
+        char_starts = np.fromiter((loc['char_start'] for loc in locations), dtype=np.float64, count=count)
+        known_types = np.fromiter((loc['type'] != 'unknown' for loc in locations), dtype=bool, count=count)
         
         # Calculate document sections (beginning, middle, end)
-        doc_length = len(doc.text)
+        if doc_length is None:
+            doc_length = len(doc.text)
         beginning_section = doc_length * 0.25
         ending_section = doc_length * 0.75
         
-        for location in locations:
-            # Base score starts at 50
-            score = 50.0
-            
-            # Adjust based on frequency (up to +20)
-            frequency_score = (location['occurrences'] / max_occurrences) * 20
-            score += frequency_score
-            
-            # Position bonus (up to +15)
-            char_start = location['char_start']
-            if char_start < beginning_section:
-                # Locations mentioned at the beginning get a bigger bonus
-                position_score = 15.0 * (1 - (char_start / beginning_section))
-            elif char_start > ending_section:
-                # Locations in conclusion get a moderate bonus
-                position_score = 10.0 * ((char_start - ending_section) / (doc_length - ending_section))
-            else:
-                # Locations in the middle get a smaller bonus
-                position_score = 5.0
-            score += position_score
-            
-            # Known location type bonus (up to +10)
-            if location['type'] != 'unknown':
-                score += 10.0
-            
-            # Cap at 100
+        # Base score starts at 50, adjusted based on frequency (up to +20)
+        scores = 50.0 + occurrences / occurrences.max() * 20
+        
+        # Position bonus (up to +15): locations mentioned at the beginning get a
+        # bigger bonus, those in the conclusion a moderate one and the middle 5
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores += np.where(
+                char_starts < beginning_section,
+                15.0 * (1 - char_starts / beginning_section),
+                np.where(
+                    char_starts > ending_section,
+                    10.0 * ((char_starts - ending_section) / (doc_length - ending_section)),
+                    5.0
+                )
+            )
+        
+        # Known location type bonus (up to +10)
+        scores += np.where(known_types, 10.0, 0.0)
+        
+        # Cap at 100
+        for location, score in zip(locations, scores.tolist()):
             location['relevance_score'] = min(round(score, 1), 100.0)
     
     def enhance_locations_with_context(self, locations: List[Dict[str, Any]], text: str) -> List[Dict[str, Any]]:
@@ -256,76 +456,157 @@ class LocationExtractor:
         Args:
             locations: List of location dictionaries.
             text: The original text.
-            
+        
         Returns:
             Enhanced location dictionaries.
         """
+        # Reuse the docs from extract_locations, dropping the reference either way
+        last_parse, self._last_parse = self._last_parse, None
+        
         if not locations:
             return []
         
-        doc = self.nlp(text)
+        parsed = last_parse[1] if last_parse is not None and last_parse[0] == text else self._parse(text)
+        return self._add_context(locations, [doc for _, doc in parsed])
+    
+    def _add_context(self, locations: List[Dict[str, Any]], docs: List[Doc]) -> List[Dict[str, Any]]:
+        """
+        Add context sentences and related locations using already processed documents.
         
-        for location in locations:
-            # Find mentions in text to extract context
-            location_name = location['name']
-            location_mentions = []
-            
-            for sent in doc.sents:
-                sent_text = sent.text.lower()
-                if location_name.lower() in sent_text:
-                    location_mentions.append(sent.text)
-            
-            # Add context information to location data
-            location['context_sentences'] = location_mentions[:3]  # Limit to 3 context sentences
+        Args:
+            locations: List of location dictionaries.
+            docs: The spaCy documents covering the original text, in order.
+        
+        Returns:
+            Enhanced location dictionaries.
+        """
+        # Lowercase each sentence and location name once rather than per pair
+        sentences = [(sent.text, sent.text.lower()) for doc in docs for sent in doc.sents]
+        name_index = _name_index(locations)
+        
+        # Find mentions in text to extract context, scanning each sentence once
+        context_sentences = _find_context_sentences(sentences, [name for _, name, _ in name_index])
+        
+        for location, (_, location_name, _) in zip(locations, name_index):
+            location['context_sentences'] = list(context_sentences[location_name])
             
             # Try to identify hierarchical relationships
-            location['related_locations'] = self._identify_related_locations(location, locations)
+            location['related_locations'] = self._identify_related_locations(location, locations, name_index)
         
         return locations
     
-    def _identify_related_locations(self, location: Dict[str, Any], all_locations: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    def _identify_related_locations(
+        self,
+        location: Dict[str, Any],
+        all_locations: List[Dict[str, Any]],
+        name_index: Optional[List[Tuple[Dict[str, Any], str, Optional[str]]]] = None
+    ) -> List[Dict[str, str]]:
         """
         Identify hierarchical relationships between locations.
         
         Args:
             location: The location to find relationships for.
             all_locations: All extracted locations.
-            
+            name_index: Precomputed `_name_index(all_locations)`, shared across calls.
+        
         Returns:
             List of related location dictionaries with relationship type.
         """
+        if name_index is None:
+            name_index = _name_index(all_locations)
+        
         related = []
         location_name = location['name'].lower()
+        location_parent = _parent_part(location_name)
         location_type = location['type']
         
-        for other in all_locations:
+        # Context sentences joined once; names never contain newlines, so a
+        # substring test on the joined text matches a test on each sentence
+        context = '\n'.join(location.get('context_sentences', [])).lower()
+        
+        for other, other_name, other_parent in name_index:
             if other['name'] == location['name']:
                 continue
-                
-            other_name = other['name'].lower()
+            
             other_type = other['type']
             
             # Check for comma-separated hierarchies like "Portland, Oregon"
-            if ',' in location_name and other_name in location_name.split(',')[1].strip():
+            if location_parent is not None and other_name in location_parent:
                 related.append({'name': other['name'], 'relationship': 'parent', 'type': other_type})
-            elif ',' in other_name and location_name in other_name.split(',')[1].strip():
+            elif other_parent is not None and location_name in other_parent:
                 related.append({'name': other['name'], 'relationship': 'child', 'type': other_type})
             
             # Check for state-city relationships
             if location_type == 'city' and other_type == 'state':
                 # For a city, see if state is mentioned in the same contexts
-                for sent in location.get('context_sentences', []):
-                    if other_name in sent.lower():
-                        related.append({'name': other['name'], 'relationship': 'parent', 'type': 'state'})
-                        break
+                if other_name in context:
+                    related.append({'name': other['name'], 'relationship': 'parent', 'type': 'state'})
             elif location_type == 'state' and other_type == 'city':
                 # For a state, see if cities are mentioned in the same contexts
-                for sent in location.get('context_sentences', []):
-                    if other_name in sent.lower():
-                        related.append({'name': other['name'], 'relationship': 'child', 'type': 'city'})
-                        break
+                if other_name in context:
+                    related.append({'name': other['name'], 'relationship': 'child', 'type': 'city'})
         
         return related
 
-# Create a default instance
-default_extractor = LocationExtractor()
+def _find_context_sentences(sentences: List[Tuple[str, str]], names: List[str]) -> Dict[str, List[str]]:
+    """
+    Collect the first sentences mentioning each name with one regex scan per sentence.
+    
+    Args:
+        sentences: (text, lowercased text) pairs in document order.
+        names: Lowercased location names.
+    
+    Returns:
+        Dictionary mapping each name to up to MAX_CONTEXT_SENTENCES sentence texts.
+    """
+    found: Dict[str, List[str]] = {name: [] for name in names}
+    searchable = sorted((name for name in found if name), key=len, reverse=True)
+    
+    # The lookahead reports the longest name starting at every position, so
+    # overlapping names are all found; names that are a prefix of the match
+    # start at the same position and are added from `prefixes`
+    pattern = re.compile('(?=(' + '|'.join(re.escape(name) for name in searchable) + '))') if searchable else None
+    prefixes = {name: [other for other in searchable if name.startswith(other)] for name in searchable}
+    
+    for text, lowered in sentences:
+        # An empty name occurs in every sentence
+        mentioned = {''} if '' in found else set()
+        if pattern is not None:
+            for match in pattern.finditer(lowered):
+                mentioned.update(prefixes[match.group(1)])
+        
+        for name in mentioned:
+            if len(found[name]) < MAX_CONTEXT_SENTENCES:
+                found[name].append(text)
+    
+    return found
+
+def _parent_part(name: str) -> Optional[str]:
+    """Get the part after the first comma of a name like "portland, oregon", if any."""
+    return name.split(',')[1].strip() if ',' in name else None
+
+def _name_index(locations: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], str, Optional[str]]]:
+    """Pair each location with its lowercased name and parent part, computed once."""
+    index = []
+    for location in locations:
+        name = location['name'].lower()
+        index.append((location, name, _parent_part(name)))
+    return index
+
+# The default instance is created on first access (PEP 562) so importing the
+# module doesn't load the spaCy model
+_default_extractor: Optional[LocationExtractor] = None
+_default_lock = threading.Lock()
+
+def __getattr__(name: str) -> Any:
+    if name == 'default_extractor':
+        global _default_extractor
+        with _default_lock:
+            if _default_extractor is None:
+                _default_extractor = LocationExtractor()
+        return _default_extractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Load the model at import time instead for long-running processes
+if os.environ.get('PLACE2POLYGON_PRELOAD') == '1':
+    __getattr__('default_extractor')
@@ -6,14 +6,16 @@ location boundaries, with appropriate styling and popups.
 """
 
 import os
-import json
 import tempfile
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Union, Tuple
 import logging
 
 import folium
 from folium.plugins import MarkerCluster
 
+from place2polygon.utils.geojson import trim_geojson
+from place2polygon.utils.json_io import WRITE_BUFFER_SIZE, stream_json_array
+
 logger = logging.getLogger(__name__)
 
 # Default map style configurations
@@ -88,7 +90,8 @@ class MapVisualizer:
         center: Optional[Tuple[float, float]] = None,
         zoom: Optional[int] = None,
         title: Optional[str] = None,
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        coord_precision: Optional[int] = None
     ) -> str:
         """
         Create an interactive map with polygons for location boundaries.
@@ -99,29 +102,52 @@ class MapVisualizer:
             zoom: Optional zoom level (overrides default_zoom).
             title: Optional map title.
             output_path: Optional path to save the map HTML.
+            coord_precision: Optional number of decimal places to round boundary
+                coordinates to. Default keeps full precision.
             
         Returns:
             Path to the saved map HTML file.
         """
-        # Determine map center and zoom
-        if not center and locations:
-            # Use the first location with coordinates as center
-            for location in locations:
-                if 'latitude' in location and 'longitude' in location:
-                    center = (location['latitude'], location['longitude'])
-                    break
-            
-            # Default center if none found
-            if not center:
-                # Center on continental US
-                center = (39.8283, -98.5795)
-        elif not center:
-            # Default center (continental US)
-            center = (39.8283, -98.5795)
+        return self.create_map_from_iterator(
+            locations,
+            center=center,
+            zoom=zoom,
+            title=title,
+            output_path=output_path,
+            coord_precision=coord_precision
+        )
+    
+    def create_map_from_iterator(
+        self,
+        locations: Iterable[Dict[str, Any]],
+        center: Optional[Tuple[float, float]] = None,
+        zoom: Optional[int] = None,
+        title: Optional[str] = None,
+        output_path: Optional[str] = None,
+        coord_precision: Optional[int] = None
+    ) -> str:
+        """
+        Create an interactive map, adding each location's layer as it is produced.
+        
+        The locations are consumed once, so a generator of enriched locations
+        can be passed directly without first building a list.
         
-        # Create the map
+        Args:
+            locations: Iterable of location dictionaries with boundaries.
+            center: Optional map center (latitude, longitude). Default uses
+                the first location with coordinates.
+            zoom: Optional zoom level (overrides default_zoom).
+            title: Optional map title.
+            output_path: Optional path to save the map HTML.
+            coord_precision: Optional number of decimal places to round boundary
+                coordinates to. Default keeps full precision.
+        
+        Returns:
+            Path to the saved map HTML file.
+        """
+        # Create the map, centered on the continental US until a location provides coordinates
         m = folium.Map(
-            location=center,
+            location=center or (39.8283, -98.5795),
             zoom_start=zoom or self.default_zoom,
             tiles='OpenStreetMap'
         )
@@ -136,10 +162,15 @@ class MapVisualizer:
         # Add locations to map
         has_polygons = False
         for location in locations:
+            # Use the first location with coordinates as center
+            if not center and 'latitude' in location and 'longitude' in location:
+                center = (location['latitude'], location['longitude'])
+                m.location = list(center)
+            
             # Check if the location has a boundary
             if 'boundary' in location and location['boundary']:
                 has_polygons = True
-                self._add_polygon(m, location)
+                self._add_polygon(m, location, coord_precision)
             elif all(key in location for key in ['latitude', 'longitude']):
                 # Fallback to point marker
                 self._add_marker(marker_cluster, location)
@@ -163,13 +194,19 @@ class MapVisualizer:
         
         return output_path
     
-    def _add_polygon(self, map_obj: folium.Map, location: Dict[str, Any]) -> None:
+    def _add_polygon(
+        self,
+        map_obj: folium.Map,
+        location: Dict[str, Any],
+        coord_precision: Optional[int] = None
+    ) -> None:
         """
         Add a polygon to the map.
         
         Args:
             map_obj: The folium Map object.
             location: Location dictionary with boundary data.
+            coord_precision: Optional number of decimal places to round coordinates to.
         """
         boundary = location['boundary']
         location_name = location.get('name', 'Unknown location')
@@ -193,7 +230,7 @@ class MapVisualizer:
                     'type': location_type,
                     **{k: v for k, v in location.items() if k not in ['boundary', 'polygon_geojson']}
                 },
-                'geometry': boundary
+                'geometry': boundary if coord_precision is None else trim_geojson(boundary, coord_precision)
             }
             
             # Create the popup content
@@ -310,7 +347,8 @@ class MapVisualizer:
     def export_to_geojson(
         self,
         locations: List[Dict[str, Any]],
-        output_path: str
+        output_path: str,
+        coord_precision: Optional[int] = None
     ) -> str:
         """
         Export location boundaries to a GeoJSON file.
@@ -318,19 +356,42 @@ class MapVisualizer:
         Args:
             locations: List of location dictionaries with boundaries.
             output_path: Path to save the GeoJSON file.
+            coord_precision: Optional number of decimal places to round boundary
+                coordinates to. Default keeps full precision.
             
         Returns:
             Path to the saved GeoJSON file.
         """
-        feature_collection = {
-            "type": "FeatureCollection",
-            "features": []
-        }
+        # Stream features to the file so only one is serialized at a time
+        with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(b'{\n  "type": "FeatureCollection",\n  "features": ')
+            stream_json_array(f, self._iter_geojson_features(locations, coord_precision), level=1)
+            f.write(b'\n}')
+        
+        logger.info(f"GeoJSON exported to {output_path}")
+        return output_path
+    
+    def _iter_geojson_features(
+        self,
+        locations: Iterable[Dict[str, Any]],
+        coord_precision: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Build GeoJSON features for locations with a boundary or coordinates.
         
+        Args:
+            locations: Location dictionaries.
+            coord_precision: Optional number of decimal places to round boundary coordinates to.
+        
+        Yields:
+            GeoJSON feature dictionaries.
+        """
         for location in locations:
             # Check if the location has a boundary
             if 'boundary' in location and location['boundary']:
                 boundary = location['boundary']
+                if coord_precision is not None:
+                    boundary = trim_geojson(boundary, coord_precision)
                 
                 # Create a GeoJSON feature
                 feature = {
@@ -349,7 +410,7 @@ class MapVisualizer:
                         if isinstance(value, (str, int, float, bool)) or value is None:
                             feature["properties"][key] = value
                 
-                feature_collection["features"].append(feature)
+                yield feature
             elif all(key in location for key in ['latitude', 'longitude']):
                 # Add point for locations without boundaries
                 lat = location['latitude']
@@ -376,14 +437,7 @@ class MapVisualizer:
                         if isinstance(value, (str, int, float, bool)) or value is None:
                             feature["properties"][key] = value
                 
-                feature_collection["features"].append(feature)
-        
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(feature_collection, f, indent=2)
-        
-        logger.info(f"GeoJSON exported to {output_path}")
-        return output_path
+                yield feature
 
 # Create a default instance
 default_visualizer = MapVisualizer()
@@ -8,9 +8,12 @@ rate limiting, proper HTTP headers, and error handling.
 import json
 import time
 import os
-from typing import Dict, List, Optional, Any, Union
+import atexit
+import threading
+from typing import Dict, Iterator, List, Optional, Any, Union
 import logging
 from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
 
@@ -19,6 +22,33 @@ from place2polygon.utils.validators import validate_nominatim_params, validate_l
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Keep-alive connections shared by all requests from one client
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=60)
+
+LOOKUP_BATCH_SIZE = 50  # Maximum OSM IDs Nominatim accepts per /lookup request
+
+def osm_ref(osm_type: Optional[str], osm_id: Any) -> Optional[str]:
+    """
+    Build the /lookup ID for an OSM object, e.g. ("relation", 237385) -> "R237385".
+    
+    Args:
+        osm_type: OSM object type ("node", "way" or "relation", or its initial).
+        osm_id: OSM object ID.
+    
+    Returns:
+        The lookup ID, or None if the type or ID is missing.
+    """
+    if not osm_type or osm_id is None:
+        return None
+    return f"{osm_type[0].upper()}{osm_id}"
+
 class NominatimClient:
     """
     Client for the OpenStreetMap Nominatim API.
@@ -43,6 +73,11 @@ class NominatimClient:
         self.referer = referer or os.environ.get("NOMINATIM_REFERER", "https://github.com/bubroz/place2polygon")
         self.timeout = timeout
         
+        # Long-lived HTTP client, created on first use and reused so requests
+        # share pooled TCP/TLS connections instead of a handshake per request
+        self._http_client: Optional[httpx.Client] = None
+        self._http_client_lock = threading.Lock()
+        
         # Verify user agent is set (required by Nominatim)
         if not self.user_agent:
             raise ValueError("User-Agent header is required for Nominatim API. Set NOMINATIM_USER_AGENT env var.")
@@ -116,6 +151,48 @@ class NominatimClient:
         
         return self._make_request("search", params)
     
+    def batch_search(
+        self,
+        queries: List[Dict[str, Any]],
+        max_workers: int = 4
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several searches and return their results in order.
+        
+        Nominatim has no bulk search endpoint, so the searches are issued from
+        a small thread pool. The shared rate limiter still spaces out the
+        requests themselves.
+        
+        Args:
+            queries: List of keyword argument dictionaries for `search`.
+            max_workers: Maximum number of searches in flight at once.
+            
+        Returns:
+            List of search results, one list per query.
+        """
+        return list(self.iter_search(queries, max_workers=max_workers))
+    
+    def iter_search(
+        self,
+        queries: List[Dict[str, Any]],
+        max_workers: int = 4
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Run several searches, yielding each query's results in order as soon as they arrive.
+        
+        Args:
+            queries: List of keyword argument dictionaries for `search`.
+            max_workers: Maximum number of searches in flight at once.
+        
+        Yields:
+            Search results, one list per query.
+        """
+        if not queries:
+            return
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(queries)))) as executor:
+            yield from executor.map(lambda query: self.search(**query), queries)
+    
     def lookup(
         self,
         osm_ids: List[str],
@@ -155,6 +232,25 @@ class NominatimClient:
         
         return self._make_request("lookup", params)
     
+    def batch_lookup(self, osm_ids: List[str], **kwargs) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up many OSM objects, sending LOOKUP_BATCH_SIZE IDs per request.
+        
+        Args:
+            osm_ids: List of OSM IDs (e.g., ["N123456", "W123456", "R123456"]).
+            **kwargs: Additional parameters to pass to `lookup`.
+        
+        Returns:
+            Dictionary mapping each OSM ID found to its lookup result.
+        """
+        results = {}
+        for i in range(0, len(osm_ids), LOOKUP_BATCH_SIZE):
+            for result in self.lookup(osm_ids[i:i + LOOKUP_BATCH_SIZE], **kwargs):
+                ref = osm_ref(result.get('osm_type'), result.get('osm_id'))
+                if ref:
+                    results[ref] = result
+        return results
+    
     def reverse(
         self,
         lat: float,
@@ -223,7 +319,7 @@ class NominatimClient:
         }
         
         # Apply rate limiting
-        logger.debug(f"Making request to Nominatim API: {url}")
+        logger.debug("Making request to Nominatim API: %s", url)
         
         try:
             # Execute with rate limiting and retry
@@ -250,6 +346,25 @@ class NominatimClient:
             logger.error(f"Error making request to Nominatim API: {str(e)}")
             return []
     
+    def _get_http_client(self) -> httpx.Client:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._http_client is None:
+            with self._http_client_lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=HTTP_LIMITS,
+                        http2=HTTP2_AVAILABLE
+                    )
+        return self._http_client
+    
+    def close(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        with self._http_client_lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+    
     def _perform_request(self, url: str, headers: Dict[str, str]) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Perform the actual HTTP request.
@@ -265,15 +380,14 @@ class NominatimClient:
             Exception: If the request fails.
         """
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, headers=headers)
-                
-                # Check if the request was successful
-                response.raise_for_status()
-                
-                # Parse the response as JSON
-                return response.json()
-                
+            response = self._get_http_client().get(url, headers=headers)
+            
+            # Check if the request was successful
+            response.raise_for_status()
+            
+            # Parse the response as JSON
+            return response.json()
+            
         except httpx.RequestError as e:
             logger.error(f"Request error: {str(e)}")
             raise
@@ -293,3 +407,4 @@ class NominatimClient:
 
 # Create a default client instance
 default_client = NominatimClient()
+atexit.register(default_client.close)
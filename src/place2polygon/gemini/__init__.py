@@ -5,12 +5,30 @@ These modules provide integration with Google's Gemini Flash 2.0 for
 orchestrating intelligent multi-stage polygon searches.
 """
 
-from place2polygon.gemini.documentation_provider import NominatimDocsProvider, default_provider
-from place2polygon.gemini.orchestrator import GeminiOrchestrator, default_orchestrator
+import importlib
+from typing import Any
+
+from place2polygon.gemini.credentials import setup_google_credentials
 
 __all__ = [
     'NominatimDocsProvider',
     'default_provider',
     'GeminiOrchestrator',
     'default_orchestrator',
+    'setup_google_credentials',
 ]
+
+# Submodule defining each public name; they are imported on first access so
+# that the Gemini SDK is only loaded by code that uses it
+_SUBMODULES = {
+    'NominatimDocsProvider': 'documentation_provider',
+    'default_provider': 'documentation_provider',
+    'GeminiOrchestrator': 'orchestrator',
+    'default_orchestrator': 'orchestrator',
+}
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{_SUBMODULES[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
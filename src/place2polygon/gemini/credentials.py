@@ -0,0 +1,80 @@
+"""
+Credential setup for the Gemini API.
+
+This module stores the Google API key used by the Gemini orchestrator in the
+process environment and, optionally, in a .env file.
+"""
+
+import os
+import re
+import logging
+import tempfile
+from pathlib import Path
+from typing import Union
+
+logger = logging.getLogger(__name__)
+
+API_KEY_VAR = "GOOGLE_API_KEY"
+
+_API_KEY_LINE = re.compile(rf"^\s*(?:export\s+)?{API_KEY_VAR}\s*=")
+
+def setup_google_credentials(api_key: str, save: bool = False, env_path: Union[str, Path] = ".env") -> None:
+    """
+    Make a Google API key available to the Gemini orchestrator.
+    
+    Args:
+        api_key: Google API key.
+        save: Whether to also store the key in the .env file.
+        env_path: Path of the .env file to update.
+    
+    Raises:
+        ValueError: If the API key is empty.
+    """
+    api_key = api_key.strip()
+    if not api_key:
+        raise ValueError("Google API key must not be empty")
+    
+    os.environ[API_KEY_VAR] = api_key
+    
+    if save:
+        _save_api_key(api_key, Path(env_path))
+        logger.info(f"Saved {API_KEY_VAR} to {env_path}")
+
+def _save_api_key(api_key: str, env_path: Path) -> None:
+    """
+    Set the API key line in a .env file, keeping every other line.
+    
+    The file is written to a temporary file in the same directory and then
+    moved into place, so a crash never leaves a partially written .env.
+    
+    Args:
+        api_key: Google API key.
+        env_path: Path of the .env file to update.
+    """
+    key_line = f"{API_KEY_VAR}={api_key}\n"
+    
+    lines = env_path.read_text(encoding="utf-8").splitlines(keepends=True) if env_path.exists() else []
+    
+    # Replace an existing key in place, otherwise append it
+    matches = [i for i, line in enumerate(lines) if _API_KEY_LINE.match(line)]
+    if matches:
+        lines[matches[0]] = key_line
+        for i in reversed(matches[1:]):
+            del lines[i]
+    else:
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+        lines.append(key_line)
+    
+    # The temporary file is created readable only by the user, like a .env should be
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=env_path.parent, prefix=".env.", delete=False) as tmp:
+        try:
+            tmp.writelines(lines)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    
+    os.replace(tmp.name, env_path)
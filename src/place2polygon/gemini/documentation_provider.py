@@ -6,13 +6,14 @@ information about API parameters, options, and best practices.
 """
 
 import os
-import json
 from typing import Dict, List, Optional, Any, Union
 import logging
 import httpx
 import re
 from pathlib import Path
 
+from place2polygon.utils.json_io import read_json, write_json
+
 logger = logging.getLogger(__name__)
 
 # Base URL for Nominatim documentation
@@ -54,10 +55,9 @@ class NominatimDocsProvider:
     def _load_cache(self) -> None:
         """Load documentation from cache."""
         try:
-            with open(self.cache_path, 'r', encoding='utf-8') as f:
-                self.docs_cache = json.load(f)
+            self.docs_cache = read_json(self.cache_path)
             logger.info(f"Loaded Nominatim documentation from cache: {self.cache_path}")
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
             logger.error(f"Error loading documentation cache: {str(e)}")
             self.docs_cache = {}
     
@@ -68,8 +68,7 @@ class NominatimDocsProvider:
             if cache_dir and not os.path.exists(cache_dir):
                 os.makedirs(cache_dir)
                 
-            with open(self.cache_path, 'w', encoding='utf-8') as f:
-                json.dump(self.docs_cache, f, indent=2)
+            write_json(self.cache_path, self.docs_cache)
             logger.info(f"Saved Nominatim documentation to cache: {self.cache_path}")
         except IOError as e:
             logger.error(f"Error saving documentation cache: {str(e)}")
@@ -5,13 +5,19 @@ This package provides utility functions and classes for the Place2Polygon tool.
 """
 
 from place2polygon.utils.validators import validate_location_name
-from place2polygon.utils.rate_limiter import RateLimiter, default_limiter
+from place2polygon.utils.rate_limiter import RateLimiter, nominatim_limiter
 from place2polygon.utils.output_manager import OutputManager, default_output_manager
+from place2polygon.utils.json_io import read_json, write_json
+from place2polygon.utils.geojson import COORD_PRECISION, trim_geojson
 
 __all__ = [
     'validate_location_name',
     'RateLimiter',
-    'default_limiter',
+    'nominatim_limiter',
     'OutputManager',
-    'default_output_manager'
+    'default_output_manager',
+    'read_json',
+    'write_json',
+    'COORD_PRECISION',
+    'trim_geojson'
 ]
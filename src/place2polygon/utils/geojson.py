@@ -0,0 +1,41 @@
+"""
+GeoJSON helpers for Place2Polygon.
+
+This module trims the coordinate precision of GeoJSON geometries before
+they are cached or written out.
+"""
+
+from typing import Any, Dict, List
+
+COORD_PRECISION = 5  # Decimal places kept in cached and mapped geometries (about 1 m)
+
+def _round_coordinates(coordinates: List[Any], decimals: int) -> List[Any]:
+    """Round a (possibly nested) GeoJSON coordinate array."""
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        return [round(value, decimals) for value in coordinates]
+    return [_round_coordinates(part, decimals) for part in coordinates]
+
+def trim_geojson(geojson: Dict[str, Any], decimals: int) -> Dict[str, Any]:
+    """
+    Round the coordinates of a GeoJSON geometry to a fixed number of decimal places.
+    
+    Nominatim returns seven or more decimals (millimetre precision); five
+    decimals (about 1 m) roughly halve the size of a cached boundary or a
+    generated map without any visible difference.
+    
+    Args:
+        geojson: GeoJSON geometry.
+        decimals: Number of decimal places to keep.
+    
+    Returns:
+        A copy of the geometry with rounded coordinates.
+    """
+    if not isinstance(geojson, dict):
+        return geojson
+    
+    trimmed = dict(geojson)
+    if isinstance(geojson.get('coordinates'), list):
+        trimmed['coordinates'] = _round_coordinates(geojson['coordinates'], decimals)
+    if isinstance(geojson.get('geometries'), list):
+        trimmed['geometries'] = [trim_geojson(geometry, decimals) for geometry in geojson['geometries']]
+    return trimmed
@@ -0,0 +1,81 @@
+"""
+JSON output helpers for Place2Polygon.
+
+This module reads and writes JSON files through single large reads and
+buffered writes, using orjson when it is installed. Arrays are serialized one item at a time so
+peak memory stays proportional to a single record rather than the whole file.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Union
+
+# orjson serializes large GeoJSON structures far faster than json; fall back to json
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    
+    _loads = json.loads
+
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MB instead of the default 8 KB
+
+def stream_json_array(f: BinaryIO, items: Iterable[Any], level: int = 0) -> None:
+    """
+    Write an indented JSON array to a binary file one item at a time.
+    
+    Args:
+        f: Binary file object to write to.
+        items: Items to serialize.
+        level: Nesting level of the array, used to indent its items.
+    """
+    indent = b'\n' + b'  ' * (level + 1)
+    
+    f.write(b'[')
+    first = True
+    for item in items:
+        if not first:
+            f.write(b',')
+        first = False
+        f.write(indent)
+        f.write(_dumps(item).replace(b'\n', indent))
+    
+    f.write(b']' if first else b'\n' + b'  ' * level + b']')
+
+def write_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Write data to a file as indented JSON.
+    
+    Args:
+        path: Output file path.
+        data: Data to serialize. Lists are streamed one item at a time.
+    """
+    with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        if isinstance(data, list):
+            stream_json_array(f, data)
+        else:
+            f.write(_dumps(data))
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Read a JSON file with a single read.
+    
+    Args:
+        path: Input file path.
+    
+    Returns:
+        The parsed data.
+    
+    Raises:
+        ValueError: If the file is not valid JSON.
+    """
+    return _loads(Path(path).read_bytes())
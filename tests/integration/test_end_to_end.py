@@ -44,22 +44,17 @@ class TestEndToEnd:
             assert "type" in location
             assert "relevance_score" in location
     
-    @patch("place2polygon.core.location_extractor.LocationExtractor.extract_locations")
-    @patch("place2polygon.core.location_extractor.LocationExtractor.enhance_locations_with_context")
-    def test_extract_locations(self, mock_enhance, mock_extract, sample_text, sample_locations):
+    @patch("place2polygon.core.location_extractor.LocationExtractor.extract_and_enhance")
+    def test_extract_locations(self, mock_extract, sample_text, sample_locations):
         """Test the location extraction step."""
         # Mock the extractor
         mock_extract.return_value = sample_locations
-        mock_enhance.return_value = sample_locations
         
         # Run the extraction
         locations = extract_locations(sample_text)
         
-        # Verify extraction was performed
-        mock_extract.assert_called_once_with(sample_text)
-        
-        # Verify enhancement was performed when locations are found
-        mock_enhance.assert_called_once()
+        # Verify extraction and enhancement were performed in one pass
+        mock_extract.assert_called_once_with(sample_text, min_relevance_score=30.0)
         
         # Verify we get the expected locations
         assert locations == sample_locations
@@ -141,7 +136,7 @@ class TestEndToEnd:
                 mock_find_polygons.reset_mock()
                 
                 # Test with Gemini disabled
-                with patch("place2polygon.find_polygon_boundaries") as mock_find_boundaries:
+                with patch("place2polygon.iter_polygon_boundaries") as mock_find_boundaries:
                     extract_and_map_locations(
                         text=sample_text,
                         output_path=temp_html_path,
@@ -0,0 +1,200 @@
+"""
+Unit tests for the package-level boundary search functions.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import MagicMock
+
+from place2polygon import find_polygon_boundaries, find_polygons_with_gemini, iter_polygon_boundaries
+from place2polygon.cache.cache_manager import CacheManager
+from place2polygon.core.boundary_selector import BoundarySelector
+from place2polygon.core.nominatim_client import LOOKUP_BATCH_SIZE, NominatimClient
+
+
+@pytest.fixture
+def manager(temp_db_path) -> CacheManager:
+    """CacheManager backed by a temporary database."""
+    return CacheManager(db_path=temp_db_path)
+
+
+@pytest.fixture
+def seattle() -> dict:
+    """A single extracted location."""
+    return {"name": "Seattle", "type": "city", "relevance_score": 75.5}
+
+
+@pytest.fixture
+def client(mock_nominatim_client, sample_nominatim_result) -> MagicMock:
+    """Stub NominatimClient whose searches all return the sample result."""
+    mock_nominatim_client.iter_search.side_effect = lambda queries, max_workers=None: (
+        [sample_nominatim_result] for _ in queries
+    )
+    return mock_nominatim_client
+
+
+@pytest.fixture
+def orchestrator(client, sample_nominatim_result) -> MagicMock:
+    """Stub GeminiOrchestrator returning the sample Nominatim result."""
+    orchestrator = MagicMock()
+    orchestrator.nominatim_client = client
+    orchestrator.orchestrate_search.return_value = sample_nominatim_result
+    return orchestrator
+
+
+class TestSharedCache:
+    """Tests running the basic and Gemini searches against one cache."""
+    
+    def test_basic_then_gemini(self, manager, seattle, client, orchestrator, sample_nominatim_result):
+        """Test that a Gemini run is not served the basic search's cache entry."""
+        basic = find_polygon_boundaries([seattle], client=client,
+                                        cache_manager=manager, selector=BoundarySelector())
+        gemini = find_polygons_with_gemini([seattle], orchestrator=orchestrator, cache_manager=manager)
+        
+        assert basic[0]["boundary"] == sample_nominatim_result["geojson"]
+        assert gemini[0]["boundary"] == sample_nominatim_result["geojson"]
+        assert gemini[0]["type"] == "city"
+    
+    def test_gemini_then_basic(self, manager, seattle, client, orchestrator, sample_nominatim_result):
+        """Test that a basic run is not served the Gemini search's cache entry."""
+        find_polygons_with_gemini([seattle], orchestrator=orchestrator, cache_manager=manager)
+        basic = find_polygon_boundaries([seattle], client=client,
+                                        cache_manager=manager, selector=BoundarySelector())
+        
+        assert basic[0]["type"] == "city"
+        assert basic[0]["boundary"] == sample_nominatim_result["geojson"]
+        assert basic[0]["display_name"] == sample_nominatim_result["display_name"]
+    
+    def test_gemini_after_basic_fallback(self, manager, seattle, orchestrator, sample_nominatim_result):
+        """Test that the basic fallback's cache entry is not read back as a Gemini boundary."""
+        orchestrator.orchestrate_search.return_value = None
+        fallback = find_polygons_with_gemini([seattle], orchestrator=orchestrator, cache_manager=manager)
+        
+        orchestrator.orchestrate_search.return_value = sample_nominatim_result
+        gemini = find_polygons_with_gemini([seattle], orchestrator=orchestrator, cache_manager=manager)
+        
+        assert fallback[0]["boundary"] == sample_nominatim_result["geojson"]
+        assert gemini[0]["boundary"] == sample_nominatim_result["geojson"]
+
+
+class TestKnownBoundaries:
+    """Tests for re-fetching previously resolved locations by OSM ID."""
+    
+    def test_osm_ref_is_cached(self, manager, seattle, client):
+        """Test that resolving a boundary caches the OSM object it came from."""
+        find_polygon_boundaries([seattle], client=client, cache_manager=manager, selector=BoundarySelector())
+        
+        assert manager.get(manager.osm_ref_key("Seattle", "city")) == "R237385"
+    
+    def test_known_location_is_looked_up(self, manager, seattle, client, sample_nominatim_result):
+        """Test that a location with a cached OSM reference is fetched by /lookup instead of searched."""
+        manager.set(manager.osm_ref_key("Seattle", "city"), "R237385")
+        client.batch_lookup.return_value = {"R237385": sample_nominatim_result}
+        
+        result = find_polygon_boundaries([seattle], client=client, cache_manager=manager, selector=BoundarySelector())
+        
+        client.batch_lookup.assert_called_once_with(["R237385"], extratags=1)
+        assert client.iter_search.call_args.args[0] == []
+        assert result[0]["boundary"] == sample_nominatim_result["geojson"]
+        assert manager.get(manager.boundary_key("Seattle", "city"))["osm_id"] == 237385
+    
+    def test_lookup_failure_falls_back_to_search(self, manager, seattle, client, sample_nominatim_result):
+        """Test that a failed /lookup request falls back to searching for the location."""
+        manager.set(manager.osm_ref_key("Seattle", "city"), "R237385")
+        client.batch_lookup.side_effect = RuntimeError("lookup failed")
+        
+        result = find_polygon_boundaries([seattle], client=client, cache_manager=manager, selector=BoundarySelector())
+        
+        assert [query["query"] for query in client.iter_search.call_args.args[0]] == ["Seattle"]
+        assert result[0]["boundary"] == sample_nominatim_result["geojson"]
+    
+    def test_batch_lookup_is_chunked(self):
+        """Test that batch_lookup sends at most LOOKUP_BATCH_SIZE IDs per request."""
+        client = NominatimClient()
+        client.lookup = MagicMock(side_effect=lambda osm_ids, **kwargs: [
+            {"osm_type": "node", "osm_id": int(osm_id[1:])} for osm_id in osm_ids
+        ])
+        osm_ids = [f"N{i}" for i in range(2 * LOOKUP_BATCH_SIZE + 20)]
+        
+        results = client.batch_lookup(osm_ids, extratags=1)
+        
+        assert [len(call.args[0]) for call in client.lookup.call_args_list] == [LOOKUP_BATCH_SIZE, LOOKUP_BATCH_SIZE, 20]
+        assert all(call.kwargs == {"extratags": 1} for call in client.lookup.call_args_list)
+        assert sorted(results) == sorted(osm_ids)
+        assert results["N7"]["osm_id"] == 7
+
+
+class TestStaleRefresh:
+    """Tests for serving stale boundaries while they are refreshed."""
+    
+    def test_stale_hit_is_yielded_then_refreshed(self, manager, seattle, client, sample_nominatim_result):
+        """Test that a stale boundary is yielded right away and the refreshed one is cached."""
+        key = manager.boundary_key("Seattle", "city")
+        manager.set(key, {"boundary": {"type": "Point", "coordinates": [0, 0]}}, ttl=-1)
+        
+        # Hold the refresh until the stale boundary has been yielded
+        release = threading.Event()
+        client.search.side_effect = lambda **kwargs: release.wait(5) and [sample_nominatim_result]
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = iter_polygon_boundaries([seattle], client=client, cache_manager=manager,
+                                              selector=BoundarySelector(), max_stale_days=2,
+                                              refresh_executor=executor)
+            first = next(results)
+            assert first["boundary"] == {"type": "Point", "coordinates": [0, 0]}
+            assert manager.get(key) is None
+            release.set()
+        
+        assert client.search.call_count == 1
+        assert manager.get(key)["boundary"] == sample_nominatim_result["geojson"]
+
+
+class TestGeminiSearch:
+    """Tests for merging Gemini search results into the locations."""
+    
+    def test_repeated_mentions_share_one_search(self, manager, seattle, orchestrator, sample_nominatim_result):
+        """Test that every mention of a place gets the boundary found by a single search."""
+        mentions = [seattle, {"name": "seattle ", "type": "city", "relevance_score": 10.0}]
+        
+        results = find_polygons_with_gemini(mentions, orchestrator=orchestrator, cache_manager=manager)
+        
+        assert orchestrator.orchestrate_search.call_count == 1
+        assert [result["boundary"] for result in results] == [sample_nominatim_result["geojson"]] * 2
+        assert [result["boundary_source"] for result in results] == ["gemini", "gemini"]
+        assert results[1]["relevance_score"] == 10.0
+    
+    def test_input_locations_are_not_modified(self, manager, seattle, orchestrator):
+        """Test that the caller's location dicts are left unchanged."""
+        mentions = [seattle, dict(seattle), {"name": "Tacoma", "type": "city"}]
+        before = [dict(location) for location in mentions]
+        
+        find_polygons_with_gemini(mentions, orchestrator=orchestrator, cache_manager=manager)
+        
+        assert mentions == before
+    
+    def test_nearby_locations_exclude_the_place(self, manager, seattle, orchestrator):
+        """Test that each search's context lists the other distinct places."""
+        mentions = [seattle, dict(seattle), {"name": "Tacoma", "type": "city"}]
+        
+        find_polygons_with_gemini(mentions, orchestrator=orchestrator, cache_manager=manager, concurrency=1)
+        
+        contexts = [call.kwargs["location_context"]["nearby_locations"]
+                    for call in orchestrator.orchestrate_search.call_args_list]
+        assert contexts == [["Tacoma"], ["Seattle"]]
+
+
+class TestCoordinatePrecision:
+    """Tests for rounding boundaries before they are cached."""
+    
+    def test_cached_boundary_is_rounded(self, manager, seattle, client, sample_nominatim_result):
+        """Test that the selected boundary is cached and returned with COORD_PRECISION decimals."""
+        sample_nominatim_result["geojson"]["coordinates"][0][0] = [-122.41234567, 47.51234567]
+        
+        result = find_polygon_boundaries([seattle], client=client,
+                                         cache_manager=manager, selector=BoundarySelector())
+        cached = manager.get(manager.boundary_key("Seattle", "city"))
+        
+        assert result[0]["boundary"]["coordinates"][0][0] == [-122.41235, 47.51235]
+        assert cached["boundary"] == result[0]["boundary"]
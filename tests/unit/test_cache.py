@@ -178,6 +178,18 @@ class TestSQLiteCache:
         assert "total_size_bytes" in stats
         assert "hit_count" in stats
         assert "miss_count" in stats
+    
+    def test_recorded_hits_and_misses_are_flushed(self, temp_cache):
+        """Test that hit/miss counters held in memory show up in the statistics."""
+        temp_cache.record_hit()
+        temp_cache.record_hit()
+        temp_cache.record_miss()
+        
+        stats = temp_cache.get_stats()
+        
+        assert stats["hit_count"] == 2
+        assert stats["miss_count"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
 
 
 class TestCacheManager:
@@ -287,4 +299,81 @@ class TestCacheManager:
         stats = temp_cache_manager.get_cache_stats()
         
         assert "total_entries" in stats
-        assert stats["total_entries"] >= 2 
\ No newline at end of file
+        assert stats["total_entries"] >= 2 
+    
+    def test_get_or_compute_coalesces_concurrent_calls(self, temp_db_path):
+        """Test that concurrent lookups for the same key compute the value once."""
+        import threading
+        
+        manager = CacheManager(db_path=temp_db_path)
+        call_count = 0
+        started = threading.Event()
+        
+        def compute():
+            nonlocal call_count
+            call_count += 1
+            started.set()
+            time.sleep(0.2)
+            return {"name": "Alabama", "type": "state"}
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(manager.get_or_compute("alabama", compute)))
+            for _ in range(3)
+        ]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert call_count == 1
+        assert results == [{"name": "Alabama", "type": "state"}] * 3
+        
+        # Later calls are served from the cache
+        assert manager.get_or_compute("alabama", compute) == {"name": "Alabama", "type": "state"}
+        assert call_count == 1
+    
+    def test_skip_cache_bypasses_reads(self, temp_db_path):
+        """Test that lookups inside skip_cache() recompute and refresh the cached value."""
+        manager = CacheManager(db_path=temp_db_path)
+        manager.set("seattle", {"version": 1})
+        
+        with manager.skip_cache():
+            assert manager.get("seattle") is None
+            assert manager.get_or_compute("seattle", lambda: {"version": 2}) == {"version": 2}
+        
+        assert manager.get("seattle") == {"version": 2}
+    
+    def test_get_many(self, temp_db_path):
+        """Test fetching several keys in one call."""
+        manager = CacheManager(db_path=temp_db_path, hot_cache_size=0)
+        manager.set("seattle", {"name": "Seattle"})
+        manager.set("portland", {"name": "Portland"})
+        manager.set("expired", {"name": "Expired"}, ttl=-1)
+        
+        result = manager.get_many(["seattle", "portland", "expired", "missing"])
+        
+        assert result == {"seattle": {"name": "Seattle"}, "portland": {"name": "Portland"}}
+    
+    def test_get_keys_by_prefix(self, temp_db_path):
+        """Test listing keys that start with a prefix."""
+        manager = CacheManager(db_path=temp_db_path)
+        boundary_key = manager.boundary_key("Seattle", "city")
+        manager.set(boundary_key, {"name": "Seattle"})
+        manager.set("boundarz", {"name": "Other"})
+        
+        assert manager.get_keys(prefix="boundary_") == [boundary_key]
+    
+    def test_get_stale_returns_expired_items(self, temp_db_path):
+        """Test that expired items are still available as stale within the allowed window."""
+        manager = CacheManager(db_path=temp_db_path, hot_cache_size=0)
+        manager.set("fresh", {"name": "Fresh"})
+        manager.set("stale", {"name": "Stale"}, ttl=-0.5)
+        
+        assert manager.get("stale") is None
+        assert manager.get_stale("fresh") == ({"name": "Fresh"}, False)
+        assert manager.get_stale("stale", max_stale_days=1) == ({"name": "Stale"}, True)
+        assert manager.get_stale("stale", max_stale_days=0.1) == (None, False)
+        assert manager.get_stale("missing") == (None, False)
@@ -5,8 +5,24 @@ Unit tests for the LocationExtractor class.
 import pytest
 from unittest.mock import patch, MagicMock
 import spacy
+from spacy.tokens import Span
 
-from place2polygon.core.location_extractor import LocationExtractor
+from place2polygon.core.location_extractor import (
+    CHUNK_CHARS,
+    MAX_CONTEXT_SENTENCES,
+    LocationExtractor,
+    _chunk_text,
+    _find_context_sentences,
+    _load_nlp,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_nlp_cache():
+    """Drop models cached by earlier tests so each test sees its own spacy.load patch."""
+    _load_nlp.cache_clear()
+    yield
+    _load_nlp.cache_clear()
 
 
 @pytest.fixture
@@ -45,6 +61,99 @@ def mock_nlp():
     return mock
 
 
+@pytest.fixture
+def ruler_nlp():
+    """Blank English pipeline that tags a few place names as GPE entities."""
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "GPE", "pattern": "Seattle"},
+        {"label": "GPE", "pattern": "Portland"},
+    ])
+    return nlp
+
+
+class TestChunkText:
+    """Tests for splitting long texts into paragraph-aligned chunks."""
+    
+    def test_offsets_map_back_to_text(self):
+        """Test that every chunk is found at its offset and fits the target."""
+        text = "\n\n".join(f"Paragraph {i} " + "x" * 30 for i in range(20))
+        
+        chunks = _chunk_text(text, target=100)
+        
+        assert len(chunks) > 1
+        for offset, chunk in chunks:
+            assert text[offset:offset + len(chunk)] == chunk
+            assert len(chunk) <= 100
+        assert "\n\n".join(chunk for _, chunk in chunks) == text
+    
+    def test_paragraph_longer_than_target(self):
+        """Test that a paragraph longer than the target becomes a chunk of its own."""
+        long_paragraph = "y" * 250
+        text = f"short\n\n{long_paragraph}\n\nend"
+        
+        chunks = _chunk_text(text, target=100)
+        
+        assert chunks == [(0, "short"), (7, long_paragraph), (259, "end")]
+    
+    def test_text_without_paragraph_breaks(self):
+        """Test that text with no blank lines is kept as a single chunk."""
+        text = "z" * 250
+        
+        assert _chunk_text(text, target=100) == [(0, text)]
+
+
+def _sentences(*texts):
+    """Build the (text, lowercased text) pairs taken by _find_context_sentences."""
+    return [(text, text.lower()) for text in texts]
+
+
+class TestFindContextSentences:
+    """Tests for collecting the sentences that mention each location."""
+    
+    def test_overlapping_names(self):
+        """Test that a name inside a longer name is found in the same sentence."""
+        sentences = _sentences("I moved to New York last year.", "York is older.")
+        
+        found = _find_context_sentences(sentences, ["york", "new york"])
+        
+        assert found["new york"] == ["I moved to New York last year."]
+        assert found["york"] == ["I moved to New York last year.", "York is older."]
+    
+    def test_names_that_are_prefixes(self):
+        """Test that a name that is a prefix of another starts at the same position."""
+        sentences = _sentences("Portland is rainy.", "The port is busy.")
+        
+        found = _find_context_sentences(sentences, ["portland", "port"])
+        
+        assert found["portland"] == ["Portland is rainy."]
+        assert found["port"] == ["Portland is rainy.", "The port is busy."]
+    
+    def test_regex_metacharacters(self):
+        """Test that names are matched literally."""
+        sentences = _sentences("St. Louis is on the river.", "Stx Louis is not a city.", "Visit (Old) Town+.")
+        
+        found = _find_context_sentences(sentences, ["st. louis", "(old) town+"])
+        
+        assert found["st. louis"] == ["St. Louis is on the river."]
+        assert found["(old) town+"] == ["Visit (Old) Town+."]
+    
+    def test_sentence_cap(self):
+        """Test that at most MAX_CONTEXT_SENTENCES sentences are kept, in order."""
+        texts = [f"Seattle sentence {i}." for i in range(MAX_CONTEXT_SENTENCES + 2)]
+        
+        found = _find_context_sentences(_sentences(*texts), ["seattle"])
+        
+        assert found["seattle"] == texts[:MAX_CONTEXT_SENTENCES]
+    
+    def test_unmentioned_name(self):
+        """Test that a name that never occurs gets an empty list."""
+        found = _find_context_sentences(_sentences("Seattle is rainy."), ["seattle", "tacoma"])
+        
+        assert found == {"seattle": ["Seattle is rainy."], "tacoma": []}
+
+
 class TestLocationExtractor:
     """Tests for the LocationExtractor class."""
     
@@ -148,6 +257,31 @@ class TestLocationExtractor:
             doc = mock_nlp("King County is located in Washington.")
             assert extractor._determine_location_type(entity, doc) == "county"
     
+    @pytest.mark.parametrize("text, start, end, expected", [
+        # "X County" and "County of X"
+        ("King County is located in Washington.", 0, 1, "county"),
+        ("The County of Los Angeles is large.", 3, 5, "county"),
+        # Names with regex metacharacters are matched literally
+        ("St. Louis County borders the city.", 0, 2, "county"),
+        # Overlapping indicators: "mountain" also contains "mount"
+        ("Hood mountain is tall.", 0, 1, "mountain"),
+        # When several types match, the one listed first in LOCATION_TYPE_INDICATORS wins
+        ("The city of Lincoln is in Lincoln County.", 3, 4, "city"),
+        # An indicator that is not next to the name is ignored
+        ("Springfield has a county fair.", 0, 1, "city"),
+        # US states are recognized by name before any context is checked
+        ("Washington county roads are wet.", 0, 1, "state"),
+    ])
+    def test_determine_location_type_indicators(self, text, start, end, expected):
+        """Test location types derived from indicator words around the entity."""
+        with patch("place2polygon.core.location_extractor.spacy.load", return_value=MagicMock()):
+            extractor = LocationExtractor()
+        
+        doc = spacy.blank("en")(text)
+        entity = Span(doc, start, end, label="GPE")
+        
+        assert extractor._determine_location_type(entity, doc) == expected
+    
     def test_enhance_locations_with_context(self, mock_nlp):
         """Test enhancing locations with context."""
         with patch("place2polygon.core.location_extractor.spacy.load", return_value=mock_nlp):
@@ -202,4 +336,22 @@ class TestLocationExtractor:
             # Verify scores exist and Seattle has higher relevance
             assert "relevance_score" in locations[0]
             assert "relevance_score" in locations[1]
-            assert locations[0]["relevance_score"] > locations[1]["relevance_score"] 
\ No newline at end of file
+            assert locations[0]["relevance_score"] > locations[1]["relevance_score"]
+    
+    def test_char_offsets_span_chunks(self, ruler_nlp):
+        """Test that entity offsets in a multi-chunk text point into the original text."""
+        filler = "\n\n".join("Nothing much happens in this paragraph. " * 20 for _ in range(140))
+        text = f"Seattle is rainy.\n\n{filler}\n\nWe then drove to Portland."
+        assert len(text) > CHUNK_CHARS
+        
+        with patch("place2polygon.core.location_extractor.spacy.load", return_value=ruler_nlp):
+            extractor = LocationExtractor()
+            
+            assert len(extractor._parse(text)) > 1
+            locations = extractor.extract_locations(text, min_relevance_score=0)
+        
+        assert {loc["name"] for loc in locations} == {"Seattle", "Portland"}
+        for location in locations:
+            assert text[location["char_start"]:location["char_end"]] == location["original_name"]
+        portland = next(loc for loc in locations if loc["name"] == "Portland")
+        assert portland["char_start"] > CHUNK_CHARS